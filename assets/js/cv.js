@@ -202,7 +202,14 @@
     
                     if(count === 0) {
                         $leet.run();
-                        $dom.select('#photo').nativeElement.src = "img/unicorn.png";
+                        var photo = $dom.select('#photo').nativeElement;
+                        if(photo.parentNode.tagName === 'PICTURE') {
+                            Array.prototype.forEach.call(photo.parentNode.querySelectorAll('source'), function(source) {
+                                source.parentNode.removeChild(source);
+                            });
+                        }
+                        photo.removeAttribute('srcset');
+                        photo.src = "img/unicorn.png";
                     }
                     else {
                         $nyan.run();
@@ -268,8 +275,20 @@
                         var lazySrc = item.attribute('data-src');
 
                         if(lazySrc !== null) {
-                            item.nativeElement.removeAttribute('data-src');
-                            item.nativeElement.setAttribute('src', lazySrc);
+                            var img = item.nativeElement;
+                            var lazyElements = img.parentNode.tagName === 'PICTURE' ?
+                                img.parentNode.querySelectorAll('[data-srcset]') : [img];
+
+                            Array.prototype.forEach.call(lazyElements, function(element) {
+                                var lazySrcset = element.getAttribute('data-srcset');
+                                if(lazySrcset !== null) {
+                                    element.removeAttribute('data-srcset');
+                                    element.setAttribute('srcset', lazySrcset);
+                                }
+                            });
+
+                            img.removeAttribute('data-src');
+                            img.setAttribute('src', lazySrc);
                         }
                     }
                 });
@@ -0,0 +1,266 @@
+"""Benchmark of every build stage on a synthetic project, with regression check.
+
+A temporary project is created from the templates, assets and config.yaml
+of the repository, with a synthetic data.yaml and synthetic photos. Each run
+is a cold full build (empty caches) followed by incremental builds with no
+change. Stage timings come from the trace written by profiled builds.
+
+The best time of every measure is saved as JSON and compared to a baseline:
+the script exits with status 1 when a stage is slower than the baseline
+by more than the threshold. Each run also times a fixed reference workload,
+and the baseline timings are scaled by the ratio of both reference times, so
+a baseline recorded on another machine remains comparable.
+
+Usage:
+    python -m benchmarks.bench_build
+    python -m benchmarks.bench_build --save-baseline
+"""
+from argparse import ArgumentParser
+import contextlib
+import gc
+import hashlib
+import io
+import json
+import os
+import platform
+import shutil
+import sys
+import tempfile
+import time
+from typing import Any
+import yaml
+from benchmarks.synthetic_data import generate_data, generate_images
+from generator.app_config import AppConfig
+from generator.page_generator import PageGenerator
+
+BASELINE = os.path.join(os.path.dirname(__file__), "baseline.json")
+
+INCREMENTAL_BUILDS = 5
+
+
+def create_project(root: str, project: str, args: Any) -> None:
+    """Create a synthetic project.
+
+    Args:
+        root (str): Folder of the repository.
+        project (str): Folder of the project to create.
+        args (Any): Parsed command-line arguments.
+    """
+    shutil.copytree(os.path.join(root, "templates"), os.path.join(project, "templates"))
+    shutil.copytree(os.path.join(root, "assets"), os.path.join(project, "assets"))
+    shutil.copy2(os.path.join(root, "config.yaml"), project)
+
+    images = generate_images(os.path.join(project, "assets", "img", "photo"), args.images)
+
+    with open(file=os.path.join(root, "data.yaml"), mode="r", encoding="utf-8") as file:
+        base = yaml.safe_load(file)
+
+    data = generate_data(base, args.experiences, args.paragraphs, args.tags, images=images)
+
+    with open(file=os.path.join(project, "data.yaml"), mode="w", encoding="utf-8") as file:
+        yaml.safe_dump(data, file, allow_unicode=True, sort_keys=False)
+
+
+def reference_workload() -> float:
+    """Time a fixed workload mixing hashing and interpreted code, like the build stages.
+
+    Returns:
+        float: Best time of the workload, in milliseconds.
+    """
+    data = bytes(range(256)) * 4096
+    best = float("inf")
+    # Collections of the objects left by a build must not be timed
+    gc.collect()
+    gc.disable()
+    try:
+        for _ in range(5):
+            start = time.perf_counter()
+            h = hashlib.sha256()
+            for _ in range(16):
+                h.update(data)
+            words = {}
+            for i in range(100_000):
+                word = f"w{i % 1000}"
+                words[word] = words.get(word, 0) + len(word)
+            best = min(best, (time.perf_counter() - start) * 1000)
+    finally:
+        gc.enable()
+    return best
+
+
+def run_once() -> dict[str, float]:
+    """Run a cold full build and incremental builds in the current folder.
+
+    Returns:
+        dict[str, float]: Time of every stage, of the cold build and of the best
+            incremental build, in milliseconds.
+    """
+    for folder in (".cache", ".builds", "dist"):
+        if os.path.islink(folder):
+            os.remove(folder)
+        shutil.rmtree(folder, ignore_errors=True)
+
+    app_config = AppConfig()
+    app_config.profile = True
+
+    with contextlib.redirect_stdout(io.StringIO()):
+        page_generator = PageGenerator(app_config=app_config)
+
+        start = time.perf_counter()
+        page_generator.build_page(full=True)
+        cold = (time.perf_counter() - start) * 1000
+
+        with open(file=app_config.profile_trace_path, mode="r", encoding="utf-8") as file:
+            timings = json.load(file)["otherData"]["stage_totals_ms"]
+
+        # A single incremental build lasts a few milliseconds, too noisy alone
+        incremental = float("inf")
+        for _ in range(INCREMENTAL_BUILDS):
+            start = time.perf_counter()
+            page_generator.build_page()
+            incremental = min(incremental, (time.perf_counter() - start) * 1000)
+
+    timings["build_page (cold)"] = cold
+    timings["build_page (incremental)"] = incremental
+    return timings
+
+
+def compare(results: dict[str, Any], baseline: dict[str, Any],
+            threshold: float, min_ms: float) -> list[str]:
+    """Print the results next to the baseline and list the regressions.
+
+    Baseline timings are scaled by the ratio of the reference workload times,
+    so they give the expected timings on the current machine. Stages missing
+    from the baseline are shown as new, and stages of the baseline that no
+    longer exist as removed, since they cannot be compared.
+
+    Args:
+        results (dict[str, Any]): Current results.
+        baseline (dict[str, Any]): Baseline results.
+        threshold (float): Allowed slowdown ratio (e.g. 0.5 for +50%).
+        min_ms (float): Slowdowns smaller than this, in milliseconds, are not regressions.
+
+    Returns:
+        list[str]: Labels of the stages that regressed.
+    """
+    regressions = []
+    scale = results["reference_ms"] / baseline["reference_ms"]
+    print(f"Reference workload : {results['reference_ms']:.2f} ms, "
+          f"{baseline['reference_ms']:.2f} ms for the baseline (x{scale:.2f})")
+
+    removed = [label for label in baseline["timings"] if label not in results["timings"]]
+    width = max(len(label) for label in list(results["timings"]) + removed)
+    print(f"{'Stage':<{width}}  {'Expected ms':>11}  {'Current ms':>10}  {'Change':>7}")
+
+    for label, current in results["timings"].items():
+        reference = baseline["timings"].get(label)
+        if reference is None:
+            print(f"{label:<{width}}  {'-':>11}  {current:>10.2f}  {'new':>7}")
+            continue
+
+        reference *= scale
+        change = current / reference - 1 if reference else 0
+        flag = ""
+        if change > threshold and current - reference > min_ms:
+            regressions.append(label)
+            flag = "  REGRESSION"
+        print(f"{label:<{width}}  {reference:>11.2f}  {current:>10.2f}  {change * 100:>+6.0f}%{flag}")
+
+    for label in removed:
+        print(f"{label:<{width}}  {baseline['timings'][label] * scale:>11.2f}  {'-':>10}  {'removed':>7}")
+
+    if removed:
+        print(f"{len(removed)} stage(s) of the baseline no longer exist, record it again with --save-baseline")
+
+    return regressions
+
+
+def main() -> None:
+    """Run the benchmark, save the results and compare them to the baseline."""
+    parser = ArgumentParser(description="Build stages benchmark")
+    parser.add_argument('--experiences', type=int, default=300,
+                        help='number of experiences')
+    parser.add_argument('--paragraphs', type=int, default=4,
+                        help='number of paragraphs of each Markdown body')
+    parser.add_argument('--tags', type=int, default=10,
+                        help='number of style tags of each Markdown body')
+    parser.add_argument('--images', type=int, default=12,
+                        help='number of synthetic photos')
+    parser.add_argument('--repeat', type=int, default=3,
+                        help='number of runs, the best time of each measure is kept')
+    parser.add_argument('--output', type=str, default=os.path.join('.cache', 'benchmarks', 'bench_build.json'),
+                        help='path of the results file')
+    parser.add_argument('--baseline', type=str, default=BASELINE,
+                        help='path of the baseline file')
+    parser.add_argument('--save-baseline', action='store_true',
+                        help='save the results as the new baseline')
+    parser.add_argument('--threshold', type=float, default=0.5,
+                        help='allowed slowdown before failing (0.5 = +50%%)')
+    parser.add_argument('--min-ms', type=float, default=5.0,
+                        help='slowdowns smaller than this (in ms) are not regressions')
+    args = parser.parse_args()
+
+    root = os.getcwd()
+    params = {k: getattr(args, k) for k in ("experiences", "paragraphs", "tags", "images")}
+    runs = []
+    references = [reference_workload()]
+
+    with tempfile.TemporaryDirectory() as project:
+        create_project(root, project, args)
+        os.chdir(project)
+        try:
+            for i in range(args.repeat):
+                runs.append(run_once())
+                references.append(reference_workload())
+                print(f"Run {i + 1}/{args.repeat} : {runs[-1]['build_page (cold)']:.0f} ms")
+        finally:
+            os.chdir(root)
+
+    results = {
+        "params": params,
+        "python": platform.python_version(),
+        "platform": platform.platform(),
+        "reference_ms": min(references),
+        "timings": {label: min(run.get(label, 0.0) for run in runs)
+                    for label in runs[0]},
+    }
+
+    os.makedirs(os.path.dirname(args.output) or ".", exist_ok=True)
+    with open(file=args.output, mode="w", encoding="utf-8") as file:
+        json.dump(results, file, indent=2)
+    print(f"Results saved : {args.output}")
+
+    if args.save_baseline:
+        with open(file=args.baseline, mode="w", encoding="utf-8") as file:
+            json.dump(results, file, indent=2)
+        print(f"Baseline saved : {args.baseline}")
+        return
+
+    if not os.path.isfile(args.baseline):
+        print(f"No baseline found at {args.baseline}, run with --save-baseline first")
+        return
+
+    with open(file=args.baseline, mode="r", encoding="utf-8") as file:
+        baseline = json.load(file)
+
+    if baseline.get("params") != params:
+        print(f"Baseline parameters {baseline.get('params')} differ, comparison skipped")
+        return
+
+    if not baseline.get("reference_ms"):
+        print("Baseline recorded without the reference workload, comparison skipped: "
+              "record it again with --save-baseline")
+        return
+
+    regressions = compare(results, baseline, args.threshold, args.min_ms)
+
+    if regressions:
+        print(f"{len(regressions)} stage(s) regressed by more than {args.threshold * 100:.0f}% : "
+              + ", ".join(regressions))
+        sys.exit(1)
+
+    print("No regression")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,86 @@
+"""Micro-benchmark comparing cold and cached YAML loading of a scaled-up data file.
+
+Usage:
+    python -m benchmarks.bench_yaml_load --scale 50
+"""
+from argparse import ArgumentParser
+import copy
+import os
+import tempfile
+import time
+from typing import Any, Callable
+import yaml
+from generator.yaml_loader import YamlLoader
+
+
+def scale_data(data: Any, scale: int) -> Any:
+    """Repeat every content section of a CV data tree.
+
+    Args:
+        data (Any): Parsed data.yaml content.
+        scale (int): Number of copies of each section.
+
+    Returns:
+        Any: The scaled data.
+    """
+    data = dict(data)
+    data['content'] = {k: [copy.deepcopy(x) for _ in range(scale) for x in v]
+                       if isinstance(v, list) else v
+                       for k, v in data['content'].items()}
+    return data
+
+
+def timeit(func: Callable[[], Any], repeat: int) -> float:
+    """Get the best wall time of a function.
+
+    Args:
+        func (Callable[[], Any]): Function to time.
+        repeat (int): Number of runs.
+
+    Returns:
+        float: Best run time in milliseconds.
+    """
+    best = float("inf")
+    for _ in range(repeat):
+        start = time.perf_counter()
+        func()
+        best = min(best, time.perf_counter() - start)
+    return best * 1000
+
+
+def main() -> None:
+    """Run the benchmark and print the results."""
+    parser = ArgumentParser(description="YAML loading benchmark")
+    parser.add_argument('--data-file', type=str, default='data.yaml',
+                        help='data file to scale up')
+    parser.add_argument('--scale', type=int, default=50,
+                        help='number of copies of each content section')
+    parser.add_argument('--repeat', type=int, default=5,
+                        help='number of runs per measure')
+    args = parser.parse_args()
+
+    with open(file=args.data_file, mode="r", encoding="utf-8") as file:
+        data = scale_data(yaml.safe_load(file), args.scale)
+
+    with tempfile.TemporaryDirectory() as tmp_dir:
+        path = os.path.join(tmp_dir, "data.yaml")
+        with open(file=path, mode="w", encoding="utf-8") as file:
+            yaml.safe_dump(data, file, allow_unicode=True, sort_keys=False)
+
+        def pure_python() -> Any:
+            with open(file=path, mode="r", encoding="utf-8") as file:
+                return yaml.load(file, Loader=yaml.SafeLoader)
+
+        uncached = YamlLoader()
+        cached = YamlLoader(cache_folder=os.path.join(tmp_dir, "cache"))
+        cached.load(path)
+
+        size = os.path.getsize(path) / 1024
+        print(f"{args.data_file} x{args.scale} : {size:.0f} KB, loader {cached.loader_version}")
+        print(f"  yaml.safe_load     : {timeit(pure_python, args.repeat):8.1f} ms")
+        print(f"  YamlLoader (cold)  : {timeit(lambda: uncached.load(path), args.repeat):8.1f} ms")
+        print(f"  YamlLoader (cached): {timeit(lambda: cached.load(path), args.repeat):8.1f} ms")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,158 @@
+"""Generator of synthetic CV data files and images for the benchmarks.
+
+The generated data keeps the structure of the real data.yaml, with many
+experiences, long Markdown bodies and many '{class:text}' style tags.
+
+Usage:
+    python -m benchmarks.synthetic_data --experiences 300 --output big.yaml
+"""
+from argparse import ArgumentParser
+import copy
+import os
+import random
+from typing import Any
+import yaml
+
+try:
+    from PIL import Image
+except ImportError:
+    Image = None
+
+WORDS = ("data model python analyse client projet service web angular machine learning "
+         "sql formation api test industrialisation score texte signal calcul outil equipe "
+         "developpement mission architecture performance cache pipeline rapport").split()
+
+TAG_CLASSES = ["red", "green", "blue", "bold", "mb-warn-color", "mb-info-color"]
+
+
+def generate_markdown(rng: random.Random, paragraphs: int, tags: int) -> str:
+    """Generate a Markdown body with paragraphs, bullet lists and style tags.
+
+    Args:
+        rng (random.Random): Random generator.
+        paragraphs (int): Number of paragraphs, each followed by a bullet list.
+        tags (int): Number of '{class:text}' style tags spread across the body.
+
+    Returns:
+        str: The Markdown body.
+    """
+    blocks = []
+    for _ in range(paragraphs):
+        words = [rng.choice(WORDS) for _ in range(rng.randint(30, 60))]
+        words[rng.randrange(len(words))] = f"**{rng.choice(WORDS)}**"
+        blocks.append(" ".join(words).capitalize() + ".")
+        blocks.append("\n".join(f"- **{rng.choice(WORDS)}** {' '.join(rng.choices(WORDS, k=6))}"
+                                for _ in range(rng.randint(3, 6))))
+
+    for _ in range(tags):
+        i = rng.randrange(len(blocks))
+        blocks[i] += f" {{{rng.choice(TAG_CLASSES)}:{rng.choice(WORDS)}}}"
+
+    return "\n\n".join(blocks) + "\n"
+
+
+def generate_data(base: Any, experiences: int, paragraphs: int, tags: int,
+                  images: list[str] | None = None, seed: int = 0) -> Any:
+    """Generate a synthetic data tree from the real one.
+
+    Args:
+        base (Any): Parsed data.yaml content.
+        experiences (int): Number of experiences.
+        paragraphs (int): Number of paragraphs of each Markdown body.
+        tags (int): Number of style tags of each Markdown body.
+        images (list[str] | None, optional): Names of photos shown in an extra carousel. Defaults to None.
+        seed (int, optional): Seed of the random generator. Defaults to 0.
+
+    Returns:
+        Any: The synthetic data.
+    """
+    rng = random.Random(seed)
+    data = copy.deepcopy(base)
+    content = data['content']
+    templates = content['experiences']
+
+    content['experiences'] = []
+    for i in range(experiences):
+        item = copy.deepcopy(templates[i % len(templates)])
+        item['title'] = f"{item['title']} #{i + 1}"
+        item['content'] = generate_markdown(rng, paragraphs, tags)
+        content['experiences'].append(item)
+
+    for section in ("accueil", "competences", "formations", "publications"):
+        for item in content.get(section, []):
+            item['content'] = generate_markdown(rng, paragraphs, tags)
+
+    if images:
+        content['interets'].append({
+            'title': "Benchmark",
+            'content': generate_markdown(rng, 1, tags),
+            'images': images,
+            'interval': 1800,
+        })
+
+    return data
+
+
+def generate_images(folder: str, count: int, width: int = 1600, height: int = 1200,
+                    seed: int = 0) -> list[str]:
+    """Write synthetic JPEG photos.
+
+    Args:
+        folder (str): Destination folder.
+        count (int): Number of images.
+        width (int, optional): Image width. Defaults to 1600.
+        height (int, optional): Image height. Defaults to 1200.
+        seed (int, optional): Seed of the random generator. Defaults to 0.
+
+    Returns:
+        list[str]: Names of the images written, without extension, or an empty list
+            if Pillow is not installed.
+    """
+    if Image is None or count <= 0:
+        return []
+
+    rng = random.Random(seed)
+    os.makedirs(folder, exist_ok=True)
+    names = []
+
+    for i in range(count):
+        name = f"BENCH{i:04d}"
+        gradient = Image.linear_gradient("L").resize((width, height))
+        img = Image.merge("RGB", (gradient, gradient.rotate(rng.randint(0, 359)),
+                                  Image.effect_noise((width, height), rng.randint(10, 80))))
+        img.save(os.path.join(folder, f"{name}.JPG"), format="JPEG", quality=90)
+        names.append(name)
+
+    return names
+
+
+def main() -> None:
+    """Write a synthetic data file."""
+    parser = ArgumentParser(description="Synthetic data.yaml generator")
+    parser.add_argument('--data-file', type=str, default='data.yaml',
+                        help='data file used as a model')
+    parser.add_argument('--experiences', type=int, default=300,
+                        help='number of experiences')
+    parser.add_argument('--paragraphs', type=int, default=4,
+                        help='number of paragraphs of each Markdown body')
+    parser.add_argument('--tags', type=int, default=10,
+                        help='number of style tags of each Markdown body')
+    parser.add_argument('--seed', type=int, default=0,
+                        help='seed of the random generator')
+    parser.add_argument('--output', type=str, required=True,
+                        help='path of the generated data file')
+    args = parser.parse_args()
+
+    with open(file=args.data_file, mode="r", encoding="utf-8") as file:
+        base = yaml.safe_load(file)
+
+    data = generate_data(base, args.experiences, args.paragraphs, args.tags, seed=args.seed)
+
+    with open(file=args.output, mode="w", encoding="utf-8") as file:
+        yaml.safe_dump(data, file, allow_unicode=True, sort_keys=False)
+
+    print(f"{args.output} : {os.path.getsize(args.output) / 1024:.0f} KB")
+
+
+if __name__ == "__main__":
+    main()
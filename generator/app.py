@@ -1,11 +1,17 @@
 from argparse import ArgumentParser, ArgumentDefaultsHelpFormatter, Namespace
-import webbrowser
+import importlib
+from typing import Any, Callable
 from generator import __version__
 from generator.app_config import AppConfig
-from generator.dead_link_finder import DeadLinkFinder
-from generator.dev_server import DevServer
-from generator.ftp_uploader import FTPUploader
-from generator.page_generator import PageGenerator
+
+# Classes used by the commands, imported on first use so that each command
+# only loads its own dependencies
+_LAZY_CLASSES = {
+    'PageGenerator': 'generator.page_generator',
+    'DevServer': 'generator.dev_server',
+    'FTPUploader': 'generator.ftp_uploader',
+    'DeadLinkFinder': 'generator.dead_link_finder',
+}
 
 
 class App():
@@ -24,6 +30,102 @@ class App():
         """
         self._app_config = app_config
 
+    @staticmethod
+    def _import_class(name: str) -> Any:
+        """Import a class of the lazy registry.
+
+        Args:
+            name (str): Class name, a key of the lazy registry.
+
+        Returns:
+            Any: The class.
+        """
+        return getattr(importlib.import_module(_LAZY_CLASSES[name]), name)
+
+    def _commands(self) -> dict[str, Callable[[Namespace], None]]:
+        """Get the command registry.
+
+        Returns:
+            dict[str, Callable[[Namespace], None]]: Mapping of argument names to the
+                methods running the corresponding commands.
+        """
+        return {
+            'build': self._build,
+            'batch': self._batch,
+            'compile_templates': self._compile_templates,
+            'dev_server': self._serve,
+            'ftp_upload': self._ftp_upload,
+            'find_dead_links': self._find_dead_links,
+        }
+
+    def _build(self, args: Namespace) -> None:
+        """Build the web page.
+
+        Args:
+            args (Namespace): The parsed command-line arguments.
+        """
+        print('Build the page...')
+        pg = self._import_class('PageGenerator')(app_config=self._app_config)
+        pg.build_page()
+
+    def _batch(self, args: Namespace) -> None:
+        """Build one page per data file of a folder.
+
+        Args:
+            args (Namespace): The parsed command-line arguments.
+        """
+        print(f'Build every page of {args.batch}...')
+        pg = self._import_class('PageGenerator')(app_config=self._app_config)
+        pg.build_batch(data_folder=args.batch)
+
+    def _compile_templates(self, args: Namespace) -> None:
+        """Precompile the templates.
+
+        Args:
+            args (Namespace): The parsed command-line arguments.
+        """
+        print('Compile the templates...')
+        pg = self._import_class('PageGenerator')(app_config=self._app_config)
+        pg.compile_templates()
+
+    def _serve(self, args: Namespace) -> None:
+        """Build the web page and start the development server.
+
+        Args:
+            args (Namespace): The parsed command-line arguments.
+        """
+        print('Serving the page in dev mode...')
+        pg = self._import_class('PageGenerator')(app_config=self._app_config)
+        pg.build_page()
+        server = self._import_class('DevServer')(
+            app_config=self._app_config, page_generator=pg)
+
+        if args.open_browser:
+            import webbrowser
+            webbrowser.open(self._app_config.page_url)
+
+        server.serve()
+
+    def _ftp_upload(self, args: Namespace) -> None:
+        """Upload the distribution folder with FTP.
+
+        Args:
+            args (Namespace): The parsed command-line arguments.
+        """
+        print('Upload to server')
+        uploader = self._import_class('FTPUploader')(app_config=self._app_config)
+        uploader.upload()
+
+    def _find_dead_links(self, args: Namespace) -> None:
+        """Find dead links in the generated page.
+
+        Args:
+            args (Namespace): The parsed command-line arguments.
+        """
+        print('Search for dead links...')
+        dead_link_finder = self._import_class('DeadLinkFinder')(app_config=self._app_config)
+        dead_link_finder.find_dead_links_in_dist()
+
     def _parse_arguments(self, argv: list[str] | None) -> Namespace:
         """Parse command-line arguments.
 
@@ -54,6 +156,12 @@ class App():
         group.add_argument('--build', action='store_true',
                            help='build the page')
 
+        group.add_argument('--batch', type=str, metavar='DIR',
+                           help='build one page per YAML file of a folder')
+
+        group.add_argument('--compile-templates', action='store_true',
+                           help='precompile the templates into Python modules')
+
         group.add_argument('--dev-server', action='store_true',
                            help='enable developpement server')
 
@@ -66,6 +174,18 @@ class App():
         group.add_argument('--find-dead-links', action='store_true',
                            help='check for dead links')
 
+        parser.add_argument('--full', action='store_true',
+                            help='rebuild every stage, ignoring the build manifest')
+
+        parser.add_argument('--profile', action='store_true',
+                            help='print the timing of every build stage and save a Chrome trace')
+
+        parser.add_argument('--profile-stage', type=str, metavar='STAGE',
+                            help='run a build stage (e.g. "render") under cProfile')
+
+        parser.add_argument('--in-memory', action='store_true',
+                            help='build in memory and serve the page from there in dev server mode')
+
         parser.add_argument('--open-browser', action='store_true',
                             help='open browser at startup')
 
@@ -84,6 +204,8 @@ class App():
 
         Parses the given arguments and executes the corresponding actions:
         - Build the web page.
+        - Build one page per data file of a folder.
+        - Precompile the templates.
         - Start a development server.
         - Upload files via FTP.
         - Find dead links in generated pages.
@@ -100,42 +222,32 @@ class App():
                 print("Debuggin mode")
                 self._app_config.debug = True
 
+            if args.full:
+                print("Full build enabled")
+                self._app_config.full_build = True
+
+            if args.profile or args.profile_stage:
+                print("Profiling enabled")
+                self._app_config.profile = True
+                self._app_config.profile_stage = args.profile_stage
+
             if args.dev_server:
                 print("Developpement server enabled")
                 self._app_config.dev_server = True
 
+            if args.in_memory:
+                print("In-memory output enabled")
+                self._app_config.dev_in_memory = True
+
         except Exception as e:
             print('Sorry, something went wrong when parsing the given arguments')
             print(e)
             print(type(e))
 
         try:
-            if args.build:
-                print('Build the page...')
-                pg = PageGenerator(app_config=self._app_config)
-                pg.build_page()
-
-            if args.dev_server:
-                print('Serving the page in dev mode...')
-                pg = PageGenerator(app_config=self._app_config)
-                pg.build_page()
-                server = DevServer(
-                    app_config=self._app_config, page_generator=pg)
-
-                if args.open_browser:
-                    webbrowser.open(self._app_config.page_url)
-
-                server.serve()
-
-            if args.ftp_upload:
-                print('Upload to server')
-                uploader = FTPUploader(app_config=self._app_config)
-                uploader.upload()
-
-            if args.find_dead_links:
-                print('Search for dead links...')
-                dead_link_finder = DeadLinkFinder(app_config=self._app_config)
-                dead_link_finder.find_dead_links_in_dist()
+            for name, command in self._commands().items():
+                if getattr(args, name, None):
+                    command(args)
 
         except Exception as e:
             print('Sorry, something went wrong !')
@@ -14,20 +14,49 @@ class AppConfig():
         """
         self.debug = False
         self.dev_server = False
+        self.dev_in_memory = False
+        self.full_build = False
+        self.profile = False
+        self.profile_stage = None
         self.config_file = 'config.yaml'
         self.data_file = 'data.yaml'
+        self.variants = None
         self.credential_file = 'credentials.yaml'
         self.dist_folder = 'dist'
+        self.builds_folder = '.builds'
+        self.batch_folder = 'batch'
         self.page_name = 'index.html'
         self.sitemap = 'sitemap.xml'
+        self.build_manifest = '.build-manifest.json'
         self.template_folder = 'templates'
         self.base_template = 'base.html'
+        self.compiled_templates = 'templates-compiled'
+        self.cache_folder = '.cache'
+        self.markdown_cache_size = 1024
+        self.markdown_disk_cache = True
+        self.markdown_disk_cache_size = 4096
+        self.yaml_disk_cache = True
         self.asset_folder = 'assets'
         self.server_host = 'localhost'
         self.server_port = 8080
         self.server_websocket_port = 8765
         self.css_file_name = 'style'
         self.js_file_name = 'script'
+        self.fingerprint_length = 10
+        self.asset_manifest = 'asset-manifest.json'
+        self.asset_copy_link = True
+        self.asset_copy_verify_hash = False
+        self.copy_workers = None
+        self.image_workers = None
+        self.render_workers = None
+        self.precompress = True
+        self.compress_extensions = ['.html', '.xml', '.css', '.js', '.svg']
+        self.compress_workers = None
+        self.link_check_workers = 16
+        self.link_check_host_concurrency = 2
+        self.link_check_host_delay = 0.25
+        self.link_check_max_retries = 3
+        self.link_check_max_backoff = 30.0
 
     @property
     def abs_dist_page_path(self) -> str:
@@ -56,6 +85,15 @@ class AppConfig():
         """
         return os.path.join(self.dist_folder, self.sitemap)
 
+    @property
+    def abs_dist_manifest_path(self) -> str:
+        """Get the absolute path to the build manifest in the distribution folder.
+
+        Returns:
+            str: The absolute path to the build manifest file.
+        """
+        return os.path.join(self.dist_folder, self.build_manifest)
+
     @property
     def abs_template_folder_path(self) -> str:
         """Get the absolute path to the template folder.
@@ -65,6 +103,69 @@ class AppConfig():
         """
         return os.path.join(self.template_folder)
 
+    @property
+    def template_cache_folder(self) -> str:
+        """Get the path to the compiled template bytecode cache.
+
+        Returns:
+            str: The path of the template bytecode cache folder.
+        """
+        return os.path.join(self.cache_folder, "templates")
+
+    @property
+    def profile_trace_path(self) -> str:
+        """Get the path of the Chrome trace-event file written by profiled builds.
+
+        Returns:
+            str: The path of the build trace file in the cache folder.
+        """
+        return os.path.join(self.cache_folder, 'build-trace.json')
+
+    @property
+    def profile_stats_folder(self) -> str:
+        """Get the folder where cProfile stats of profiled stages are dumped.
+
+        Returns:
+            str: The path of the profile folder in the cache folder.
+        """
+        return os.path.join(self.cache_folder, 'profile')
+
+    @property
+    def compiled_templates_path(self) -> str:
+        """Get the path of the precompiled template modules.
+
+        Returns:
+            str: The path of the compiled template folder in the cache folder.
+        """
+        return os.path.join(self.cache_folder, self.compiled_templates)
+
+    @property
+    def markdown_cache_folder(self) -> str:
+        """Get the path to the converted Markdown cache.
+
+        Returns:
+            str: The path of the Markdown cache folder.
+        """
+        return os.path.join(self.cache_folder, "markdown")
+
+    @property
+    def yaml_cache_folder(self) -> str:
+        """Get the path to the parsed YAML cache.
+
+        Returns:
+            str: The path of the parsed YAML cache folder.
+        """
+        return os.path.join(self.cache_folder, "yaml")
+
+    @property
+    def image_cache_folder(self) -> str:
+        """Get the path to the responsive image derivative cache.
+
+        Returns:
+            str: The path of the image cache folder.
+        """
+        return os.path.join(self.cache_folder, "images")
+
     @property
     def abs_asset_folder_path(self) -> str:
         """Get the absolute path to the asset folder.
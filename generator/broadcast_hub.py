@@ -0,0 +1,115 @@
+import asyncio
+import time
+from typing import Any
+from websockets.exceptions import ConnectionClosed
+
+
+class BroadcastHub():
+    """Registry of the connected WebSocket clients of the live reload.
+
+    Messages are sent to every client concurrently, so the latency of a
+    broadcast does not grow with the number of clients. Clients whose send
+    fails or times out are closed and dropped from the registry.
+    """
+
+    def __init__(self, send_timeout: float = 2.0) -> None:
+        """Initialize an empty hub.
+
+        Args:
+            send_timeout (float, optional): Time allowed to send a message to one client,
+                in seconds. Defaults to 2.0.
+        """
+        self._send_timeout = send_timeout
+        self._clients: set[Any] = set()
+        self._dropped = 0
+
+    @property
+    def client_count(self) -> int:
+        """Get the number of connected clients.
+
+        Returns:
+            int: The number of clients.
+        """
+        return len(self._clients)
+
+    @property
+    def dropped_count(self) -> int:
+        """Get the number of clients dropped after a failed send.
+
+        Returns:
+            int: The number of dropped clients.
+        """
+        return self._dropped
+
+    def register(self, client: Any) -> None:
+        """Add a client to the registry.
+
+        Args:
+            client (Any): The WebSocket connection.
+        """
+        self._clients.add(client)
+        print(f"New client : {client.remote_address} ({self.client_count} connected)")
+
+    def unregister(self, client: Any) -> None:
+        """Remove a client from the registry.
+
+        Args:
+            client (Any): The WebSocket connection.
+        """
+        if client in self._clients:
+            self._clients.discard(client)
+            print(f"Client disconnected : {client.remote_address} ({self.client_count} connected)")
+
+    async def handler(self, client: Any) -> None:
+        """Keep a client registered as long as its connection is open.
+
+        Args:
+            client (Any): The WebSocket connection.
+        """
+        self.register(client)
+        try:
+            async for _ in client:
+                pass
+        except ConnectionClosed:
+            pass
+        finally:
+            self.unregister(client)
+
+    async def _send(self, client: Any, message: str) -> bool:
+        """Send a message to one client, dropping it on failure.
+
+        Args:
+            client (Any): The WebSocket connection.
+            message (str): The message.
+
+        Returns:
+            bool: True if the message was sent.
+        """
+        try:
+            await asyncio.wait_for(client.send(message), timeout=self._send_timeout)
+            return True
+        except (ConnectionClosed, OSError, asyncio.TimeoutError) as e:
+            print(f"Deconnexion of WebSocket {client.remote_address} : {type(e).__name__}")
+            self._dropped += 1
+            self.unregister(client)
+            asyncio.ensure_future(client.close())
+            return False
+
+    async def broadcast(self, message: str) -> int:
+        """Send a message to every connected client.
+
+        Args:
+            message (str): The message.
+
+        Returns:
+            int: The number of clients the message was sent to.
+        """
+        clients = list(self._clients)
+        if not clients:
+            return 0
+
+        start = time.perf_counter()
+        results = await asyncio.gather(*(self._send(client, message) for client in clients))
+        sent = sum(results)
+        print(f"Sent to {sent}/{len(clients)} client(s) in {(time.perf_counter() - start) * 1000:.1f} ms : {message}")
+        return sent
@@ -0,0 +1,192 @@
+import copy
+import hashlib
+import json
+import os
+from typing import Any, Callable
+
+
+class BuildManifest():
+    """Content-hash manifest used to skip build stages whose inputs are unchanged.
+
+    The manifest is stored as JSON in the distribution folder. It records the
+    content hash of every input file seen during a build, along with the key of
+    each build stage, so a later build can tell which stages are up to date.
+    """
+
+    VERSION = 1
+
+    def __init__(self, path: str) -> None:
+        """Initialize the build manifest.
+
+        Args:
+            path (str): Path of the JSON manifest file.
+        """
+        self._path = path
+        self._files: dict[str, dict[str, Any]] = {}
+        self._stages: dict[str, str] = {}
+        self._values: dict[str, Any] = {}
+
+    def load(self, path: str | None = None) -> None:
+        """Load the manifest from disk, starting empty if it is missing or invalid.
+
+        Args:
+            path (str | None, optional): Path to read instead of the default one. Defaults to None.
+        """
+        path = path or self._path
+        self.reset()
+
+        if not os.path.isfile(path):
+            return
+
+        try:
+            with open(file=path, mode="r", encoding="utf-8") as file:
+                manifest = json.load(file)
+        except (OSError, ValueError) as e:
+            print(f"Unable to read build manifest {path}: {e}")
+            return
+
+        if manifest.get("version") != self.VERSION:
+            return
+
+        self._files = manifest.get("files", {})
+        self._stages = manifest.get("stages", {})
+        self._values = manifest.get("values", {})
+
+    def reset(self) -> None:
+        """Forget every recorded file hash, stage key and value."""
+        self._files = {}
+        self._stages = {}
+        self._values = {}
+
+    def snapshot(self) -> dict[str, Any]:
+        """Get a copy of the manifest content.
+
+        Returns:
+            dict[str, Any]: The recorded file hashes, stage keys and values.
+        """
+        return copy.deepcopy({"files": self._files, "stages": self._stages, "values": self._values})
+
+    def restore(self, snapshot: dict[str, Any]) -> None:
+        """Replace the manifest content with a snapshot.
+
+        Args:
+            snapshot (dict[str, Any]): Content returned by snapshot().
+        """
+        self._files = snapshot["files"]
+        self._stages = snapshot["stages"]
+        self._values = snapshot["values"]
+
+    def save(self, path: str | None = None) -> None:
+        """Write the manifest to disk, replacing the previous file atomically.
+
+        Args:
+            path (str | None, optional): Path to write instead of the default one. Defaults to None.
+        """
+        path = path or self._path
+        os.makedirs(os.path.dirname(path) or ".", exist_ok=True)
+        manifest = {
+            "version": self.VERSION,
+            "files": self._files,
+            "stages": self._stages,
+            "values": self._values,
+        }
+        tmp_path = f"{path}.{os.getpid()}.tmp"
+        with open(file=tmp_path, mode="w", encoding="utf-8") as file:
+            json.dump(manifest, file, indent=2, sort_keys=True)
+        os.replace(tmp_path, path)
+
+    def file_hash(self, path: str) -> str:
+        """Get the content hash of a file.
+
+        The hash is only recomputed when the file size or modification time
+        differs from the recorded one.
+
+        Args:
+            path (str): Path of the file to hash.
+
+        Returns:
+            str: SHA-256 hex digest of the file content, or an empty string if the file is missing.
+        """
+        try:
+            stat = os.stat(path)
+        except OSError:
+            self._files.pop(path, None)
+            return ""
+
+        entry = self._files.get(path)
+        if entry and entry.get("size") == stat.st_size and entry.get("mtime_ns") == stat.st_mtime_ns:
+            return entry["sha256"]
+
+        with open(path, "rb") as file:
+            sha256 = hashlib.file_digest(file, "sha256").hexdigest()
+
+        self._files[path] = {
+            "size": stat.st_size,
+            "mtime_ns": stat.st_mtime_ns,
+            "sha256": sha256,
+        }
+        return sha256
+
+    def digest(self, paths: list[str], *extra: Any) -> str:
+        """Compute a stage key from input files and extra parameters.
+
+        Args:
+            paths (list[str]): Input files of the stage.
+            *extra (Any): Additional JSON-serializable values the stage output depends on.
+
+        Returns:
+            str: SHA-256 hex digest identifying the stage inputs.
+        """
+        h = hashlib.sha256()
+        for path in sorted(paths):
+            h.update(path.encode("utf-8"))
+            h.update(b"\0")
+            h.update(self.file_hash(path).encode("ascii"))
+            h.update(b"\0")
+        h.update(json.dumps(extra, sort_keys=True, default=str).encode("utf-8"))
+        return h.hexdigest()
+
+    def is_fresh(self, stage: str, key: str, outputs: list[str],
+                 exists: Callable[[str], bool] = os.path.exists) -> bool:
+        """Check whether a stage can be skipped.
+
+        Args:
+            stage (str): Name of the build stage.
+            key (str): Key of the current stage inputs.
+            outputs (list[str]): Files the stage is expected to have produced.
+            exists (Callable[[str], bool], optional): Check of an output file. Defaults to os.path.exists.
+
+        Returns:
+            bool: True if the recorded key matches and all outputs exist.
+        """
+        return self._stages.get(stage) == key and all(exists(p) for p in outputs)
+
+    def record(self, stage: str, key: str) -> None:
+        """Record the key of a completed stage.
+
+        Args:
+            stage (str): Name of the build stage.
+            key (str): Key of the stage inputs.
+        """
+        self._stages[stage] = key
+
+    def get_value(self, name: str, default: Any = None) -> Any:
+        """Get a value stored alongside the manifest.
+
+        Args:
+            name (str): Name of the value.
+            default (Any, optional): Value returned when missing. Defaults to None.
+
+        Returns:
+            Any: The stored value or the default.
+        """
+        return self._values.get(name, default)
+
+    def set_value(self, name: str, value: Any) -> None:
+        """Store a JSON-serializable value alongside the manifest.
+
+        Args:
+            name (str): Name of the value.
+            value (Any): Value to store.
+        """
+        self._values[name] = value
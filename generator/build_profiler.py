@@ -0,0 +1,191 @@
+from contextlib import contextmanager
+import cProfile
+import json
+import os
+import pstats
+import threading
+import time
+from typing import Any, Callable, Iterator
+
+
+class BuildProfiler():
+    """Recorder of build stage timings.
+
+    Stages are timed with nested spans, reported as a console table and saved
+    as a Chrome trace-event file (open it in chrome://tracing or Perfetto).
+    Fine-grained operations, such as string transforms, are accumulated and
+    only reported in the table. One stage can also be run under cProfile.
+    """
+
+    def __init__(self, enabled: bool = False, profile_stage: str | None = None,
+                 stats_folder: str | None = None) -> None:
+        """Initialize the profiler.
+
+        Args:
+            enabled (bool, optional): Whether timings are recorded. Defaults to False.
+            profile_stage (str | None, optional): Name of the stage run under cProfile. Defaults to None.
+            stats_folder (str | None, optional): Folder where cProfile stats are dumped. Defaults to None.
+        """
+        self._enabled = enabled
+        self._profile_stage = profile_stage
+        self._stats_folder = stats_folder
+        self._lock = threading.Lock()
+        self.reset()
+
+    @property
+    def enabled(self) -> bool:
+        """Check whether timings are recorded.
+
+        Returns:
+            bool: True if the profiler is enabled.
+        """
+        return self._enabled
+
+    def reset(self) -> None:
+        """Forget every recorded timing."""
+        self._origin = time.perf_counter_ns()
+        self._events: list[dict[str, Any]] = []
+        self._totals: dict[str, list[int]] = {}
+        self._depth = 0
+
+    def _add_total(self, label: str, duration: int, depth: int) -> None:
+        """Accumulate a duration in the table.
+
+        Args:
+            label (str): Row label.
+            duration (int): Duration in nanoseconds.
+            depth (int): Nesting depth of the row.
+        """
+        with self._lock:
+            total = self._totals.setdefault(label, [0, 0, depth])
+            total[0] += 1
+            total[1] += duration
+
+    @contextmanager
+    def stage(self, name: str, detail: str | None = None) -> Iterator[None]:
+        """Time a build stage.
+
+        Args:
+            name (str): Stage name, also used to select the stage run under cProfile.
+            detail (str | None, optional): Stage instance (e.g. a file name). Defaults to None.
+
+        Yields:
+            None: Control to the timed block.
+        """
+        if not self._enabled:
+            yield
+            return
+
+        label = f"{name} {detail}" if detail else name
+        depth = self._depth
+        with self._lock:
+            self._totals.setdefault(label, [0, 0, depth])
+        self._depth += 1
+        profiler = cProfile.Profile() if name == self._profile_stage else None
+        start = time.perf_counter_ns()
+
+        try:
+            if profiler is not None:
+                profiler.enable()
+            yield
+        finally:
+            if profiler is not None:
+                profiler.disable()
+            end = time.perf_counter_ns()
+            self._depth = depth
+            self._add_total(label, end - start, depth)
+            self._events.append({
+                "name": label,
+                "cat": "build",
+                "ph": "X",
+                "ts": (start - self._origin) / 1000,
+                "dur": (end - start) / 1000,
+                "pid": os.getpid(),
+                "tid": threading.get_ident(),
+            })
+            if profiler is not None:
+                self._print_stats(profiler, label)
+
+    def timed(self, func: Callable[..., Any], name: str, depth: int | None = None) -> Callable[..., Any]:
+        """Wrap a function so the time spent in it is accumulated in the table.
+
+        Args:
+            func (Callable[..., Any]): Function to time.
+            name (str): Row label.
+            depth (int | None, optional): Nesting depth of the row. Defaults to the current depth.
+
+        Returns:
+            Callable[..., Any]: The wrapped function.
+        """
+        if not self._enabled:
+            return func
+
+        depth = self._depth if depth is None else depth
+
+        def wrapper(*args: Any, **kwargs: Any) -> Any:
+            start = time.perf_counter_ns()
+            try:
+                return func(*args, **kwargs)
+            finally:
+                self._add_total(name, time.perf_counter_ns() - start, depth)
+
+        return wrapper
+
+    def _print_stats(self, profiler: cProfile.Profile, label: str) -> None:
+        """Print the hot spots of a stage run under cProfile, and dump its stats.
+
+        Args:
+            profiler (cProfile.Profile): Profiler of the stage.
+            label (str): Stage label.
+        """
+        print(f"cProfile of stage {label} :")
+        stats = pstats.Stats(profiler)
+        stats.sort_stats(pstats.SortKey.CUMULATIVE).print_stats(25)
+
+        if self._stats_folder:
+            os.makedirs(self._stats_folder, exist_ok=True)
+            path = os.path.join(self._stats_folder, f"{label.replace(os.sep, '_').replace(' ', '_')}.prof")
+            stats.dump_stats(path)
+            print(f"cProfile stats saved : {path}")
+
+    def print_table(self) -> None:
+        """Print the recorded timings as a table, in the order stages started."""
+        if not self._totals:
+            return
+
+        total = max(duration for _, duration, _ in self._totals.values())
+        width = max(len(label) + 2 * depth for label, (_, _, depth) in self._totals.items())
+        width = max(width, len("Stage"))
+
+        print(f"{'Stage':<{width}}  {'Calls':>6}  {'Total ms':>10}  {'Mean ms':>9}  {'%':>6}")
+        for label, (calls, duration, depth) in self._totals.items():
+            name = "  " * depth + label
+            print(f"{name:<{width}}  {calls:>6}  {duration / 1e6:>10.2f}  "
+                  f"{duration / 1e6 / max(calls, 1):>9.3f}  {duration / total * 100 if total else 0:>6.1f}")
+
+    def totals(self) -> dict[str, float]:
+        """Get the total time of every table row.
+
+        Returns:
+            dict[str, float]: Total time in milliseconds, keyed by row label.
+        """
+        return {label: duration / 1e6 for label, (_, duration, _) in self._totals.items()}
+
+    def save_trace(self, path: str) -> None:
+        """Save the recorded stages as a Chrome trace-event file.
+
+        The table totals, including the accumulated rows, are stored in the
+        'otherData' field.
+
+        Args:
+            path (str): Path of the JSON file.
+        """
+        os.makedirs(os.path.dirname(path) or ".", exist_ok=True)
+        trace = {
+            "traceEvents": self._events,
+            "displayTimeUnit": "ms",
+            "otherData": {"stage_totals_ms": self.totals()},
+        }
+        with open(file=path, mode="w", encoding="utf-8") as file:
+            json.dump(trace, file)
+        print(f"Build trace saved : {path}")
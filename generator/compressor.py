@@ -0,0 +1,145 @@
+from concurrent.futures import ThreadPoolExecutor
+import gzip
+import hashlib
+import os
+import zlib
+
+try:
+    import brotli
+except ImportError:
+    brotli = None
+
+_DECOMPRESS_ERRORS = (OSError, EOFError, zlib.error) + ((brotli.error,) if brotli is not None else ())
+
+
+class Compressor():
+    """Writer of precompressed gzip and brotli siblings for static files.
+
+    Each text file gets a '.gz' (and '.br' when brotli is installed) sibling,
+    compressed at the maximum level so a static host can serve it directly.
+    Siblings whose source content is unchanged are left untouched, whatever
+    the modification times (sources linked or copied with their original time
+    can be older than a stale sibling). The content is compared with the hash
+    recorded when the siblings were written, or else with the decompressed
+    siblings.
+    """
+
+    def __init__(self, extensions: list[str], workers: int | None = None) -> None:
+        """Initialize the compressor.
+
+        Args:
+            extensions (list[str]): Extensions of the files to compress (e.g. [".html"]).
+            workers (int | None, optional): Number of worker threads. Defaults to None.
+        """
+        self._extensions = tuple(extensions)
+        self._workers = workers
+
+    @property
+    def encodings(self) -> list[str]:
+        """Get the sibling extensions produced.
+
+        Returns:
+            list[str]: '.gz', and '.br' when brotli is installed.
+        """
+        return [".gz", ".br"] if brotli is not None else [".gz"]
+
+    def _is_up_to_date(self, data: bytes, compressed_path: str) -> bool:
+        """Check whether a compressed sibling holds the content of its source.
+
+        Args:
+            data (bytes): Source file content.
+            compressed_path (str): Compressed sibling path.
+
+        Returns:
+            bool: True if the sibling does not need to be rewritten.
+        """
+        try:
+            with open(compressed_path, "rb") as file:
+                compressed = file.read()
+            if compressed_path.endswith(".br"):
+                return brotli.decompress(compressed) == data
+            return gzip.decompress(compressed) == data
+        except FileNotFoundError:
+            return False
+        except _DECOMPRESS_ERRORS as e:
+            print(f"Invalid compressed file {compressed_path}: {e}")
+            return False
+
+    def _compress_file(self, path: str, known_digest: str | None) -> tuple[int, int, str]:
+        """Write the missing or outdated compressed siblings of one file.
+
+        Args:
+            path (str): Source file path.
+            known_digest (str | None): SHA-256 of the source the siblings were written from, if known.
+
+        Returns:
+            tuple[int, int, str]: Number of siblings written and left up to date,
+                and SHA-256 of the source.
+        """
+        with open(path, "rb") as file:
+            data = file.read()
+        digest = hashlib.sha256(data).hexdigest()
+
+        written = 0
+        for encoding in self.encodings:
+            compressed_path = f"{path}{encoding}"
+            if digest == known_digest and os.path.exists(compressed_path):
+                continue
+            if digest != known_digest and self._is_up_to_date(data, compressed_path):
+                continue
+
+            if encoding == ".br":
+                compressed = brotli.compress(data, quality=11)
+            else:
+                compressed = gzip.compress(data, compresslevel=9, mtime=0)
+            tmp_path = f"{compressed_path}.tmp"
+            with open(tmp_path, "wb") as file:
+                file.write(compressed)
+            os.replace(tmp_path, compressed_path)
+            written += 1
+
+        return written, len(self.encodings) - written, digest
+
+    def compress_tree(self, folder: str, digests: dict[str, str] | None = None) -> tuple[int, int, int]:
+        """Write the missing or outdated compressed siblings of every text file in a folder.
+
+        Siblings whose source no longer exists are removed.
+
+        Args:
+            folder (str): Folder to process.
+            digests (dict[str, str] | None, optional): SHA-256 of the source of the siblings,
+                keyed by path relative to the folder, as left by the previous call. Updated in
+                place. Defaults to None, comparing with the decompressed siblings.
+
+        Returns:
+            tuple[int, int, int]: Number of siblings written, left up to date, and removed.
+        """
+        jobs = []
+        removed = 0
+
+        for root, _, files in os.walk(folder):
+            for file in files:
+                path = os.path.join(root, file)
+                base, ext = os.path.splitext(path)
+
+                if ext in (".gz", ".br"):
+                    if base.endswith(self._extensions) and not os.path.exists(base):
+                        os.remove(path)
+                        removed += 1
+                    continue
+
+                if file.endswith(self._extensions):
+                    jobs.append(path)
+
+        known = digests or {}
+        rel_paths = [os.path.relpath(path, folder).replace(os.sep, "/") for path in jobs]
+
+        with ThreadPoolExecutor(max_workers=self._workers) as executor:
+            results = list(executor.map(lambda job: self._compress_file(job[0], known.get(job[1])),
+                                        zip(jobs, rel_paths)))
+
+        if digests is not None:
+            digests.clear()
+            digests.update((rel_path, result[2]) for rel_path, result in zip(rel_paths, results))
+
+        return sum(r[0] for r in results), sum(r[1] for r in results), removed
@@ -1,10 +1,106 @@
+from concurrent.futures import ThreadPoolExecutor
+from contextlib import contextmanager
+from email.utils import parsedate_to_datetime
+import threading
 import time
-from urllib.parse import urljoin
+from typing import Iterator
+from urllib.parse import urljoin, urlsplit
 from bs4 import BeautifulSoup
 import requests
 from generator.app_config import AppConfig
 
 
+_HEADERS = {
+    "User-Agent": (
+        "Mozilla/5.0 (Windows NT 10.0; Win64; x64) "
+        "AppleWebKit/537.36 (KHTML, like Gecko) "
+        "Chrome/120.0.0.0 Safari/537.36"
+    ),
+    "Accept-Language": "en-US,en;q=0.9",
+    "Accept": "text/html,application/xhtml+xml,application/xml;q=0.9,*/*;q=0.8",
+    "Connection": "keep-alive",
+}
+
+_RETRY_STATUSES = (429, 503)
+
+
+class HostLimiter():
+    """Politeness limits applied to the requests sent to each host.
+
+    A host gets at most `concurrency` requests in flight, and two requests to
+    the same host start at least `delay` seconds apart. A host can also be
+    deferred, e.g. when it answers with a `Retry-After` header.
+    """
+
+    def __init__(self, concurrency: int, delay: float) -> None:
+        """Initialize the limiter.
+
+        Args:
+            concurrency (int): Maximum number of concurrent requests per host.
+            delay (float): Minimum time between two requests to the same host, in seconds.
+        """
+        self._concurrency = max(1, concurrency)
+        self._delay = delay
+        self._lock = threading.Lock()
+        self._semaphores: dict[str, threading.Semaphore] = {}
+        self._next_time: dict[str, float] = {}
+
+    def _semaphore(self, host: str) -> threading.Semaphore:
+        """Get the semaphore of a host, creating it if needed.
+
+        Args:
+            host (str): The host name.
+
+        Returns:
+            threading.Semaphore: The semaphore of the host.
+        """
+        with self._lock:
+            if host not in self._semaphores:
+                self._semaphores[host] = threading.Semaphore(self._concurrency)
+            return self._semaphores[host]
+
+    def _reserve(self, host: str) -> float:
+        """Reserve the next start time of a host.
+
+        Args:
+            host (str): The host name.
+
+        Returns:
+            float: The time to wait before starting the request, in seconds.
+        """
+        with self._lock:
+            now = time.monotonic()
+            start = max(now, self._next_time.get(host, now))
+            self._next_time[host] = start + self._delay
+            return start - now
+
+    @contextmanager
+    def slot(self, host: str) -> Iterator[None]:
+        """Wait until a request can be sent to a host.
+
+        Args:
+            host (str): The host name.
+
+        Yields:
+            None: The request can be sent within the block.
+        """
+        with self._semaphore(host):
+            wait = self._reserve(host)
+            if wait > 0:
+                time.sleep(wait)
+            yield
+
+    def defer(self, host: str, seconds: float) -> None:
+        """Delay the next request to a host.
+
+        Args:
+            host (str): The host name.
+            seconds (float): Time to wait from now, in seconds.
+        """
+        with self._lock:
+            self._next_time[host] = max(self._next_time.get(host, 0.0), time.monotonic() + seconds)
+
+
 class DeadLinkFinder():
     """A utility class to detect dead or broken links in generated HTML pages."""
 
@@ -15,6 +111,10 @@ class DeadLinkFinder():
             app_config (AppConfig): The application configuration instance.
         """
         self._app_config = app_config
+        self._limiter = HostLimiter(
+            concurrency=app_config.link_check_host_concurrency,
+            delay=app_config.link_check_host_delay)
+        self._local = threading.local()
 
     def extract_unique_links(self, html_text: str, base_url: str) -> list[str]:
         """Extract all unique, valid hyperlinks from an HTML document.
@@ -47,11 +147,129 @@ class DeadLinkFinder():
 
         return unique_links
 
+    @staticmethod
+    def _retry_after(response: requests.Response) -> float | None:
+        """Read the delay requested by the `Retry-After` header of a response.
+
+        Args:
+            response (requests.Response): The response.
+
+        Returns:
+            float | None: The delay in seconds, or None if the header is missing or invalid.
+        """
+        value = response.headers.get("Retry-After")
+        if not value:
+            return None
+        if value.strip().isdigit():
+            return float(value)
+        try:
+            return max(0.0, parsedate_to_datetime(value).timestamp() - time.time())
+        except (TypeError, ValueError):
+            return None
+
+    def _session(self) -> requests.Session:
+        """Get the HTTP session of the current thread, so connections to a host are reused.
+
+        Returns:
+            requests.Session: The session.
+        """
+        session = getattr(self._local, "session", None)
+        if session is None:
+            session = requests.Session()
+            session.headers.update(_HEADERS)
+            self._local.session = session
+        return session
+
+    def _request(self, method: str, url: str, timeout: int, verify_ssl: bool) -> requests.Response:
+        """Send a request within the limits of its host.
+
+        A 429 or 503 response is retried after the delay of its `Retry-After` header,
+        or after an exponential backoff, and the whole host is deferred meanwhile.
+
+        Args:
+            method (str): The HTTP method.
+            url (str): The URL.
+            timeout (int): Timeout of the request, in seconds.
+            verify_ssl (bool): Whether to verify SSL certificates.
+
+        Returns:
+            requests.Response: The last response.
+
+        Raises:
+            requests.RequestException: If the request fails.
+        """
+        host = urlsplit(url).netloc.lower()
+        attempt = 0
+
+        while True:
+            with self._limiter.slot(host):
+                response = self._session().request(
+                    method, url, allow_redirects=True, timeout=timeout, verify=verify_ssl)
+
+            if response.status_code not in _RETRY_STATUSES or attempt >= self._app_config.link_check_max_retries:
+                return response
+
+            delay = self._retry_after(response)
+            if delay is None:
+                delay = self._app_config.link_check_host_delay * 2 ** (attempt + 1) or 1.0
+            delay = min(delay, self._app_config.link_check_max_backoff)
+            attempt += 1
+
+            if self._app_config.debug:
+                print(f"{url} : {response.status_code}, retry in {delay:.1f} s")
+
+            response.close()
+            self._limiter.defer(host, delay)
+
+    def _check_link(self, url: str, timeout: int, verify_ssl: bool) -> dict | None:
+        """Check whether a link is dead.
+
+        The link is first tested using an HTTP HEAD request; if it returns an
+        error status code, a GET request is retried for confirmation.
+
+        Args:
+            url (str): The URL.
+            timeout (int): Timeout of each request, in seconds.
+            verify_ssl (bool): Whether to verify SSL certificates.
+
+        Returns:
+            dict | None: The description of the dead link, or None if the link works.
+        """
+        try:
+            response = self._request("HEAD", url, timeout, verify_ssl)
+
+            if response.status_code >= 400:
+                if self._app_config.debug:
+                    print(f"{url} : {response.status_code}, retry with GET")
+                response = self._request("GET", url, timeout, verify_ssl)
+                response.close()
+
+            if self._app_config.debug:
+                print(f"{url} : {'success' if response.status_code < 400 else 'error'}")
+
+            if response.status_code >= 400:
+                return {
+                    "url": url,
+                    "status": response.status_code,
+                    "error": response.reason
+                }
+
+        except requests.RequestException as e:
+            return {
+                "url": url,
+                "status": None,
+                "error": str(e)
+            }
+
+        return None
+
     def find_dead_links(self, html_text: str, base_url: str | None = None, timeout: int = 5, verify_ssl: bool = True) -> list[dict]:
         """Check all links in an HTML document for dead (unreachable) URLs.
 
-        Each link is first tested using an HTTP HEAD request; if it fails or
-        returns an error status code, a GET request is retried for confirmation.
+        Links are checked concurrently by `AppConfig.link_check_workers` threads,
+        within the limits of each host (see `HostLimiter`). Each link is first tested
+        using an HTTP HEAD request; if it fails or returns an error status code,
+        a GET request is retried for confirmation.
 
         Args:
             html_text (str): The HTML document to analyze.
@@ -60,70 +278,26 @@ class DeadLinkFinder():
             verify_ssl (bool, optional): Whether to verify SSL certificates. Defaults to True.
 
         Returns:
-            list[dict]: A list of dictionaries describing dead links, where each dictionary contains:
+            list[dict]: A list of dictionaries describing dead links, in the order of the
+                document, where each dictionary contains:
                 - "url" (str): The problematic link.
                 - "status" (int | None): The HTTP status code or None if unreachable.
                 - "error" (str): The error message or reason.
         """
-        dead_links = []
+        urls = self.extract_unique_links(html_text=html_text, base_url=base_url)
+        if not urls:
+            return []
 
-        headers = {
-            "User-Agent": (
-                "Mozilla/5.0 (Windows NT 10.0; Win64; x64) "
-                "AppleWebKit/537.36 (KHTML, like Gecko) "
-                "Chrome/120.0.0.0 Safari/537.36"
-            ),
-            "Accept-Language": "en-US,en;q=0.9",
-            "Accept": "text/html,application/xhtml+xml,application/xml;q=0.9,*/*;q=0.8",
-            "Connection": "keep-alive",
-        }
+        start = time.perf_counter()
+        workers = max(1, min(self._app_config.link_check_workers, len(urls)))
 
-        for url in self.extract_unique_links(html_text=html_text, base_url=base_url):
-
-            if self._app_config.debug:
-                print(f'Test link: {url}')
-
-            try:
-                response = requests.head(
-                    url, allow_redirects=True, timeout=timeout, verify=verify_ssl, headers=headers)
-
-                if self._app_config.debug:
-                    if response.status_code == 200:
-                        print('success')
-                    else:
-                        print('error')
-
-                if response.status_code >= 400:
-                    if self._app_config.debug:
-                        print('retry')
-                    time.sleep(0.5)
-                    response = requests.get(
-                        url, allow_redirects=True, timeout=timeout,
-                        verify=verify_ssl, headers=headers)
-
-                if response.status_code >= 400:
-                    if self._app_config.debug:
-                        if response.status_code == 200:
-                            print('success')
-                        else:
-                            print('error')
-
-                    dead_links.append({
-                        "url": url,
-                        "status": response.status_code,
-                        "error": response.reason
-                    })
-
-            except requests.RequestException as e:
-                dead_links.append({
-                    "url": url,
-                    "status": None,
-                    "error": str(e)
-                })
+        with ThreadPoolExecutor(max_workers=workers) as executor:
+            results = list(executor.map(lambda url: self._check_link(url, timeout, verify_ssl), urls))
 
-            time.sleep(0.5)
+        if self._app_config.debug:
+            print(f"{len(urls)} link(s) checked in {time.perf_counter() - start:.1f} s with {workers} worker(s)")
 
-        return dead_links
+        return [result for result in results if result is not None]
 
     def find_dead_links_in_dist(self) -> None:
         """Find and display dead links in the generated distribution HTML page.
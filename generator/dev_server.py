@@ -1,12 +1,43 @@
 import os
+import io
+import re
+import gzip
+import json
+import queue
 import time
 import asyncio
+import hashlib
+import posixpath
 import threading
-from http.server import SimpleHTTPRequestHandler, HTTPServer
+from collections import OrderedDict
+from http import HTTPStatus
+from http.server import SimpleHTTPRequestHandler, ThreadingHTTPServer
 from functools import partial
+from typing import Any
+from urllib.parse import unquote, urlsplit
 from watchdog.observers import Observer
 from watchdog.events import FileSystemEventHandler
 import websockets
+from generator.broadcast_hub import BroadcastHub
+from generator.page_generator import BuildCancelled
+
+# Build stages to check for each kind of changed file, None for every stage
+_CHANGE_STAGES = {
+    "css": {"assets"},
+    "js": {"assets"},
+    "image": {"extra_assets", "images", "pages"},
+    "asset": {"extra_assets"},
+    "template": {"pages", "sitemap"},
+    "data": {"pages", "sitemap"},
+    "config": None,
+}
+
+_IMAGE_EXTENSIONS = (".jpg", ".jpeg", ".png", ".webp", ".avif", ".gif", ".svg", ".ico")
+
+_WATCHED_EVENTS = ("created", "modified", "moved", "deleted")
+
+# Quiet time after the last file event before a rebuild starts, in seconds
+_DEBOUNCE_DELAY = 0.1
 
 
 class DevServer():
@@ -26,85 +57,267 @@ class DevServer():
         """
         self._app_config = app_config
         self._page_generator = page_generator
-        self._rebuild_event = asyncio.Event()
-        self._lock = threading.Lock()
-        self._debounce_timer = None
+        self._hub = BroadcastHub()
+        self._changes: queue.Queue[tuple[str, float] | None] = queue.Queue()
+        self._worker = None
+        self._stats = {"builds": 0, "superseded": 0, "events": 0, "max_queue_depth": 0,
+                       "last_build_ms": 0.0, "last_latency_ms": 0.0}
         self._last_build_time = 0
         self._observer = None
         self._server_thread = None
-        self._stop_event = threading.Event()
         self._loop = None
 
-    def _rebuild(self) -> None:
-        """Trigger a debounced rebuild operation.
+    def _classify(self, path: str) -> str:
+        """Classify a changed file by the build stages it affects.
 
-        Starts a short timer to delay the rebuild slightly, preventing
-        multiple rebuilds from happening too quickly after consecutive file changes.
+        Args:
+            path (str): Path of the changed file.
+
+        Returns:
+            str: "css", "js", "image", "asset", "template", "data" or "config".
         """
-        with self._lock:
-            if self._debounce_timer:
-                self._debounce_timer.cancel()
+        path = os.path.abspath(path)
+        data_files = [self._app_config.data_file] + list(self._app_config.variants or [])
 
-            self._debounce_timer = threading.Timer(0.2, self._do_rebuild)
-            self._debounce_timer.daemon = True
-            self._debounce_timer.start()
+        if path in (os.path.abspath(p) for p in data_files):
+            return "data"
+        if path.startswith(os.path.abspath(self._app_config.abs_template_folder_path) + os.sep):
+            return "template"
+        if path.startswith(os.path.abspath(self._app_config.abs_asset_folder_path) + os.sep):
+            ext = os.path.splitext(path)[1].lower()
+            if ext in (".css", ".js"):
+                return ext[1:]
+            return "image" if ext in _IMAGE_EXTENSIONS else "asset"
+        return "config"
 
-    def _do_rebuild(self) -> None:
-        """Perform a rebuild of the project.
+    def _watched_paths(self) -> list[str]:
+        """Get the existing files and folders to watch for changes.
 
-        Rebuilds the project by invoking the page generator,
-        measures the build duration, and notifies WebSocket clients
-        to reload the page when complete.
+        Returns:
+            list[str]: The configuration, the data file of every variant, the templates and the assets.
         """
-        with self._lock:
+        paths = dict.fromkeys([
+            self._app_config.config_file,
+            self._app_config.data_file,
+            *(self._app_config.variants or []),
+            self._app_config.abs_template_folder_path,
+            self._app_config.abs_asset_folder_path,
+        ])
+        return [path for path in paths if os.path.exists(path)]
+
+    def _is_output(self, path: str) -> bool:
+        """Check whether a file belongs to the build output or caches.
+
+        Args:
+            path (str): Path of the file.
+
+        Returns:
+            bool: True if changes of the file must be ignored.
+        """
+        path = os.path.abspath(path)
+        for folder in (self._app_config.dist_folder, self._app_config.builds_folder,
+                       self._app_config.cache_folder):
+            for root in {os.path.abspath(folder), os.path.realpath(folder)}:
+                if path == root or path.startswith(root + os.sep):
+                    return True
+        return False
+
+    def _rebuild(self, path: str) -> None:
+        """Queue a changed file for the build worker.
+
+        Args:
+            path (str): Path of the changed file.
+        """
+        if self._is_output(path):
+            return
+        self._changes.put((path, time.perf_counter()))
+
+    def _collect_changes(self, changes: dict[str, float]) -> bool:
+        """Merge the queued changes until none arrives for the debounce delay.
+
+        Args:
+            changes (dict[str, float]): Time each changed file was first queued, keyed by path.
+
+        Returns:
+            bool: False if the server is stopping.
+        """
+        while True:
             try:
-                print("Rebuild in progress...")
-                start = time.perf_counter()
-                self._page_generator.build_page()
-                elapsed = (time.perf_counter() - start) * 1000
-                print(f"Build achieved in {elapsed:.1f} ms")
-                self._last_build_time = time.time()
-                if self._loop is not None:
-                    asyncio.run_coroutine_threadsafe(
-                        self._notify_reload(), self._loop)
-            except Exception as e:
-                print(f"Error in rebuild : {e}")
-
-    async def _notify_reload(self) -> None:
-        """Trigger a reload notification event for WebSocket clients."""
-        self._rebuild_event.set()
+                item = self._changes.get(timeout=_DEBOUNCE_DELAY)
+            except queue.Empty:
+                return True
+            if item is None:
+                return False
+            path, queued = item
+            changes.setdefault(path, queued)
+            self._stats["events"] += 1
+            self._stats["max_queue_depth"] = max(self._stats["max_queue_depth"],
+                                                 self._changes.qsize() + 1)
+
+    def _build_worker(self) -> None:
+        """Run the rebuilds, one at a time, for the queued changes.
+
+        Changes arriving together are coalesced into one build. A build is
+        cancelled between two stages when newer changes are queued, and its
+        changes are merged into the next one.
+        """
+        changes: dict[str, float] = {}
+        while True:
+            if not changes:
+                item = self._changes.get()
+                if item is None:
+                    return
+                changes[item[0]] = item[1]
+                self._stats["events"] += 1
+
+            if not self._collect_changes(changes):
+                return
+
+            try:
+                self._do_rebuild(changes)
+            except BuildCancelled:
+                self._stats["superseded"] += 1
+                print("Build superseded by newer changes")
+                continue
+            changes = {}
+
+    def _reload_message(self, changes: dict[str, str],
+                        previous: dict[str, str]) -> dict[str, Any] | None:
+        """Build the message telling the clients how to apply a rebuild.
+
+        Args:
+            changes (dict[str, str]): Kind of each changed file, keyed by path.
+            previous (dict[str, str]): Asset manifest before the rebuild.
+
+        Returns:
+            dict[str, Any] | None: A "css" message swapping stylesheets, an "image" message
+                refreshing images, a "reload" message, or None if nothing changed for the clients.
+        """
+        kinds = set(changes.values())
+
+        if kinds == {"css"}:
+            current = self._page_generator.asset_manifest
+            swaps = [{"old": path, "href": current[name]} for name, path in previous.items()
+                     if name.endswith(".css") and current.get(name, path) != path]
+            return {"type": "css", "swaps": swaps} if swaps else None
+
+        if kinds == {"image"}:
+            asset_folder = os.path.abspath(self._app_config.abs_asset_folder_path)
+            return {"type": "image",
+                    "paths": sorted(os.path.relpath(os.path.abspath(p), asset_folder).replace(os.sep, "/")
+                                    for p in changes)}
+
+        return {"type": "reload"}
+
+    def _do_rebuild(self, changes: dict[str, float]) -> None:
+        """Perform a rebuild of the project.
+
+        Only the build stages affected by the changed files are checked, then
+        WebSocket clients are told to swap stylesheets, refresh images or
+        reload the page.
+
+        Args:
+            changes (dict[str, float]): Time each changed file was first queued, keyed by path.
+
+        Raises:
+            BuildCancelled: If newer changes are queued during the build.
+        """
+        kinds = {path: self._classify(path) for path in changes}
+        stages = set()
+        for kind in set(kinds.values()):
+            if _CHANGE_STAGES[kind] is None:
+                stages = None
+                break
+            stages |= _CHANGE_STAGES[kind]
+
+        print(f"Rebuild in progress ({len(changes)} change(s) : {', '.join(sorted(set(kinds.values())))})...")
+        previous = dict(self._page_generator.asset_manifest)
+        start = time.perf_counter()
+        try:
+            self._page_generator.build_page(stages=stages,
+                                            cancelled=lambda: not self._changes.empty())
+        except BuildCancelled:
+            raise
+        except Exception as e:
+            print(f"Error in rebuild : {e}")
+            return
+
+        end = time.perf_counter()
+        self._stats["builds"] += 1
+        self._stats["last_build_ms"] = (end - start) * 1000
+        self._stats["last_latency_ms"] = (end - min(changes.values())) * 1000
+        print(f"Build achieved in {self._stats['last_build_ms']:.1f} ms "
+              f"({self._stats['last_latency_ms']:.0f} ms after the first change)")
+        self._last_build_time = time.time()
+
+        message = self._reload_message(kinds, previous)
+        if message is not None and self._loop is not None:
+            asyncio.run_coroutine_threadsafe(
+                self._notify_reload(message), self._loop)
+
+    @property
+    def stats(self) -> dict[str, Any]:
+        """Get the statistics of the rebuild loop.
+
+        Returns:
+            dict[str, Any]: Numbers of builds, superseded builds and file events, the largest
+                queue depth, and the duration and latency of the last build in milliseconds.
+        """
+        return dict(self._stats)
+
+    @property
+    def client_count(self) -> int:
+        """Get the number of connected live reload clients.
+
+        Returns:
+            int: The number of clients.
+        """
+        return self._hub.client_count
+
+    async def _notify_reload(self, message: dict[str, Any]) -> None:
+        """Send a reload message to every WebSocket client.
+
+        Args:
+            message (dict[str, Any]): Message sent to the clients.
+        """
+        await self._hub.broadcast(json.dumps(message))
 
     def serve(self) -> None:
         """Start the HTTP and WebSocket development server.
 
         This method:
-        - Watches project directories for file changes.
+        - Watches the configuration, the data files of every variant, the templates
+          and the assets for changes.
         - Serves the generated HTML via HTTP.
         - Hosts a WebSocket server for live-reload communication.
         """
         # Watcher setup
         event_handler = ChangeHandler(self._rebuild)
         self._observer = Observer()
-        for path in [
-            self._app_config.config_file,
-            self._app_config.data_file,
-            self._app_config.abs_template_folder_path,
-            self._app_config.abs_asset_folder_path,
-        ]:
-            if os.path.exists(path):
-                self._observer.schedule(event_handler, path, recursive=True)
+        for path in self._watched_paths():
+            self._observer.schedule(event_handler, path, recursive=True)
         self._observer.start()
 
+        self._worker = threading.Thread(target=self._build_worker, daemon=True)
+        self._worker.start()
+
         # HTTP Server setup
-        handler = partial(SimpleHTTPRequestHandler,
-                          directory=self._app_config.dist_folder)
-        server = HTTPServer((self._app_config.server_host,
-                            self._app_config.server_port), handler)
+        memory_output = self._page_generator.memory_output
+        handler_options = {"cache": ResponseCache(),
+                           "fingerprint_length": self._app_config.fingerprint_length}
+        if memory_output is not None:
+            handler = partial(MemoryRequestHandler, memory_output=memory_output, **handler_options)
+        else:
+            handler = partial(DevRequestHandler, directory=self._app_config.dist_folder,
+                              **handler_options)
+        server = ThreadingHTTPServer((self._app_config.server_host,
+                                      self._app_config.server_port), handler)
         self._server_thread = threading.Thread(
             target=server.serve_forever, daemon=True)
         self._server_thread.start()
 
-        print(f"HTTP : http://{self._app_config.server_host}:{self._app_config.server_port}")
+        print(f"HTTP : http://{self._app_config.server_host}:{self._app_config.server_port}"
+              + (" (served from memory)" if memory_output is not None else ""))
         print(f"WebSocket : ws://{self._app_config.server_host}:{self._app_config.server_websocket_port}")
         print(f"Watcher active on : {self._app_config.abs_template_folder_path}, {self._app_config.abs_asset_folder_path}")
 
@@ -115,29 +328,20 @@ class DevServer():
         finally:
             self._observer.stop()
             self._observer.join()
+            self._changes.put(None)
             server.shutdown()
             print("Server correctly stopped.")
 
     async def _ws_server(self) -> None:
         """Run the WebSocket server for live reload events.
 
-        Handles client connections and sends "reload" messages when rebuilds occur.
+        Client connections are kept in the broadcast hub, which sends them
+        the reload messages when rebuilds occur.
         """
         self._loop = asyncio.get_event_loop()
 
-        async def handler(websocket):
-            print(f"New client : {websocket.remote_address}")
-            try:
-                while not self._stop_event.is_set():
-                    await self._rebuild_event.wait()
-                    await asyncio.sleep(0.2)
-                    await websocket.send("reload")
-                    print("Reload sent to client.")
-                    self._rebuild_event.clear()
-            except Exception as e:
-                print(f"Deconnexion of WebSocket : {e}")
-
-        async with websockets.serve(handler, self._app_config.server_host, self._app_config.server_websocket_port):
+        async with websockets.serve(self._hub.handler, self._app_config.server_host,
+                                    self._app_config.server_websocket_port):
             await asyncio.Future()
 
 
@@ -148,7 +352,7 @@ class ChangeHandler(FileSystemEventHandler):
         """Initialize the change handler.
 
         Args:
-            rebuild_callback (Callable): The callback function to invoke on file change.
+            rebuild_callback (Callable): The callback function to invoke with the path of a changed file.
         """
         super().__init__()
         self.rebuild_callback = rebuild_callback
@@ -159,8 +363,257 @@ class ChangeHandler(FileSystemEventHandler):
         Args:
             event (FileSystemEvent): The file system event detected by watchdog.
         """
-        if not event.is_directory:
-            if event.src_path.endswith(("~", ".swp", ".tmp")):
+        if not event.is_directory and event.event_type in _WATCHED_EVENTS:
+            path = getattr(event, "dest_path", "") or event.src_path
+            if path.endswith(("~", ".swp", ".tmp")):
                 return
-            print(f"Change detected : {event.src_path}")
-            self.rebuild_callback()
+            print(f"Change detected : {path}")
+            self.rebuild_callback(path)
+
+
+class ResponseCache():
+    """Cache of the entity tags and compressed bodies of the development server.
+
+    Entity tags of files on disk are kept per path, as long as the file size
+    and modification time are unchanged, for the most recently served files.
+    Compressed bodies are keyed by the entity tag of their content, so they
+    stay valid across rebuilds.
+    """
+
+    def __init__(self, max_entries: int = 64, max_files: int = 1024) -> None:
+        """Initialize an empty cache.
+
+        Args:
+            max_entries (int, optional): Number of compressed bodies kept. Defaults to 64.
+            max_files (int, optional): Number of file entity tags kept. Defaults to 1024.
+        """
+        self._max_entries = max_entries
+        self._max_files = max_files
+        self._file_etags: OrderedDict[str, tuple[int, int, str]] = OrderedDict()
+        self._compressed: OrderedDict[str, bytes] = OrderedDict()
+        self._lock = threading.Lock()
+
+    @staticmethod
+    def content_etag(data: bytes) -> str:
+        """Compute the strong entity tag of a content.
+
+        Args:
+            data (bytes): The content.
+
+        Returns:
+            str: The quoted entity tag.
+        """
+        return f'"{hashlib.sha256(data).hexdigest()[:20]}"'
+
+    def file_etag(self, path: str) -> str:
+        """Get the strong entity tag of a file, hashing it only when it changed.
+
+        Args:
+            path (str): Path of the file.
+
+        Returns:
+            str: The quoted entity tag.
+
+        Raises:
+            OSError: If the file cannot be read.
+        """
+        stat = os.stat(path)
+        with self._lock:
+            entry = self._file_etags.get(path)
+            if entry is not None and entry[:2] == (stat.st_size, stat.st_mtime_ns):
+                self._file_etags.move_to_end(path)
+                return entry[2]
+
+        with open(path, "rb") as file:
+            etag = self.content_etag(file.read())
+        with self._lock:
+            self._file_etags[path] = (stat.st_size, stat.st_mtime_ns, etag)
+            self._file_etags.move_to_end(path)
+            while len(self._file_etags) > self._max_files:
+                self._file_etags.popitem(last=False)
+        return etag
+
+    def gzip(self, etag: str, data: bytes) -> bytes:
+        """Get the gzip-compressed body of a content.
+
+        Args:
+            etag (str): Entity tag of the content.
+            data (bytes): The content.
+
+        Returns:
+            bytes: The compressed content.
+        """
+        with self._lock:
+            body = self._compressed.get(etag)
+            if body is not None:
+                self._compressed.move_to_end(etag)
+                return body
+
+        body = gzip.compress(data, compresslevel=6, mtime=0)
+        with self._lock:
+            self._compressed[etag] = body
+            while len(self._compressed) > self._max_entries:
+                self._compressed.popitem(last=False)
+        return body
+
+
+class DevRequestHandler(SimpleHTTPRequestHandler):
+    """HTTP request handler of the development server.
+
+    Responses carry a strong entity tag derived from their content, so
+    reloads get '304 Not Modified' for unchanged files. Text responses are
+    gzip-compressed for clients that accept it, and fingerprinted files are
+    cached by the browser for good.
+    """
+
+    protocol_version = "HTTP/1.1"
+
+    _COMPRESSED_TYPES = ("text/", "application/javascript", "application/json",
+                         "application/xml", "image/svg+xml")
+
+    _MIN_COMPRESS_SIZE = 1024
+
+    def __init__(self, *args, cache: ResponseCache, fingerprint_length: int, **kwargs) -> None:
+        """Initialize the request handler.
+
+        Args:
+            cache (ResponseCache): Cache shared by every request.
+            fingerprint_length (int): Length of the content hash in fingerprinted file names.
+        """
+        self._cache = cache
+        self._immutable = re.compile(rf"\.[0-9a-f]{{{fingerprint_length}}}\.\w+(\.map)?$")
+        super().__init__(*args, **kwargs)
+
+    def _lookup(self) -> tuple[str, bytes | str | None]:
+        """Find the file of the requested URL in the served folder.
+
+        Returns:
+            tuple[str, bytes | str | None]: The file name, used for its content type, and
+                the path of the file, or None if missing.
+        """
+        path = self.translate_path(self.path)
+        if os.path.isdir(path):
+            path = os.path.join(path, "index.html")
+        return path, path if os.path.isfile(path) else None
+
+    def _is_modified(self, etags: list[str]) -> bool:
+        """Check the If-None-Match header of the request.
+
+        Args:
+            etags (list[str]): Entity tags of the representations of the file.
+
+        Returns:
+            bool: False if the client already has one of the representations.
+        """
+        header = self.headers.get("If-None-Match")
+        if not header:
+            return True
+        tags = [tag.strip().removeprefix("W/") for tag in header.split(",")]
+        return not ("*" in tags or any(etag in tags for etag in etags))
+
+    def send_head(self):
+        """Send the response headers of a GET or HEAD request.
+
+        Returns:
+            BinaryIO | None: The body to send, or None if there is none.
+        """
+        name, entry = self._lookup()
+        if entry is None:
+            self.send_error(HTTPStatus.NOT_FOUND, "File not found")
+            return None
+
+        try:
+            if isinstance(entry, str):
+                etag = self._cache.file_etag(entry)
+            else:
+                etag = self._cache.content_etag(entry)
+        except OSError:
+            self.send_error(HTTPStatus.NOT_FOUND, "File not found")
+            return None
+
+        content_type = self.guess_type(name)
+        compressible = content_type.startswith(self._COMPRESSED_TYPES)
+        gzip_etag = f'{etag[:-1]}-gzip"'
+        use_gzip = compressible and "gzip" in self.headers.get("Accept-Encoding", "")
+
+        if not self._is_modified([etag, gzip_etag]):
+            self.send_response(HTTPStatus.NOT_MODIFIED)
+            self._send_cache_headers(name, gzip_etag if use_gzip else etag, compressible)
+            self.end_headers()
+            return None
+
+        if isinstance(entry, str):
+            try:
+                with open(entry, "rb") as file:
+                    body = file.read()
+            except OSError:
+                self.send_error(HTTPStatus.NOT_FOUND, "File not found")
+                return None
+        else:
+            body = entry
+
+        use_gzip = use_gzip and len(body) >= self._MIN_COMPRESS_SIZE
+        if use_gzip:
+            body = self._cache.gzip(etag, body)
+
+        self.send_response(HTTPStatus.OK)
+        self.send_header("Content-type", content_type)
+        self.send_header("Content-Length", str(len(body)))
+        if use_gzip:
+            self.send_header("Content-Encoding", "gzip")
+        self._send_cache_headers(name, gzip_etag if use_gzip else etag, compressible)
+        self.end_headers()
+        return io.BytesIO(body)
+
+    def _send_cache_headers(self, name: str, etag: str, compressible: bool) -> None:
+        """Send the validation and caching headers of a file.
+
+        Args:
+            name (str): File name.
+            etag (str): Entity tag of the representation sent.
+            compressible (bool): Whether the representation depends on Accept-Encoding.
+        """
+        self.send_header("ETag", etag)
+        if self._immutable.search(name):
+            self.send_header("Cache-Control", "public, max-age=31536000, immutable")
+        else:
+            self.send_header("Cache-Control", "no-cache")
+        if compressible:
+            self.send_header("Vary", "Accept-Encoding")
+
+
+class MemoryRequestHandler(DevRequestHandler):
+    """HTTP request handler serving the in-memory output of the page generator.
+
+    Generated files are sent from memory, and referenced files (unchanged
+    assets, image derivatives) are read from their source on disk.
+    """
+
+    def __init__(self, *args, memory_output, **kwargs) -> None:
+        """Initialize the request handler.
+
+        Args:
+            memory_output (MemoryOutput): The in-memory output to serve.
+        """
+        self._memory_output = memory_output
+        super().__init__(*args, **kwargs)
+
+    def _lookup(self) -> tuple[str, bytes | str | None]:
+        """Find the file of the requested URL in the in-memory output.
+
+        Returns:
+            tuple[str, bytes | str | None]: The file path relative to the output folder, and
+                its content, the path of the referenced file, or None if missing.
+        """
+        path = posixpath.normpath(unquote(urlsplit(self.path).path)).lstrip("/")
+        if path in ("", "."):
+            path = "index.html"
+
+        entry = self._memory_output.lookup(path)
+        if entry is None:
+            index = posixpath.join(path, "index.html")
+            entry = self._memory_output.lookup(index)
+            if entry is not None:
+                path = index
+
+        return path, entry
@@ -0,0 +1,268 @@
+from contextlib import contextmanager
+import glob
+import hashlib
+import os
+import shutil
+from typing import Any, Iterator, TextIO
+
+try:
+    import fcntl
+except ImportError:
+    fcntl = None
+
+_FICLONE = 0x40049409
+
+
+class DiskOutput():
+    """Output folder on disk.
+
+    Files are addressed by their path relative to the output folder, with the
+    same methods as MemoryOutput, so the page generator writes to both alike.
+    New files are written to a temporary file and atomically renamed, so a
+    file shared with another build through a hardlink is never modified.
+    """
+
+    def __init__(self, root: str, link_files: bool = True, verify_hash: bool = False) -> None:
+        """Initialize the output.
+
+        Args:
+            root (str): Path of the output folder.
+            link_files (bool, optional): Hardlink or reflink copied files when possible. Defaults to True.
+            verify_hash (bool, optional): Compare copied files by content hash rather than
+                by modification time. Defaults to False.
+        """
+        self._root = root
+        self._link_files = link_files
+        self._verify_hash = verify_hash
+
+    @property
+    def root(self) -> str:
+        """Get the path of the folder written to.
+
+        Returns:
+            str: The folder path.
+        """
+        return self._root
+
+    def _path(self, rel_path: str) -> str:
+        """Get the path of a file on disk.
+
+        Args:
+            rel_path (str): File path, relative to the output folder.
+
+        Returns:
+            str: The file path.
+        """
+        return os.path.join(self.root, rel_path)
+
+    @contextmanager
+    def open(self, rel_path: str, append: bool = False, buffering: int = -1) -> Iterator[TextIO]:
+        """Open a text file for writing.
+
+        Args:
+            rel_path (str): File path, relative to the output folder.
+            append (bool, optional): Append to the file, which must be a new one. Defaults to False.
+            buffering (int, optional): Buffer size of the file. Defaults to -1.
+
+        Yields:
+            TextIO: The file to write to.
+        """
+        path = self._path(rel_path)
+        if append:
+            with open(file=path, mode="a", encoding="utf-8") as file:
+                yield file
+            return
+
+        os.makedirs(os.path.dirname(path) or ".", exist_ok=True)
+        tmp_path = f"{path}.{os.getpid()}.tmp"
+        with open(file=tmp_path, mode="w", encoding="utf-8", buffering=buffering) as file:
+            yield file
+        os.replace(tmp_path, path)
+
+    def write(self, rel_path: str, data: bytes) -> None:
+        """Write the content of a file.
+
+        Args:
+            rel_path (str): File path, relative to the output folder.
+            data (bytes): File content.
+        """
+        path = self._path(rel_path)
+        os.makedirs(os.path.dirname(path) or ".", exist_ok=True)
+        tmp_path = f"{path}.{os.getpid()}.tmp"
+        with open(tmp_path, "wb") as file:
+            file.write(data)
+        os.replace(tmp_path, path)
+
+    def link(self, rel_path: str, src_path: str) -> str:
+        """Create a file as a copy of an existing file.
+
+        Hardlinks are tried first, then reflinks, then a regular copy.
+
+        Args:
+            rel_path (str): File path, relative to the output folder.
+            src_path (str): Path of the source file.
+
+        Returns:
+            str: The method used ("linked", "cloned" or "copied").
+        """
+        dst_path = self._path(rel_path)
+        os.makedirs(os.path.dirname(dst_path), exist_ok=True)
+        if os.path.lexists(dst_path):
+            os.remove(dst_path)
+
+        if self._link_files:
+            try:
+                os.link(src_path, dst_path)
+                return "linked"
+            except OSError:
+                pass
+
+            if self._reflink(src_path, dst_path):
+                return "cloned"
+
+        shutil.copy2(src_path, dst_path)
+        return "copied"
+
+    def _reflink(self, src_path: str, dst_path: str) -> bool:
+        """Clone a file with a copy-on-write reflink when the filesystem supports it.
+
+        Args:
+            src_path (str): Source file path.
+            dst_path (str): Destination file path.
+
+        Returns:
+            bool: True if the reflink was created.
+        """
+        if fcntl is None:
+            return False
+
+        try:
+            with open(src_path, "rb") as src, open(dst_path, "wb") as dst:
+                fcntl.ioctl(dst.fileno(), _FICLONE, src.fileno())
+        except OSError:
+            if os.path.exists(dst_path):
+                os.remove(dst_path)
+            return False
+
+        shutil.copystat(src_path, dst_path)
+        return True
+
+    def is_linked(self, rel_path: str, src_path: str) -> bool:
+        """Check whether a file is identical to the file it was copied from.
+
+        Files are compared by inode, then by size and modification time, or
+        by content hash.
+
+        Args:
+            rel_path (str): File path, relative to the output folder.
+            src_path (str): Path of the source file.
+
+        Returns:
+            bool: True if the file does not need to be copied again.
+        """
+        dst_path = self._path(rel_path)
+        try:
+            src_stat = os.stat(src_path)
+            dst_stat = os.stat(dst_path)
+        except OSError:
+            return False
+
+        if (src_stat.st_dev, src_stat.st_ino) == (dst_stat.st_dev, dst_stat.st_ino):
+            return True
+
+        if src_stat.st_size != dst_stat.st_size:
+            return False
+
+        if self._verify_hash:
+            with open(src_path, "rb") as src, open(dst_path, "rb") as dst:
+                return (hashlib.file_digest(src, "sha256").digest()
+                        == hashlib.file_digest(dst, "sha256").digest())
+
+        return src_stat.st_mtime_ns == dst_stat.st_mtime_ns
+
+    def remove(self, rel_path: str) -> bool:
+        """Remove a file.
+
+        Args:
+            rel_path (str): File path, relative to the output folder.
+
+        Returns:
+            bool: True if the file existed.
+        """
+        try:
+            os.remove(self._path(rel_path))
+            return True
+        except FileNotFoundError:
+            return False
+
+    def rename(self, src_rel_path: str, dst_rel_path: str) -> None:
+        """Move a file, replacing the destination.
+
+        Args:
+            src_rel_path (str): Source path, relative to the output folder.
+            dst_rel_path (str): Destination path, relative to the output folder.
+
+        Raises:
+            FileNotFoundError: If the source does not exist.
+        """
+        os.replace(self._path(src_rel_path), self._path(dst_rel_path))
+
+    def exists(self, rel_path: str) -> bool:
+        """Check whether a file exists.
+
+        Args:
+            rel_path (str): File path, relative to the output folder.
+
+        Returns:
+            bool: True if the file exists.
+        """
+        return os.path.exists(self._path(rel_path))
+
+    def read(self, rel_path: str) -> bytes:
+        """Read a file.
+
+        Args:
+            rel_path (str): File path, relative to the output folder.
+
+        Returns:
+            bytes: The file content.
+
+        Raises:
+            FileNotFoundError: If the file does not exist.
+        """
+        with open(self._path(rel_path), "rb") as file:
+            return file.read()
+
+    def size(self, rel_path: str) -> int:
+        """Get the size of a file.
+
+        Args:
+            rel_path (str): File path, relative to the output folder.
+
+        Returns:
+            int: Size in bytes.
+        """
+        return os.path.getsize(self._path(rel_path))
+
+    def digest(self, rel_path: str) -> Any:
+        """Hash a file.
+
+        Args:
+            rel_path (str): File path, relative to the output folder.
+
+        Returns:
+            Any: The SHA-256 hash object, which can still be updated.
+        """
+        with open(self._path(rel_path), "rb") as file:
+            return hashlib.file_digest(file, "sha256")
+
+    def glob(self, pattern: str) -> list[str]:
+        """List the files matching a pattern.
+
+        Args:
+            pattern (str): Glob pattern, relative to the output folder.
+
+        Returns:
+            list[str]: Paths of the matching files, relative to the output folder.
+        """
+        return [os.path.relpath(path, self.root) for path in glob.glob(self._path(pattern))]
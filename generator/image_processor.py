@@ -0,0 +1,184 @@
+from concurrent.futures import ProcessPoolExecutor
+import json
+import os
+from typing import Any
+
+try:
+    from PIL import Image, ImageOps
+except ImportError:
+    Image = None
+    ImageOps = None
+
+
+FORMAT_EXTENSIONS = {
+    "jpeg": ".jpg",
+    "png": ".png",
+    "webp": ".webp",
+    "avif": ".avif",
+}
+
+FORMAT_MIME_TYPES = {
+    "jpeg": "image/jpeg",
+    "png": "image/png",
+    "webp": "image/webp",
+    "avif": "image/avif",
+}
+
+
+def _generate_derivatives(src_path: str, cache_dir: str, widths: list[int],
+                          formats: list[str], quality: int) -> dict[str, Any]:
+    """Generate the resized derivatives of one image into its cache folder.
+
+    This function runs in a worker process.
+
+    Args:
+        src_path (str): Source image path.
+        cache_dir (str): Cache folder of this source image.
+        widths (list[int]): Target widths, larger than the original ones are skipped.
+        formats (list[str]): Target formats, in addition to the original format.
+        quality (int): Encoding quality of lossy formats.
+
+    Returns:
+        dict[str, Any]: Image metadata with the original size and the derivatives per format.
+    """
+    os.makedirs(cache_dir, exist_ok=True)
+
+    with Image.open(src_path) as img:
+        original_format = (img.format or "jpeg").lower()
+        img = ImageOps.exif_transpose(img)
+        width, height = img.size
+
+        target_widths = sorted({w for w in widths if w < width} | {width})
+        derivatives: dict[str, list[dict[str, Any]]] = {}
+
+        for fmt in dict.fromkeys([*formats, original_format]):
+            if fmt not in FORMAT_EXTENSIONS:
+                continue
+            derivatives[fmt] = []
+            for target_width in target_widths:
+                target_height = max(1, round(height * target_width / width))
+                file_name = f"{target_width}{FORMAT_EXTENSIONS[fmt]}"
+                resized = img if target_width == width else img.resize(
+                    (target_width, target_height), Image.Resampling.LANCZOS)
+                if fmt == "jpeg" and resized.mode not in ("RGB", "L"):
+                    resized = resized.convert("RGB")
+                resized.save(os.path.join(cache_dir, file_name),
+                             format=fmt.upper(), quality=quality, optimize=True)
+                derivatives[fmt].append({"width": target_width, "file": file_name})
+
+    meta = {
+        "width": width,
+        "height": height,
+        "format": original_format,
+        "derivatives": derivatives,
+    }
+
+    with open(file=os.path.join(cache_dir, "meta.json"), mode="w", encoding="utf-8") as file:
+        json.dump(meta, file)
+
+    return meta
+
+
+class ImageProcessor():
+    """Generator of resized and re-encoded image derivatives.
+
+    Derivatives are cached by source hash, so they are only regenerated when
+    the original image changes. Missing derivatives are generated in a
+    process pool.
+    """
+
+    def __init__(self, cache_folder: str, widths: list[int], formats: list[str],
+                 quality: int = 80, workers: int | None = None) -> None:
+        """Initialize the image processor.
+
+        Args:
+            cache_folder (str): Folder of the derivative cache.
+            widths (list[int]): Target widths.
+            formats (list[str]): Target formats (e.g. "webp"), in addition to the original format.
+            quality (int, optional): Encoding quality of lossy formats. Defaults to 80.
+            workers (int | None, optional): Number of worker processes. Defaults to None.
+        """
+        self._cache_folder = cache_folder
+        self._widths = widths
+        self._formats = formats
+        self._quality = quality
+        self._workers = workers
+
+    @staticmethod
+    def is_available() -> bool:
+        """Check whether Pillow is installed.
+
+        Returns:
+            bool: True if images can be processed.
+        """
+        return Image is not None
+
+    def _cache_dir(self, src_hash: str) -> str:
+        """Get the cache folder of a source image.
+
+        Args:
+            src_hash (str): Content hash of the source image.
+
+        Returns:
+            str: The cache folder, keyed by source hash and settings.
+        """
+        settings = "-".join([str(self._quality), *map(str, sorted(self._widths)), *self._formats])
+        return os.path.join(self._cache_folder, f"{src_hash}-{settings}")
+
+    def _read_meta(self, cache_dir: str) -> dict[str, Any] | None:
+        """Read the cached metadata of a source image.
+
+        Args:
+            cache_dir (str): Cache folder of the source image.
+
+        Returns:
+            dict[str, Any] | None: The metadata, or None if the derivatives are missing.
+        """
+        try:
+            with open(file=os.path.join(cache_dir, "meta.json"), mode="r", encoding="utf-8") as file:
+                return json.load(file)
+        except (OSError, ValueError):
+            return None
+
+    def process(self, sources: dict[str, str]) -> dict[str, dict[str, Any]]:
+        """Get the derivatives of several images, generating the missing ones.
+
+        Args:
+            sources (dict[str, str]): Mapping of source image paths to their content hash.
+
+        Returns:
+            dict[str, dict[str, Any]]: Mapping of source image paths to their metadata. Each
+                derivative entry gets a "path" key pointing to the cached file.
+        """
+        results: dict[str, dict[str, Any]] = {}
+        pending: dict[str, str] = {}
+
+        for src_path, src_hash in sources.items():
+            cache_dir = self._cache_dir(src_hash)
+            meta = self._read_meta(cache_dir)
+            if meta is None:
+                pending[src_path] = cache_dir
+            else:
+                results[src_path] = meta
+
+        if pending:
+            print(f"Images : generating derivatives of {len(pending)} image(s)")
+            with ProcessPoolExecutor(max_workers=self._workers) as executor:
+                futures = {
+                    src_path: executor.submit(_generate_derivatives, src_path, cache_dir,
+                                              self._widths, self._formats, self._quality)
+                    for src_path, cache_dir in pending.items()
+                }
+                for src_path, future in futures.items():
+                    try:
+                        results[src_path] = future.result()
+                    except Exception as e:
+                        print(f"Unable to process image {src_path}: {e}")
+
+        for src_path, meta in results.items():
+            cache_dir = self._cache_dir(sources[src_path])
+            for derivatives in meta["derivatives"].values():
+                for derivative in derivatives:
+                    derivative["path"] = os.path.join(cache_dir, derivative["file"])
+
+        return results
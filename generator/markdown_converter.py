@@ -0,0 +1,156 @@
+from collections import OrderedDict
+import hashlib
+import os
+import markdown
+
+
+class MarkdownConverter():
+    """Reusable Markdown to HTML converter with a content-addressed cache.
+
+    A single Markdown instance is kept and reset between documents. Converted
+    documents are memoized in an in-memory LRU cache and, optionally, on disk,
+    keyed by the hash of the source text. The on-disk cache is pruned to its
+    most recently used documents.
+    """
+
+    def __init__(self, cache_size: int = 1024, cache_folder: str | None = None,
+                 disk_cache_size: int = 4096) -> None:
+        """Initialize the converter.
+
+        Args:
+            cache_size (int, optional): Maximum number of documents kept in memory. Defaults to 1024.
+            cache_folder (str | None, optional): Folder of the on-disk cache, disabled if None. Defaults to None.
+            disk_cache_size (int, optional): Maximum number of documents kept on disk. Defaults to 4096.
+        """
+        self._md = markdown.Markdown()
+        self._cache: OrderedDict[str, str] = OrderedDict()
+        self._cache_size = cache_size
+        self._cache_folder = cache_folder
+        self._disk_cache_size = disk_cache_size
+        self.hits = 0
+        self.misses = 0
+
+        if self._cache_folder:
+            os.makedirs(self._cache_folder, exist_ok=True)
+
+    def _key(self, text: str) -> str:
+        """Compute the cache key of a source text.
+
+        Args:
+            text (str): Markdown source.
+
+        Returns:
+            str: SHA-256 hex digest of the Markdown version and source text.
+        """
+        h = hashlib.sha256(markdown.__version__.encode("utf-8"))
+        h.update(b"\0")
+        h.update(text.encode("utf-8"))
+        return h.hexdigest()
+
+    def _read_disk_cache(self, key: str) -> str | None:
+        """Read a converted document from the on-disk cache.
+
+        Args:
+            key (str): Cache key of the document.
+
+        Returns:
+            str | None: The cached HTML, or None if missing.
+        """
+        if not self._cache_folder:
+            return None
+
+        path = os.path.join(self._cache_folder, f"{key}.html")
+        try:
+            with open(file=path, mode="r", encoding="utf-8") as file:
+                html = file.read()
+            # The modification time orders the documents for pruning
+            os.utime(path)
+            return html
+        except OSError:
+            return None
+
+    def _write_disk_cache(self, key: str, html: str) -> None:
+        """Write a converted document to the on-disk cache.
+
+        Args:
+            key (str): Cache key of the document.
+            html (str): Converted HTML.
+        """
+        if not self._cache_folder:
+            return
+
+        path = os.path.join(self._cache_folder, f"{key}.html")
+        tmp_path = f"{path}.{os.getpid()}.tmp"
+        try:
+            with open(file=tmp_path, mode="w", encoding="utf-8") as file:
+                file.write(html)
+            os.replace(tmp_path, path)
+        except OSError as e:
+            print(f"Unable to write Markdown cache {path}: {e}")
+
+    def convert(self, text: str) -> str:
+        """Convert a Markdown document to HTML.
+
+        Args:
+            text (str): Markdown source.
+
+        Returns:
+            str: The converted HTML.
+        """
+        key = self._key(text)
+
+        html = self._cache.get(key)
+        if html is not None:
+            self._cache.move_to_end(key)
+            self.hits += 1
+            return html
+
+        html = self._read_disk_cache(key)
+        if html is not None:
+            self.hits += 1
+        else:
+            self.misses += 1
+            html = self._md.reset().convert(text)
+            self._write_disk_cache(key, html)
+
+        self._cache[key] = html
+        if len(self._cache) > self._cache_size:
+            self._cache.popitem(last=False)
+
+        return html
+
+    def prune_disk_cache(self) -> int:
+        """Remove the least recently used documents beyond the size of the on-disk cache.
+
+        Returns:
+            int: The number of removed documents.
+        """
+        if not self._cache_folder:
+            return 0
+
+        entries = []
+        with os.scandir(self._cache_folder) as it:
+            for entry in it:
+                if entry.name.endswith(".html"):
+                    try:
+                        entries.append((entry.stat().st_mtime_ns, entry.path))
+                    except OSError:
+                        pass
+
+        if len(entries) <= self._disk_cache_size:
+            return 0
+
+        entries.sort()
+        removed = 0
+        for _, path in entries[:len(entries) - self._disk_cache_size]:
+            try:
+                os.remove(path)
+                removed += 1
+            except OSError:
+                pass
+        return removed
+
+    def reset_stats(self) -> None:
+        """Reset the hit and miss counters."""
+        self.hits = 0
+        self.misses = 0
@@ -0,0 +1,259 @@
+from contextlib import contextmanager
+import fnmatch
+import hashlib
+import io
+import os
+import posixpath
+import threading
+from typing import Any, Iterator, TextIO
+
+
+class MemoryOutput():
+    """In-memory output folder for the development server.
+
+    Generated files (pages, bundles, manifests) are stored as bytes, and files
+    that are copies of existing ones (extra assets, image derivatives) are
+    stored as references to their source path, so a build never writes to
+    disk. Like StagedOutput, each build fills a staging generation that
+    replaces the served one in a single assignment. Files are addressed with
+    the same methods as DiskOutput.
+    """
+
+    def __init__(self, root: str) -> None:
+        """Initialize an empty in-memory output.
+
+        Args:
+            root (str): Virtual path of the output folder, used by the page generator.
+        """
+        self._root = root
+        self._files: dict[str, bytes | str] = {}
+        self._staging: dict[str, bytes | str] | None = None
+        self._lock = threading.Lock()
+
+    @property
+    def root(self) -> str:
+        """Get the virtual path of the output folder.
+
+        Returns:
+            str: The virtual path.
+        """
+        return self._root
+
+    def prepare(self) -> str:
+        """Start a staging generation holding the files of the current one.
+
+        Returns:
+            str: Virtual path of the output folder.
+        """
+        with self._lock:
+            self._staging = dict(self._files)
+        return self._root
+
+    def commit(self) -> None:
+        """Make the staging generation the served one."""
+        with self._lock:
+            if self._staging is not None:
+                self._files = self._staging
+                self._staging = None
+
+    def abort(self) -> None:
+        """Drop the staging generation of a failed build."""
+        with self._lock:
+            self._staging = None
+
+    def _target(self) -> dict[str, bytes | str]:
+        """Get the generation written to.
+
+        Returns:
+            dict[str, bytes | str]: The staging generation during a build, the served one otherwise.
+        """
+        return self._files if self._staging is None else self._staging
+
+    @staticmethod
+    def _key(rel_path: str) -> str:
+        """Normalize a file path into the key of the file.
+
+        Args:
+            rel_path (str): File path, relative to the output folder.
+
+        Returns:
+            str: The normalized path, with '/' separators.
+        """
+        return posixpath.normpath(rel_path.replace(os.sep, "/"))
+
+    @contextmanager
+    def open(self, rel_path: str, append: bool = False, buffering: int = -1) -> Iterator[TextIO]:
+        """Open a text file for writing, stored once closed.
+
+        Args:
+            rel_path (str): File path, relative to the output folder.
+            append (bool, optional): Append to the file. Defaults to False.
+            buffering (int, optional): Ignored, for compatibility with DiskOutput. Defaults to -1.
+
+        Yields:
+            TextIO: The file to write to.
+        """
+        file = io.StringIO()
+        if append and self.exists(rel_path):
+            file.write(self.read(rel_path).decode("utf-8"))
+        yield file
+        self.write(rel_path, file.getvalue().encode("utf-8"))
+
+    def write(self, rel_path: str, data: bytes) -> None:
+        """Store the content of a file.
+
+        Args:
+            rel_path (str): File path, relative to the output folder.
+            data (bytes): File content.
+        """
+        self._target()[self._key(rel_path)] = data
+
+    def link(self, rel_path: str, src_path: str) -> str:
+        """Store a file as a reference to an existing file.
+
+        Args:
+            rel_path (str): File path, relative to the output folder.
+            src_path (str): Path of the file on disk.
+
+        Returns:
+            str: The method used, always "referenced".
+        """
+        self._target()[self._key(rel_path)] = os.path.abspath(src_path)
+        return "referenced"
+
+    def is_linked(self, rel_path: str, src_path: str) -> bool:
+        """Check whether a file is a reference to an existing file.
+
+        Args:
+            rel_path (str): File path, relative to the output folder.
+            src_path (str): Path of the file on disk.
+
+        Returns:
+            bool: True if the file references the source file.
+        """
+        return self.get(rel_path) == os.path.abspath(src_path)
+
+    def remove(self, rel_path: str) -> bool:
+        """Remove a file.
+
+        Args:
+            rel_path (str): File path, relative to the output folder.
+
+        Returns:
+            bool: True if the file existed.
+        """
+        return self._target().pop(self._key(rel_path), None) is not None
+
+    def rename(self, src_rel_path: str, dst_rel_path: str) -> None:
+        """Move a file, replacing the destination.
+
+        Args:
+            src_rel_path (str): Source path, relative to the output folder.
+            dst_rel_path (str): Destination path, relative to the output folder.
+
+        Raises:
+            FileNotFoundError: If the source does not exist.
+        """
+        files = self._target()
+        src_key = self._key(src_rel_path)
+        if src_key not in files:
+            raise FileNotFoundError(src_rel_path)
+        files[self._key(dst_rel_path)] = files.pop(src_key)
+
+    def exists(self, rel_path: str) -> bool:
+        """Check whether a file exists in the generation written to.
+
+        Args:
+            rel_path (str): File path, relative to the output folder.
+
+        Returns:
+            bool: True if the file exists.
+        """
+        return self._key(rel_path) in self._target()
+
+    def get(self, rel_path: str) -> bytes | str | None:
+        """Get a file of the generation written to.
+
+        Args:
+            rel_path (str): File path, relative to the output folder.
+
+        Returns:
+            bytes | str | None: The content, the path of the referenced file, or None if missing.
+        """
+        return self._target().get(self._key(rel_path))
+
+    def read(self, rel_path: str) -> bytes:
+        """Read a file of the generation written to, following references.
+
+        Args:
+            rel_path (str): File path, relative to the output folder.
+
+        Returns:
+            bytes: The file content.
+
+        Raises:
+            FileNotFoundError: If the file does not exist.
+        """
+        entry = self.get(rel_path)
+        if entry is None:
+            raise FileNotFoundError(rel_path)
+        if isinstance(entry, str):
+            with open(entry, "rb") as file:
+                return file.read()
+        return entry
+
+    def size(self, rel_path: str) -> int:
+        """Get the size of a file of the generation written to.
+
+        Args:
+            rel_path (str): File path, relative to the output folder.
+
+        Returns:
+            int: Size in bytes.
+        """
+        entry = self.get(rel_path)
+        if isinstance(entry, str):
+            return os.path.getsize(entry)
+        return len(self.read(rel_path))
+
+    def digest(self, rel_path: str) -> Any:
+        """Hash a file of the generation written to.
+
+        Args:
+            rel_path (str): File path, relative to the output folder.
+
+        Returns:
+            Any: The SHA-256 hash object, which can still be updated.
+        """
+        return hashlib.sha256(self.read(rel_path))
+
+    def glob(self, pattern: str) -> list[str]:
+        """List the files of the generation written to matching a pattern.
+
+        Args:
+            pattern (str): Glob pattern, relative to the output folder.
+
+        Returns:
+            list[str]: Paths of the matching files, relative to the output folder.
+        """
+        pattern = self._key(pattern)
+        return [rel_path for rel_path in self.files() if fnmatch.fnmatchcase(rel_path, pattern)]
+
+    def files(self) -> list[str]:
+        """List the files of the generation written to.
+
+        Returns:
+            list[str]: Paths relative to the output folder.
+        """
+        return list(self._target())
+
+    def lookup(self, rel_path: str) -> bytes | str | None:
+        """Get a file of the served generation, for the development server.
+
+        Args:
+            rel_path (str): File path, relative to the output folder.
+
+        Returns:
+            bytes | str | None: The content, the path of the referenced file, or None if missing.
+        """
+        return self._files.get(rel_path)
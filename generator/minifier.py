@@ -0,0 +1,274 @@
+import json
+
+_JS_REGEX_PREFIX = "(,=:[!&|?{};+-*%<>~^"
+
+_JS_REGEX_KEYWORDS = ("return", "typeof", "case", "do", "else", "in", "of", "new",
+                      "delete", "void", "throw", "instanceof", "yield", "await")
+
+_VLQ_CHARS = "ABCDEFGHIJKLMNOPQRSTUVWXYZabcdefghijklmnopqrstuvwxyz0123456789+/"
+
+
+class Minifier():
+    """Conservative CSS and JavaScript minifier.
+
+    Comments are removed and whitespace is collapsed, leaving strings, template
+    literals and regular expressions untouched. Line breaks are kept in
+    JavaScript so automatic semicolon insertion is never affected. Every output
+    line is returned with the index of the source line it comes from, which is
+    enough to build line-level source maps.
+    """
+
+    def _scan(self, text: str, line_comments: bool, regex: bool,
+              strip_before: str, strip_after: str, drop_last_semicolon: bool = False) -> tuple[str, set[int]]:
+        """Remove comments and collapse whitespace outside of literals.
+
+        Whitespace runs containing line breaks are replaced by the same number
+        of line breaks, so the output keeps the line numbering of the source.
+
+        Args:
+            text (str): Source code.
+            line_comments (bool): Whether '//' starts a comment.
+            regex (bool): Whether '/' may start a regular expression literal.
+            strip_before (str): Characters before which spaces are dropped.
+            strip_after (str): Characters after which spaces are dropped.
+            drop_last_semicolon (bool, optional): Whether to drop a ';' directly followed by '}'. Defaults to False.
+
+        Returns:
+            tuple[str, set[int]]: The scanned code, and the indexes of the lines continuing
+                a template literal, which must be kept as they are.
+        """
+        out: list[str] = []
+        literal_lines: set[int] = set()
+        pending = ""
+        last = ""
+        before_last = ""
+        word = ""
+        line = 0
+        i = 0
+        n = len(text)
+
+        def flush(next_char: str) -> None:
+            nonlocal pending, line
+            if pending:
+                if "\n" in pending:
+                    out.append("\n" * pending.count("\n"))
+                    line += pending.count("\n")
+                elif last and last not in strip_after and next_char not in strip_before:
+                    out.append(" ")
+            pending = ""
+
+        while i < n:
+            c = text[i]
+
+            if c in " \t\r\n\f\v":
+                pending += "\n" if c == "\n" else " "
+                i += 1
+                continue
+
+            if c == "/" and i + 1 < n and text[i + 1] == "*":
+                end = text.find("*/", i + 2)
+                end = n if end < 0 else end + 2
+                newlines = text.count("\n", i, end)
+                pending += "\n" * newlines if newlines else " "
+                i = end
+                continue
+
+            if line_comments and c == "/" and i + 1 < n and text[i + 1] == "/":
+                end = text.find("\n", i)
+                i = n if end < 0 else end
+                continue
+
+            # A '/' after a postfix '++' or '--' is a division
+            is_regex = (regex and c == "/"
+                        and (not last or last in _JS_REGEX_PREFIX or word in _JS_REGEX_KEYWORDS)
+                        and not (last and last in "+-" and before_last == last))
+
+            if c in "\"'`" or is_regex:
+                flush(c)
+                j = i + 1
+                in_class = False
+                while j < n:
+                    if text[j] == "\\":
+                        j += 2
+                        continue
+                    if is_regex and text[j] == "[":
+                        in_class = True
+                    elif is_regex and text[j] == "]":
+                        in_class = False
+                    elif text[j] == c and not in_class:
+                        break
+                    elif text[j] == "\n" and c != "`":
+                        break
+                    j += 1
+                literal = text[i:j + 1]
+                out.append(literal)
+                newlines = literal.count("\n")
+                if c == "`":
+                    literal_lines.update(range(line + 1, line + newlines + 1))
+                line += newlines
+                before_last, last = last, c
+                word = ""
+                i = j + 1
+                continue
+
+            flush(c)
+            if drop_last_semicolon and c == "}":
+                k = len(out) - 1
+                while k >= 0 and out[k].strip("\n") == "":
+                    k -= 1
+                if k >= 0 and out[k] == ";":
+                    out[k] = ""
+            out.append(c)
+            word = word + c if c.isalnum() or c in "_$" else ""
+            before_last, last = last, c
+            i += 1
+
+        return "".join(out), literal_lines
+
+    def _lines(self, scanned: tuple[str, set[int]]) -> list[tuple[int, str]]:
+        """Split scanned code into non-empty lines.
+
+        The scan already drops the whitespace around lines, so lines are only
+        filtered, never stripped, and the lines of template literals are kept.
+
+        Args:
+            scanned (tuple[str, set[int]]): Scanned code and indexes of its template literal lines.
+
+        Returns:
+            list[tuple[int, str]]: Source line index and content of each non-empty line.
+        """
+        text, literal_lines = scanned
+        return [(idx, line) for idx, line in enumerate(text.split("\n")) if line or idx in literal_lines]
+
+    def minify_css(self, text: str) -> list[tuple[int, str]]:
+        """Minify a stylesheet.
+
+        Args:
+            text (str): CSS source.
+
+        Returns:
+            list[tuple[int, str]]: Source line index and content of each output fragment.
+                Fragments are joined with css_separator().
+        """
+        return self._lines(self._scan(text, line_comments=False, regex=False,
+                                      strip_before="{};,>", strip_after="{};,>:",
+                                      drop_last_semicolon=True))
+
+    def minify_js(self, text: str) -> list[tuple[int, str]]:
+        """Minify a script.
+
+        Args:
+            text (str): JavaScript source.
+
+        Returns:
+            list[tuple[int, str]]: Source line index and content of each output line.
+        """
+        return self._lines(self._scan(text, line_comments=True, regex=True,
+                                      strip_before="(){};,:=", strip_after="(){};,:="))
+
+    @staticmethod
+    def css_separator(previous: str, fragment: str) -> str:
+        """Get the separator needed between two CSS fragments on the same line.
+
+        Args:
+            previous (str): Preceding fragment.
+            fragment (str): Next fragment.
+
+        Returns:
+            str: An empty string, or a space when the line break was significant.
+        """
+        if not previous or previous[-1] in "{};,>:" or fragment[0] in "{};,>":
+            return ""
+        return " "
+
+
+class SourceMap():
+    """Builder of line-level source maps (revision 3)."""
+
+    def __init__(self, file: str) -> None:
+        """Initialize an empty source map.
+
+        Args:
+            file (str): Name of the generated file.
+        """
+        self._file = file
+        self._sources: list[str] = []
+        self._contents: list[str | None] = []
+        self._lines: list[list[tuple[int, int, int]]] = [[]]
+
+    def add_source(self, name: str, content: str | None = None) -> int:
+        """Register a source file.
+
+        Args:
+            name (str): Source name shown by the browser.
+            content (str | None, optional): Source content embedded in the map. Defaults to None.
+
+        Returns:
+            int: Index of the source.
+        """
+        self._sources.append(name)
+        self._contents.append(content)
+        return len(self._sources) - 1
+
+    def add_mapping(self, column: int, source: int, source_line: int) -> None:
+        """Map a position of the current generated line to the start of a source line.
+
+        Args:
+            column (int): Generated column.
+            source (int): Source index.
+            source_line (int): Source line index.
+        """
+        self._lines[-1].append((column, source, source_line))
+
+    def new_line(self) -> None:
+        """Move to the next generated line."""
+        self._lines.append([])
+
+    @staticmethod
+    def _vlq(value: int) -> str:
+        """Encode an integer as a base64 VLQ.
+
+        Args:
+            value (int): Value to encode.
+
+        Returns:
+            str: Encoded value.
+        """
+        value = (-value << 1) | 1 if value < 0 else value << 1
+        encoded = ""
+        while True:
+            digit = value & 31
+            value >>= 5
+            if value:
+                digit |= 32
+            encoded += _VLQ_CHARS[digit]
+            if not value:
+                return encoded
+
+    def to_json(self) -> str:
+        """Serialize the source map.
+
+        Returns:
+            str: The source map as JSON.
+        """
+        prev_source = prev_line = 0
+        lines = []
+        for segments in self._lines:
+            prev_column = 0
+            encoded = []
+            for column, source, source_line in segments:
+                encoded.append(self._vlq(column - prev_column) + self._vlq(source - prev_source)
+                               + self._vlq(source_line - prev_line) + self._vlq(0))
+                prev_column, prev_source, prev_line = column, source, source_line
+            lines.append(",".join(encoded))
+
+        source_map = {
+            "version": 3,
+            "file": self._file,
+            "sources": self._sources,
+            "names": [],
+            "mappings": ";".join(lines),
+        }
+        if any(c is not None for c in self._contents):
+            source_map["sourcesContent"] = self._contents
+        return json.dumps(source_map)
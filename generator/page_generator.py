@@ -1,14 +1,169 @@
+import compileall
+from concurrent.futures import ProcessPoolExecutor, ThreadPoolExecutor, as_completed
 from datetime import datetime
+from functools import cached_property
 import glob
+import hashlib
+import json
 import os
+import posixpath
 import re
 import shutil
-from typing import Any
-import yaml
-import markdown
-from jinja2 import Environment, FileSystemLoader, Template
+import time
+from typing import Any, Callable
+from jinja2 import BaseLoader, Environment, FileSystemBytecodeCache, FileSystemLoader, ModuleLoader, Template
 from generator.app_config import AppConfig
+from generator.build_manifest import BuildManifest
+from generator.build_profiler import BuildProfiler
+from generator.compressor import Compressor
+from generator.disk_output import DiskOutput
+from generator.image_processor import FORMAT_MIME_TYPES, ImageProcessor
 from generator.jinja_filters import first_date_filter
+from generator.markdown_converter import MarkdownConverter
+from generator.memory_output import MemoryOutput
+from generator.minifier import Minifier, SourceMap
+from generator.staged_output import StagedOutput
+from generator.yaml_loader import YamlLoader
+
+StringTransform = Callable[[str, str | None], str]
+
+_BRACES_PATTERN = re.compile(r"\{([\w-]+):(.+?)\}", flags=re.DOTALL)
+
+_HEAD_PATTERN = re.compile(r"<head\b[^>]*>", flags=re.IGNORECASE)
+
+_STYLESHEET_PATTERN = re.compile(
+    r"<link\b[^>]*\brel=[\"']stylesheet[\"'][^>]*>", flags=re.IGNORECASE)
+
+_SCRIPT_PATTERN = re.compile(
+    r"<script\b[^>]*\bsrc=[\"'][^\"']+[\"'][^>]*>", flags=re.IGNORECASE)
+
+_ATTR_PATTERN = r"\b{}=[\"']([^\"']*)[\"']"
+
+_CSS_URL_PATTERN = re.compile(
+    r"(url\(\s*[\"']?|@import\s+[\"'])([^\"')\s]+)", flags=re.IGNORECASE)
+
+_WRITE_BUFFER_SIZE = 64 * 1024
+
+
+_variant_worker: dict[str, Any] = {}
+
+
+def _init_variant_worker(app_config: AppConfig, out_folder: str, transforms: list[StringTransform],
+                         context: dict[str, Any], critical_conf: Any | None) -> None:
+    """Create the page generator of a variant worker process, once for all its pages.
+
+    Args:
+        app_config (AppConfig): The application configuration instance.
+        out_folder (str): Folder the current build writes to.
+        transforms (list[StringTransform]): String transforms registered on top of the default ones.
+        context (dict[str, Any]): Build values shared by every page.
+        critical_conf (Any | None): Optional 'critical' configuration.
+    """
+    generator = PageGenerator(app_config=app_config)
+    generator._output = generator._disk_output(out_folder)
+    for transform in transforms:
+        generator.register_string_transform(transform)
+    _variant_worker.update(generator=generator, context=context, critical_conf=critical_conf)
+
+
+def _render_variant(data_file: str, data_key: str, page_name: str) -> None:
+    """Render one data file into a page of the output folder.
+
+    This function runs in a worker process initialized by _init_variant_worker().
+
+    Args:
+        data_file (str): Data file to render.
+        data_key (str): Key of the data file content.
+        page_name (str): Page path, relative to the output folder.
+    """
+    generator: PageGenerator = _variant_worker["generator"]
+    generator._render_page(data_file, data_key, page_name,
+                           _variant_worker["context"], _variant_worker["critical_conf"])
+
+
+_batch_worker: dict[str, Any] = {}
+
+
+def _init_batch_worker(app_config: AppConfig, transforms: list[StringTransform], shared_folder: str,
+                       shared_files: list[str], context: dict[str, Any], critical_conf: Any | None) -> None:
+    """Create the page generator of a batch worker process, once for all its files.
+
+    Args:
+        app_config (AppConfig): The application configuration instance.
+        transforms (list[StringTransform]): String transforms registered on top of the default ones.
+        shared_folder (str): Folder holding the files shared by every page.
+        shared_files (list[str]): Shared files, relative to the shared folder.
+        context (dict[str, Any]): Build values shared by every page.
+        critical_conf (Any | None): Optional 'critical' configuration.
+    """
+    generator = PageGenerator(app_config=app_config)
+    for transform in transforms:
+        generator.register_string_transform(transform)
+    _batch_worker.update(generator=generator, shared_folder=shared_folder, shared_files=shared_files,
+                         context=context, critical_conf=critical_conf)
+
+
+def _render_batch_file(data_file: str, out_folder: str) -> float:
+    """Render one data file of a batch into its own output folder.
+
+    The data is loaded before anything is written, and the output folder is
+    removed if the page cannot be rendered, so a failed file leaves no folder
+    without a page. Once rendered, files left by a previous run that are
+    neither shared nor the page (or its compressed siblings) are removed.
+
+    This function runs in a worker process initialized by _init_batch_worker().
+
+    Args:
+        data_file (str): Data file to render.
+        out_folder (str): Output folder of the data file.
+
+    Returns:
+        float: Render time in seconds.
+    """
+    start = time.perf_counter()
+    generator: PageGenerator = _batch_worker["generator"]
+    shared_folder = _batch_worker["shared_folder"]
+
+    output = generator._output = generator._disk_output(out_folder)
+    try:
+        generator._get_data(data_file, "")
+
+        # The page may inline the shared bundles, which must be linked first
+        for rel_path in _batch_worker["shared_files"]:
+            src_path = os.path.join(shared_folder, rel_path)
+            if not output.is_linked(rel_path, src_path):
+                output.link(rel_path, src_path)
+
+        generator._render_page(data_file, "", generator._app_config.page_name,
+                               _batch_worker["context"], _batch_worker["critical_conf"])
+    except Exception:
+        shutil.rmtree(out_folder, ignore_errors=True)
+        raise
+    finally:
+        generator._output = None
+        generator._data_cache.pop(data_file, None)
+        generator._build_data.discard(data_file)
+
+    page_name = generator._app_config.page_name
+    keep = set(_batch_worker["shared_files"]) | {page_name}
+    if generator._app_config.precompress:
+        compressor = Compressor(extensions=generator._app_config.compress_extensions, workers=1)
+        compressor.compress_tree(out_folder)
+        keep.update(f"{page_name}{encoding}" for encoding in compressor.encodings)
+
+    # Files of a previous run that are no longer shared (old bundles, removed images...)
+    for path in generator._list_files(out_folder):
+        if os.path.relpath(path, out_folder) not in keep:
+            os.remove(path)
+    for root, _, _ in os.walk(out_folder, topdown=False):
+        if root != out_folder and not os.listdir(root):
+            os.rmdir(root)
+
+    return time.perf_counter() - start
+
+
+class BuildCancelled(Exception):
+    """Raised when a build is cancelled before completion."""
 
 
 class PageGenerator():
@@ -21,29 +176,263 @@ class PageGenerator():
             app_config (AppConfig): The application configuration instance.
         """
         self._app_config = app_config
+        self._output: DiskOutput | MemoryOutput | None = None
+        self._data_cache: dict[str, tuple[str, tuple[str, ...], Any]] = {}
+        self._build_data: set[str] = set()
+        self._compiled_env: tuple[int, Environment] | None = None
+        self._minifier = Minifier()
+        self._builtin_transforms: list[StringTransform] = [
+            self._markdown_transform,
+            self._style_tags_transform,
+        ]
+        self._user_transforms: list[StringTransform] = []
+
+    @cached_property
+    def _manifest(self) -> BuildManifest:
+        """Get the build manifest, created on first use.
 
-    def _convert_markdown(self, data: Any, key: str | None = None) -> Any:
-        """Recursively convert Markdown content to HTML.
+        Returns:
+            BuildManifest: The build manifest.
+        """
+        return BuildManifest(path=self._app_config.abs_dist_manifest_path)
+
+    @cached_property
+    def _profiler(self) -> BuildProfiler:
+        """Get the build profiler, created on first use.
+
+        Returns:
+            BuildProfiler: The build profiler, enabled by AppConfig.profile.
+        """
+        return BuildProfiler(enabled=self._app_config.profile,
+                             profile_stage=self._app_config.profile_stage,
+                             stats_folder=self._app_config.profile_stats_folder)
+
+    @cached_property
+    def _staged_output(self) -> StagedOutput | MemoryOutput:
+        """Get the staged output of the distribution folder, created on first use.
+
+        Returns:
+            StagedOutput | MemoryOutput: The staged output, kept in memory in dev server
+                mode when AppConfig.dev_in_memory is set.
+        """
+        if self._app_config.dev_server and self._app_config.dev_in_memory:
+            return MemoryOutput(root=self._app_config.dist_folder)
+
+        return StagedOutput(output_folder=self._app_config.dist_folder,
+                            builds_folder=self._app_config.builds_folder,
+                            link_files=self._app_config.asset_copy_link,
+                            verify_hash=self._app_config.asset_copy_verify_hash)
+
+    def _disk_output(self, folder: str) -> DiskOutput:
+        """Create the output of a plain folder on disk, e.g. a batch folder.
 
         Args:
-            data (Any): Input data (dict, list, or string).
-            key (str | None): Current key name in traversal (used to detect 'content' fields).
+            folder (str): Path of the folder.
 
         Returns:
-            Any: Data with Markdown strings converted to HTML.
+            DiskOutput: The output of the folder.
         """
-        if key == 'content' and isinstance(data, str):
-            if self._app_config.debug:
-                print(data)
-            return markdown.markdown(data)
+        return DiskOutput(root=folder, link_files=self._app_config.asset_copy_link,
+                          verify_hash=self._app_config.asset_copy_verify_hash)
 
-        if isinstance(data, list):
-            return [self._convert_markdown(x) for x in data]
+    @property
+    def memory_output(self) -> MemoryOutput | None:
+        """Get the in-memory output the builds write to.
 
-        if isinstance(data, dict):
-            return {k: self._convert_markdown(v, k) for k, v in data.items()}
+        Returns:
+            MemoryOutput | None: The in-memory output, or None when builds write to disk.
+        """
+        output = self._staged_output
+        return output if isinstance(output, MemoryOutput) else None
 
-        return data
+    @property
+    def asset_manifest(self) -> dict[str, str]:
+        """Get the asset manifest of the last build.
+
+        Returns:
+            dict[str, str]: Mapping of logical bundle paths to fingerprinted ones.
+        """
+        return self._manifest.get_value("asset_manifest") or {}
+
+    @cached_property
+    def _env(self) -> Environment:
+        """Get the Jinja2 environment, created on first use.
+
+        Returns:
+            Environment: The configured Jinja2 environment.
+        """
+        return self._create_environment()
+
+    @cached_property
+    def _markdown(self) -> MarkdownConverter:
+        """Get the Markdown converter, created on first use.
+
+        Returns:
+            MarkdownConverter: The Markdown converter.
+        """
+        return MarkdownConverter(
+            cache_size=self._app_config.markdown_cache_size,
+            cache_folder=(self._app_config.markdown_cache_folder
+                          if self._app_config.markdown_disk_cache else None),
+            disk_cache_size=self._app_config.markdown_disk_cache_size)
+
+    @cached_property
+    def _yaml(self) -> YamlLoader:
+        """Get the YAML loader, created on first use.
+
+        Returns:
+            YamlLoader: The YAML loader.
+        """
+        return YamlLoader(cache_folder=(self._app_config.yaml_cache_folder
+                                        if self._app_config.yaml_disk_cache else None))
+
+    def _create_environment(self, loader: BaseLoader | None = None) -> Environment:
+        """Create the Jinja2 environment shared by every build.
+
+        Templates are compiled once and kept in memory; they are only recompiled
+        when their source file changes. Compiled bytecode is also stored on disk
+        so that one-shot builds skip compilation.
+
+        Args:
+            loader (BaseLoader | None, optional): Loader to use instead of the template
+                folder, without bytecode cache. Defaults to None.
+
+        Returns:
+            Environment: The configured Jinja2 environment.
+        """
+        bytecode_cache = None
+        if loader is None:
+            os.makedirs(self._app_config.template_cache_folder, exist_ok=True)
+            loader = FileSystemLoader(
+                searchpath=self._app_config.abs_template_folder_path)
+            bytecode_cache = FileSystemBytecodeCache(
+                directory=self._app_config.template_cache_folder)
+
+        env = Environment(
+            loader=loader,
+            bytecode_cache=bytecode_cache,
+            autoescape=False,
+            auto_reload=True)
+        env.filters['first_date'] = first_date_filter
+        return env
+
+    def _compiled_environment(self) -> Environment | None:
+        """Get the environment of the precompiled templates.
+
+        Returns:
+            Environment | None: The environment, or None if the compiled templates are
+                missing or older than one of the template sources.
+        """
+        try:
+            mtime = os.stat(self._app_config.compiled_templates_path).st_mtime_ns
+        except OSError:
+            return None
+
+        for root, _, files in os.walk(self._app_config.abs_template_folder_path):
+            if os.stat(root).st_mtime_ns > mtime:
+                return None
+            for file in files:
+                if os.stat(os.path.join(root, file)).st_mtime_ns > mtime:
+                    return None
+
+        if self._compiled_env is None or self._compiled_env[0] != mtime:
+            self._compiled_env = (mtime, self._create_environment(
+                loader=ModuleLoader(self._app_config.compiled_templates_path)))
+
+        return self._compiled_env[1]
+
+    def _get_template(self, name: str) -> Template:
+        """Get a template, from the precompiled templates when they are up to date.
+
+        Args:
+            name (str): Template name, relative to the template folder.
+
+        Returns:
+            Template: The loaded template.
+        """
+        env = self._compiled_environment() or self._env
+        return env.get_template(name=name)
+
+    def compile_templates(self) -> str:
+        """Precompile every template into a folder of Python modules.
+
+        The modules are also byte-compiled, so renders load the templates
+        without parsing nor compiling anything, as long as the folder is newer
+        than every template source.
+
+        Returns:
+            str: Path of the compiled template folder.
+        """
+        path = self._app_config.compiled_templates_path
+        tmp_path = f"{path}.{os.getpid()}.tmp"
+        shutil.rmtree(tmp_path, ignore_errors=True)
+
+        self._env.compile_templates(target=tmp_path, zip=None, ignore_errors=False)
+        compileall.compile_dir(tmp_path, quiet=1)
+
+        shutil.rmtree(path, ignore_errors=True)
+        os.replace(tmp_path, path)
+
+        print(f"Templates compiled : {len(self._env.list_templates())} template(s) in {path}")
+        return path
+
+    def register_string_transform(self, transform: StringTransform) -> None:
+        """Append a transform applied to every string of the data tree.
+
+        Transforms are applied in registration order, after the Markdown
+        conversion and the style tags. They must be picklable (e.g. module-level
+        functions) to be used when several variants are rendered in parallel.
+
+        Args:
+            transform (StringTransform): Callable receiving the string and the key
+                of its parent dict entry (or None), and returning the new string.
+        """
+        self._user_transforms.append(transform)
+
+    @property
+    def _string_transforms(self) -> list[StringTransform]:
+        """Get every string transform, the built-in ones first.
+
+        Returns:
+            list[StringTransform]: The transforms in application order.
+        """
+        return self._builtin_transforms + self._user_transforms
+
+    @property
+    def _transform_names(self) -> tuple[str, ...]:
+        """Get the qualified names of the string transforms, which identify the pipeline in build keys.
+
+        Returns:
+            tuple[str, ...]: Module and qualified name of each transform, in application order.
+        """
+        return tuple(f"{getattr(t, '__module__', None)}.{getattr(t, '__qualname__', type(t).__qualname__)}"
+                     for t in self._string_transforms)
+
+    def _markdown_transform(self, text: str, key: str | None) -> str:
+        """Convert Markdown to HTML for 'content' fields.
+
+        Args:
+            text (str): String value.
+            key (str | None): Key of the parent dict entry.
+
+        Returns:
+            str: HTML for 'content' fields, the unchanged text otherwise.
+        """
+        if key != 'content':
+            return text
+        return self._markdown.convert(text)
+
+    def _style_tags_transform(self, text: str, key: str | None) -> str:
+        """Apply span-style transformations to a string.
+
+        Args:
+            text (str): String value.
+            key (str | None): Key of the parent dict entry.
+
+        Returns:
+            str: Text with style tags applied.
+        """
+        return self._transform_braces_to_span(text=text)
 
     def _transform_braces_to_span(self, text: str) -> str:
         """Transform brace-style markup into <span> tags.
@@ -58,49 +447,104 @@ class PageGenerator():
         Returns:
             str: Text with braces transformed into HTML span tags.
         """
-        pattern = r"\{([\w-]+):(.+?)\}"
-        return re.sub(pattern, r'<span class="\1">\2</span>', text, flags=re.DOTALL)
+        if "{" not in text:
+            return text
+        return _BRACES_PATTERN.sub(r'<span class="\1">\2</span>', text)
 
-    def _apply_style_tags(self, data: Any) -> Any:
-        """Apply span-style transformations recursively across data.
+    def _transform_data(self, data: Any, key: str | None = None,
+                        transforms: list[StringTransform] | None = None) -> Any:
+        """Recursively apply the string transforms across data in a single pass.
+
+        Containers are only copied when one of their items changes, so
+        untouched subtrees are returned as-is.
 
         Args:
-            data (Any): Input data (string, list, or dict).
+            data (Any): Input data (dict, list, or string).
+            key (str | None): Key of the parent dict entry (used to detect 'content' fields).
+            transforms (list[StringTransform] | None, optional): Transforms to apply instead of
+                the registered ones. Defaults to None.
 
         Returns:
-            Any: Data with style tags applied.
+            Any: Transformed data.
         """
+        if transforms is None:
+            transforms = self._string_transforms
+
         if isinstance(data, str):
-            if self._app_config.debug:
-                print(data)
-            return self._transform_braces_to_span(text=data)
+            for transform in transforms:
+                data = transform(data, key)
+            return data
 
         if isinstance(data, list):
-            return [self._apply_style_tags(x) for x in data]
+            result = None
+            for i, item in enumerate(data):
+                new_item = self._transform_data(item, transforms=transforms)
+                if new_item is not item:
+                    if result is None:
+                        result = list(data)
+                    result[i] = new_item
+            return data if result is None else result
 
         if isinstance(data, dict):
-            if self._app_config.debug:
-                print(data)
-            return {k: self._apply_style_tags(v) for k, v in data.items()}
+            result = None
+            for k, v in data.items():
+                new_v = self._transform_data(v, k, transforms=transforms)
+                if new_v is not v:
+                    if result is None:
+                        result = dict(data)
+                    result[k] = new_v
+            return data if result is None else result
 
         return data
 
-    def _render_template(self, data: Any) -> str:
-        """Render the main HTML page using Jinja2.
+    def _convert_markdown(self, data: Any, key: str | None = None) -> Any:
+        """Recursively convert Markdown content to HTML.
 
         Args:
-            data (Any): Data dictionary to render into the template.
+            data (Any): Input data (dict, list, or string).
+            key (str | None): Current key name in traversal (used to detect 'content' fields).
 
         Returns:
-            str: Rendered HTML content.
+            Any: Data with Markdown strings converted to HTML.
         """
-        env = Environment(
-            loader=FileSystemLoader(
-                searchpath=self._app_config.abs_template_folder_path),
-            autoescape=False)
-        env.filters['first_date'] = first_date_filter
-        template = env.get_template(name=self._app_config.base_template)
-        return template.render(**data)
+        return self._transform_data(data, key, transforms=[self._markdown_transform])
+
+    def _apply_style_tags(self, data: Any) -> Any:
+        """Apply span-style transformations recursively across data.
+
+        Args:
+            data (Any): Input data (string, list, or dict).
+
+        Returns:
+            Any: Data with style tags applied.
+        """
+        return self._transform_data(data, transforms=[self._style_tags_transform])
+
+    def _render_template(self, data: Any, path: str, critical_conf: Any | None = None) -> None:
+        """Render the main HTML page using Jinja2, streaming it to a file.
+
+        The chunks produced by the template are written through a buffered
+        file, so the whole page is never held in memory. When the critical
+        path is optimized, only the document head is buffered and rewritten.
+
+        Args:
+            data (Any): Data dictionary to render into the template.
+            path (str): Path of the page, relative to the output folder.
+            critical_conf (Any | None, optional): Optional 'critical' configuration. Defaults to None.
+        """
+        template = self._get_template(name=self._app_config.base_template)
+        chunks = template.generate(**data)
+
+        with self._output.open(path, buffering=_WRITE_BUFFER_SIZE) as file:
+            if critical_conf:
+                head = []
+                for chunk in chunks:
+                    head.append(chunk)
+                    if "</head>" in chunk:
+                        break
+                file.write(self._optimize_critical_path(
+                    "".join(head), critical_conf, data['asset_manifest']))
+            file.writelines(chunks)
 
     def _render_site_map(self, data: Any) -> str:
         """Render the sitemap XML template.
@@ -111,73 +555,293 @@ class PageGenerator():
         Returns:
             str: Rendered sitemap XML.
         """
-        with open(file=self._app_config.abs_sitemap, mode="r", encoding="utf-8") as f:
-            template = Template(f.read())
+        template = self._get_template(name=self._app_config.sitemap)
         return template.render(**data)
 
-    def _add_hot_reload_script(self, html: str) -> str:
-        """Inject a live-reload WebSocket script for development mode.
+    def _hot_reload_script(self) -> str:
+        """Get the live-reload WebSocket script for development mode.
 
-        Args:
-            html (str): The generated HTML content.
+        The script is exposed to the templates as 'hot_reload_script', which
+        the base template outputs before </body>. It handles the messages of
+        the dev server: "css" swaps stylesheets in place, "image" refreshes the
+        images from the rebuilt page, and "reload" reloads the page.
 
         Returns:
-            str: HTML with reload script appended before </body>.
+            str: The script in dev server mode, an empty string otherwise.
         """
         if self._app_config.dev_server:
-            reload_script = f"""
-                <script>
-                const ws = new WebSocket("ws://{self._app_config.server_host}:{self._app_config.server_websocket_port}");
-                ws.onmessage = (e) => {{ if (e.data === "reload") location.reload(); }};
-                </script>
-                """
-            return html.replace("</body>", reload_script + "\n</body>")
+            return f"""<script>
+        (() => {{
+          const ws = new WebSocket("ws://{self._app_config.server_host}:{self._app_config.server_websocket_port}");
+          const swapCss = (swaps) => {{
+            for (const {{ old, href }} of swaps) {{
+              const link = [...document.querySelectorAll('link[rel="stylesheet"]')]
+                .find((l) => l.getAttribute("href").split("./").pop() === old);
+              if (!link) return location.reload();
+              const fresh = link.cloneNode();
+              fresh.setAttribute("href", href);
+              fresh.onload = () => link.remove();
+              link.after(fresh);
+            }}
+          }};
+          const refreshImages = async (paths) => {{
+            const html = await (await fetch(location.href, {{ cache: "no-store" }})).text();
+            const fresh = new DOMParser().parseFromString(html, "text/html").querySelectorAll("img, source");
+            const current = document.querySelectorAll("img, source");
+            if (fresh.length !== current.length) return location.reload();
+            current.forEach((el, i) => {{
+              for (const attr of ["src", "srcset"]) {{
+                const value = fresh[i].getAttribute(attr);
+                if (value === null) continue;
+                if (value !== el.getAttribute(attr)) el.setAttribute(attr, value);
+                else if (attr === "src" && paths.some((p) => value.includes(p)))
+                  el.setAttribute(attr, value.split("?")[0] + "?t=" + Date.now());
+              }}
+            }});
+          }};
+          ws.onmessage = (e) => {{
+            const message = JSON.parse(e.data);
+            if (message.type === "css") swapCss(message.swaps);
+            else if (message.type === "image") refreshImages(message.paths);
+            else location.reload();
+          }};
+        }})();
+        </script>"""
+
+        return ""
+
+    def _rebase_css_urls(self, css: str, folder: str) -> str:
+        """Make the relative URLs of a stylesheet relative to the root of the output folder.
+
+        Used when a stylesheet is inlined into a page, whose URLs are resolved
+        from the page instead of the stylesheet.
+
+        Args:
+            css (str): The stylesheet.
+            folder (str): Folder of the stylesheet, relative to the output folder.
+
+        Returns:
+            str: The stylesheet with its url() and @import references rebased.
+        """
+        if not folder:
+            return css
+
+        def rebase(match: re.Match) -> str:
+            url = match.group(2)
+            if url.startswith(("/", "#")) or re.match(r"^[a-z][a-z0-9+.-]*:", url, flags=re.IGNORECASE):
+                return match.group(0)
+            return match.group(1) + posixpath.normpath(posixpath.join(folder.replace(os.sep, "/"), url))
+
+        return _CSS_URL_PATTERN.sub(rebase, css)
+
+    def _optimize_critical_path(self, html: str, critical_conf: Any,
+                                asset_manifest: dict[str, str]) -> str:
+        """Remove render-blocking requests from the rendered page.
+
+        Depending on the 'critical' configuration, this method:
+        - Inlines local stylesheet bundles smaller than 'inline_css_max_size' into a <style> tag,
+          rebasing their relative URLs to the page.
+        - Adds 'defer' to external scripts that are neither deferred nor async.
+        - Adds preload hints at the top of <head> for the bundles still requested.
+
+        CSS is never inlined in dev server mode, so stylesheets can be hot-swapped.
+
+        Args:
+            html (str): The rendered HTML page, or the part of it up to </head>.
+            critical_conf (Any): The 'critical' configuration.
+            asset_manifest (dict[str, str]): Mapping of logical bundle paths to fingerprinted ones.
+
+        Returns:
+            str: The optimized HTML page.
+        """
+        bundles = set(asset_manifest.values())
+        inline_css = critical_conf.get("inline_css", False) and not self._app_config.dev_server
+        max_size = critical_conf.get("inline_css_max_size", 14 * 1024)
+        preloads = []
+
+        def attr(tag: str, name: str) -> str | None:
+            match = re.search(_ATTR_PATTERN.format(name), tag, flags=re.IGNORECASE)
+            return match.group(1) if match else None
+
+        def replace_stylesheet(match: re.Match) -> str:
+            tag = match.group(0)
+            href = attr(tag, "href") or ""
+            rel_path = href.removeprefix("./")
+            if rel_path not in bundles:
+                return tag
+
+            if inline_css and self._output.size(rel_path) <= max_size:
+                css = self._rebase_css_urls(self._output.read(rel_path).decode("utf-8"),
+                                            os.path.dirname(rel_path))
+                css = css.replace("sourceMappingURL=", f"sourceMappingURL={os.path.dirname(rel_path)}/")
+                css = css.strip().replace("</style", "<\\/style")
+                return f"<style>{css}</style>"
+
+            preloads.append(f'<link rel="preload" href="{href}" as="style" />')
+            return tag
+
+        def replace_script(match: re.Match) -> str:
+            tag = match.group(0)
+            src = attr(tag, "src") or ""
+            if src.removeprefix("./") in bundles:
+                preloads.append(f'<link rel="preload" href="{src}" as="script" />')
+            if (critical_conf.get("defer_scripts", False)
+                    and not re.search(r"\b(defer|async)\b", tag, flags=re.IGNORECASE)
+                    and attr(tag, "type") != "module"):
+                tag = tag[:-1].rstrip().removesuffix("/").rstrip() + " defer>"
+            return tag
+
+        html = _STYLESHEET_PATTERN.sub(replace_stylesheet, html)
+        html = _SCRIPT_PATTERN.sub(replace_script, html)
+
+        if critical_conf.get("preload", False) and preloads:
+            html = _HEAD_PATTERN.sub(
+                lambda m: m.group(0) + "\n" + "\n".join(preloads), html, count=1)
 
         return html
 
-    def _build_assets(self, build_id: str, assets_conf: Any | None = None) -> None:
+    def _build_assets(self, assets_conf: Any | None = None) -> tuple[dict[str, str], dict[str, list[int]]]:
         """Build and concatenate CSS and JS assets for the site.
 
+        Each bundle is named after a hash of its content, so unchanged bundles
+        keep their URL across builds.
+
         Args:
-            build_id (str): Unique build identifier appended to filenames.
             assets_conf (Any | None): Optional configuration specifying assets to include.
+
+        Returns:
+            tuple[dict[str, str], dict[str, list[int]]]: Asset manifest mapping logical bundle paths
+                to fingerprinted ones, and source and output sizes of each bundle.
         """
         css_src = os.path.join(self._app_config.asset_folder, "css")
         js_src = os.path.join(self._app_config.asset_folder, "js")
-        css_out = os.path.join(self._app_config.dist_folder, "css",
-                               f"{self._app_config.css_file_name}.{build_id}.css")
-        js_out = os.path.join(self._app_config.dist_folder, "js",
-                              f"{self._app_config.js_file_name}.{build_id}.js")
-
-        os.makedirs(os.path.join(
-            self._app_config.dist_folder, "css"), exist_ok=True)
-        os.makedirs(os.path.join(
-            self._app_config.dist_folder, "js"), exist_ok=True)
-
-        self._cleanup_old_assets()
 
         css_files = assets_conf.get("css") if assets_conf else None
         js_files = assets_conf.get("js") if assets_conf else None
+        minify = bool(assets_conf.get("minify")) if assets_conf else False
 
+        asset_manifest = {}
+        bundle_sizes = {}
+
+        bundles = []
         if os.path.isdir(css_src):
-            self._concat_files(css_src, css_files, [".css"], css_out)
+            bundles.append((css_src, css_files, [".css"], "css", self._app_config.css_file_name))
         if os.path.isdir(js_src):
-            self._concat_files(js_src, js_files, [".js"], js_out)
+            bundles.append((js_src, js_files, [".js"], "js", self._app_config.js_file_name))
+
+        for src_dir, filenames, extensions, folder, name in bundles:
+            logical_path = f"{folder}/{name}{extensions[0]}"
+            with self._profiler.stage("concat", detail=logical_path):
+                rel_path, map_path, sizes = self._build_bundle(
+                    src_dir, filenames, extensions, folder, name, minify=minify)
+            asset_manifest[logical_path] = rel_path
+            if map_path:
+                asset_manifest[f"{logical_path}.map"] = map_path
+            bundle_sizes[logical_path] = list(sizes)
 
-        self._copy_extra_assets(
-            self._app_config.asset_folder, self._app_config.dist_folder)
+        self._cleanup_old_assets(keep=list(asset_manifest.values()))
+        self._save_asset_manifest(asset_manifest)
 
-    def _cleanup_old_assets(self) -> None:
-        """Remove old CSS and JS files from the distribution directory."""
-        css_pattern = os.path.join(
-            self._app_config.dist_folder, "css", "*.css")
-        js_pattern = os.path.join(self._app_config.dist_folder, "js", "*.js")
+        return asset_manifest, bundle_sizes
+
+    def _build_bundle(self, src_dir: str, filenames: list[str] | None,
+                      extensions: list[str], folder: str, name: str,
+                      minify: bool = False) -> tuple[str, str | None, tuple[int, int]]:
+        """Concatenate a bundle and name it after a hash of its content.
+
+        Minified bundles get a source map in dev mode.
+
+        Args:
+            src_dir (str): Source directory containing asset files.
+            filenames (list[str] | None): Specific filenames to include. If None, includes all matching extensions.
+            extensions (list[str]): File extensions to include, the first one is used for the bundle.
+            folder (str): Bundle folder, relative to the distribution folder.
+            name (str): Bundle base name.
+            minify (bool, optional): Whether to minify the bundle. Defaults to False.
+
+        Returns:
+            tuple[str, str | None, tuple[int, int]]: Paths of the fingerprinted bundle and of its
+                source map (or None), relative to the distribution folder, and the source and
+                output sizes in bytes.
+        """
+        ext = extensions[0]
+        output = self._output
+        tmp_out = f"{folder}/{name}{ext}.tmp"
+        source_map = SourceMap(file=f"{name}{ext}") if minify and self._app_config.dev_server else None
+
+        output.remove(tmp_out)
+
+        sizes = self._concat_files(src_dir, filenames, extensions, tmp_out,
+                                   minify=minify, source_map=source_map)
+
+        digest = output.digest(tmp_out)
+        if source_map:
+            digest.update(b"\0source-map")
+        fingerprint = digest.hexdigest()[:self._app_config.fingerprint_length]
+
+        rel_path = f"{folder}/{name}.{fingerprint}{ext}"
+        map_path = None
+
+        if source_map:
+            map_path = f"{rel_path}.map"
+            map_name = os.path.basename(map_path)
+            with output.open(tmp_out, append=True) as file:
+                if ext == ".css":
+                    file.write(f"\n/*# sourceMappingURL={map_name} */\n")
+                else:
+                    file.write(f"//# sourceMappingURL={map_name}\n")
+            self._write_text(path=map_path, text=source_map.to_json())
+
+        if output.exists(rel_path):
+            output.remove(tmp_out)
+        else:
+            output.rename(tmp_out, rel_path)
+
+        return rel_path, map_path, sizes
+
+    def _save_asset_manifest(self, asset_manifest: dict[str, str]) -> None:
+        """Save the asset manifest to the distribution folder.
+
+        Args:
+            asset_manifest (dict[str, str]): Mapping of logical bundle paths to fingerprinted ones.
+        """
+        self._write_text(path=self._app_config.asset_manifest,
+                         text=json.dumps(asset_manifest, indent=2, sort_keys=True))
+
+    def _list_files(self, folder: str) -> list[str]:
+        """List every file below a folder.
+
+        Args:
+            folder (str): Folder to walk.
+
+        Returns:
+            list[str]: Sorted paths of the files found.
+        """
+        paths = []
+        for root, _, files in os.walk(folder):
+            for file in files:
+                paths.append(os.path.join(root, file))
+        return sorted(paths)
+
+    def _cleanup_old_assets(self, keep: list[str]) -> None:
+        """Remove stale CSS and JS bundles from the distribution directory.
+
+        Args:
+            keep (list[str]): Paths of the current bundles, relative to the distribution folder.
+        """
+        patterns = [os.path.join("css", "*.css"),
+                    os.path.join("css", "*.css.map"),
+                    os.path.join("js", "*.js"),
+                    os.path.join("js", "*.js.map")]
+        keep_paths = {os.path.normpath(p) for p in keep}
         removed = []
 
-        for pattern in [css_pattern, js_pattern]:
-            for file_path in glob.glob(pattern):
+        for pattern in patterns:
+            for file_path in self._output.glob(pattern):
+                if os.path.normpath(file_path) in keep_paths:
+                    continue
                 try:
-                    os.remove(file_path)
+                    self._output.remove(file_path)
                     removed.append(os.path.basename(file_path))
                 except Exception as e:
                     print(f"Unable to remove {file_path}: {e}")
@@ -188,55 +852,216 @@ class PageGenerator():
             print("No, file to erase")
 
     def _concat_files(self, src_dir: str, filenames: list[str] | None,
-                      extensions: list[str], out_file: str) -> None:
+                      extensions: list[str], out_file: str, minify: bool = False,
+                      source_map: SourceMap | None = None) -> tuple[int, int]:
         """Concatenate multiple source files into a single output file.
 
+        Sources are streamed file to file when they are not minified. The
+        minifier works on whole sources, so when minifying each source is read
+        in memory, minified on its own, and every output line is mapped to its
+        source line in the optional source map.
+
         Args:
             src_dir (str): Source directory containing asset files.
             filenames (list[str] | None): Specific filenames to include. If None, includes all matching extensions.
             extensions (list[str]): File extensions to include (e.g. [".css"]).
-            out_file (str): Path of the output file.
-        """
-        os.makedirs(os.path.dirname(out_file), exist_ok=True)
-
-        with open(out_file, "w", encoding="utf-8") as outfile:
-            if filenames:
-                for fname in filenames:
-                    src_path = os.path.join(src_dir, fname)
-                    if not os.path.isfile(src_path):
-                        print(f"Missing file : {fname}")
-                        continue
-                    with open(src_path, "r", encoding="utf-8") as infile:
+            out_file (str): Path of the output file, relative to the output folder.
+            minify (bool, optional): Whether to minify the sources. Defaults to False.
+            source_map (SourceMap | None, optional): Source map to fill when minifying. Defaults to None.
+
+        Returns:
+            tuple[int, int]: Total size of the sources and size of the output, in bytes.
+        """
+        if filenames:
+            names = []
+            for fname in filenames:
+                if not os.path.isfile(os.path.join(src_dir, fname)):
+                    print(f"Missing file : {fname}")
+                    continue
+                names.append(fname)
+        else:
+            names = [fname for fname in sorted(os.listdir(src_dir))
+                     if os.path.splitext(fname)[1] in extensions]
+
+        is_css = extensions[0] == ".css"
+        src_size = 0
+        previous = ""
+        column = 0
+
+        with self._output.open(out_file) as outfile:
+            for fname in names:
+                src_path = os.path.join(src_dir, fname)
+                src_size += os.path.getsize(src_path)
+
+                with open(src_path, "r", encoding="utf-8") as infile:
+                    if not minify:
                         outfile.write(f"/* {fname} */\n")
-                        outfile.write(infile.read().strip() + "\n\n")
-                        print(
-                            f"Added to {os.path.basename(out_file)} : {fname}")
-            else:
-                for fname in sorted(os.listdir(src_dir)):
-                    if os.path.splitext(fname)[1] in extensions:
-                        src_path = os.path.join(src_dir, fname)
-                        with open(src_path, "r", encoding="utf-8") as infile:
-                            outfile.write(f"/* {fname} */\n")
-                            outfile.write(infile.read().strip() + "\n\n")
-                            print(
-                                f"Added to {os.path.basename(out_file)} : {fname}")
-
-    def _copy_extra_assets(self, src_dir: str, dst_dir: str) -> None:
+                        shutil.copyfileobj(infile, outfile)
+                        outfile.write("\n\n")
+                    else:
+                        text = infile.read()
+                        source = None
+                        if source_map:
+                            source = source_map.add_source(
+                                name=os.path.relpath(src_path, os.path.dirname(
+                                    os.path.join(self._output.root, out_file))).replace(os.sep, "/"),
+                                content=text)
+
+                        if is_css:
+                            for line_idx, fragment in self._minifier.minify_css(text):
+                                separator = Minifier.css_separator(previous, fragment)
+                                outfile.write(separator + fragment)
+                                column += len(separator)
+                                if source_map:
+                                    source_map.add_mapping(column, source, line_idx)
+                                column += len(fragment)
+                                previous = fragment
+                        else:
+                            for line_idx, line in self._minifier.minify_js(text):
+                                outfile.write(line + "\n")
+                                if source_map:
+                                    source_map.add_mapping(0, source, line_idx)
+                                    source_map.new_line()
+
+                print(f"Added to {os.path.basename(out_file)} : {fname}")
+
+            if minify and is_css and names:
+                outfile.write("\n")
+
+        return src_size, self._output.size(out_file)
+
+    def _copy_extra_assets(self, src_dir: str, previous_files: list[str] | None = None) -> list[str]:
         """Copy non-CSS/JS assets (e.g. images, fonts) to the distribution folder.
 
+        Unchanged files are skipped, the others are linked or copied in a
+        thread pool, and files copied by a previous build whose source has
+        disappeared are removed.
+
         Args:
             src_dir (str): Source assets directory.
-            dst_dir (str): Destination directory for copied assets.
+            previous_files (list[str] | None, optional): Files copied by the previous build,
+                relative to the output folder. Defaults to None.
+
+        Returns:
+            list[str]: Copied files, relative to the output folder.
         """
+        output = self._output
+        rel_paths = []
+        pending = []
+
         for root, _, files in os.walk(src_dir):
             for file in files:
                 ext = os.path.splitext(file)[1]
                 if ext not in [".css", ".js"]:
                     src_path = os.path.join(root, file)
                     rel_path = os.path.relpath(src_path, src_dir)
-                    dst_path = os.path.join(dst_dir, rel_path)
-                    os.makedirs(os.path.dirname(dst_path), exist_ok=True)
-                    shutil.copy2(src_path, dst_path)
+                    rel_paths.append(rel_path)
+                    if not output.is_linked(rel_path, src_path):
+                        pending.append((rel_path, src_path))
+
+        counts = {"linked": 0, "cloned": 0, "copied": 0, "removed": 0}
+
+        with ThreadPoolExecutor(max_workers=self._app_config.copy_workers) as executor:
+            for method in executor.map(lambda job: output.link(*job), pending):
+                counts[method] = counts.get(method, 0) + 1
+
+        for rel_path in set(previous_files or []) - set(rel_paths):
+            try:
+                if output.remove(rel_path):
+                    counts["removed"] += 1
+            except OSError as e:
+                print(f"Unable to remove {rel_path}: {e}")
+
+        print(f"Extra assets : {len(rel_paths) - len(pending)} unchanged, "
+              + ", ".join(f"{count} {method}" for method, count in counts.items()))
+
+        return sorted(rel_paths)
+
+    def _list_images(self, asset_files: list[str], images_conf: Any | None) -> list[str]:
+        """Select the source images that get responsive derivatives.
+
+        Args:
+            asset_files (list[str]): Every file of the asset folder.
+            images_conf (Any | None): Optional 'images' configuration.
+
+        Returns:
+            list[str]: Paths of the source images.
+        """
+        if not images_conf:
+            return []
+
+        extensions = [e.lower() for e in images_conf.get("extensions", [".jpg", ".jpeg", ".png"])]
+        excludes = [os.path.normpath(os.path.join(self._app_config.asset_folder, e))
+                    for e in images_conf.get("exclude", [])]
+
+        return [p for p in asset_files
+                if os.path.splitext(p)[1].lower() in extensions
+                and not any(os.path.normpath(p).startswith(e + os.sep) for e in excludes)]
+
+    def _build_images(self, image_files: list[str], images_conf: Any,
+                      previous_files: list[str] | None = None) -> tuple[dict[str, Any], list[str]]:
+        """Generate responsive image derivatives and link them into the distribution folder.
+
+        Args:
+            image_files (list[str]): Paths of the source images.
+            images_conf (Any): The 'images' configuration.
+            previous_files (list[str] | None, optional): Derivatives written by the previous build,
+                relative to the distribution folder. Defaults to None.
+
+        Returns:
+            tuple[dict[str, Any], list[str]]: The srcset data of each image, keyed by its path
+                relative to the asset folder, and the derivatives written, relative to the
+                distribution folder.
+        """
+        if image_files and not ImageProcessor.is_available():
+            print("Pillow is not installed, responsive images are disabled")
+            image_files = []
+
+        processor = ImageProcessor(
+            cache_folder=self._app_config.image_cache_folder,
+            widths=images_conf.get("widths", [480, 960]),
+            formats=images_conf.get("formats", ["webp"]),
+            quality=images_conf.get("quality", 80),
+            workers=self._app_config.image_workers)
+
+        sources = {p: self._manifest.file_hash(p) for p in image_files}
+        results = processor.process(sources)
+
+        responsive_images = {}
+        rel_paths = []
+
+        for src_path, meta in results.items():
+            rel_src = os.path.relpath(src_path, self._app_config.asset_folder)
+            rel_dir, file_name = os.path.split(rel_src)
+            stem = os.path.splitext(file_name)[0]
+            fingerprint = sources[src_path][:self._app_config.fingerprint_length]
+            srcsets = {}
+
+            for fmt, derivatives in meta["derivatives"].items():
+                candidates = []
+                for derivative in derivatives:
+                    ext = os.path.splitext(derivative["file"])[1]
+                    rel_path = os.path.join(rel_dir, f"{stem}-{derivative['width']}w.{fingerprint}{ext}")
+                    if not self._output.is_linked(rel_path, derivative["path"]):
+                        self._output.link(rel_path, derivative["path"])
+                    rel_paths.append(rel_path)
+                    candidates.append(f"./{rel_path.replace(os.sep, '/')} {derivative['width']}w")
+                srcsets[fmt] = ", ".join(candidates)
+
+            responsive_images[rel_src.replace(os.sep, "/")] = {
+                "width": meta["width"],
+                "height": meta["height"],
+                "srcset": srcsets.pop(meta["format"], ""),
+                "sources": [{"type": FORMAT_MIME_TYPES[fmt], "srcset": srcset}
+                            for fmt, srcset in srcsets.items()],
+            }
+
+        for rel_path in set(previous_files or []) - set(rel_paths):
+            self._output.remove(rel_path)
+
+        print(f"Images : {len(responsive_images)} responsive image(s), {len(rel_paths)} derivative(s)")
+
+        return responsive_images, sorted(rel_paths)
 
     def _load_config(self) -> Any:
         """Load YAML configuration from the config file.
@@ -244,28 +1069,122 @@ class PageGenerator():
         Returns:
             Any: Parsed YAML configuration dictionary.
         """
-        with open(file=self._app_config.config_file, mode="r", encoding="utf-8") as file:
-            config = yaml.safe_load(stream=file)
-        return config
+        return self._yaml.load(path=self._app_config.config_file)
 
-    def _load_data(self) -> Any:
-        """Load YAML data from the data file.
+    def _load_data(self, data_file: str | None = None) -> Any:
+        """Load YAML data from a data file.
+
+        Args:
+            data_file (str | None, optional): Data file to load instead of the default one. Defaults to None.
 
         Returns:
             Any: Parsed YAML data dictionary.
         """
-        with open(file=self._app_config.data_file, mode="r", encoding="utf-8") as file:
-            data = yaml.safe_load(stream=file)
+        return self._yaml.load(path=data_file or self._app_config.data_file)
+
+    def _get_data(self, data_file: str, key: str) -> Any:
+        """Get the transformed data of a data file, reusing the previous result when its inputs are unchanged.
+
+        The result is reused when both the key and the string transforms are unchanged.
+
+        Args:
+            data_file (str): Data file to load.
+            key (str): Key of the data stage inputs.
+
+        Returns:
+            Any: Data with Markdown converted and style tags applied.
+        """
+        pipeline = self._transform_names
+        cached = self._data_cache.get(data_file)
+        if cached is not None and cached[:2] == (key, pipeline):
+            # Only a result of a previous build is worth reporting, not a reuse within this one
+            if data_file not in self._build_data:
+                print(f"Up to date : data {data_file}")
+                self._build_data.add(data_file)
+            return cached[2]
+
+        with self._profiler.stage("yaml load", detail=data_file):
+            data = self._load_data(data_file=data_file)
+
+        if self._app_config.debug:
+            print(data)
+
+        self._markdown.reset_stats()
+        with self._profiler.stage("data transform", detail=data_file):
+            transforms = [self._profiler.timed(t, getattr(t, "__name__", "transform").strip("_")
+                                               .removesuffix("_transform").replace("_", " "))
+                          for t in self._string_transforms]
+            data = self._transform_data(data=data, transforms=transforms)
+
+        if self._markdown.misses:
+            self._markdown.prune_disk_cache()
+
+        if self._app_config.debug:
+            print(data)
+            print(f"Markdown cache : {self._markdown.hits} hits, {self._markdown.misses} misses")
+
+        self._data_cache[data_file] = (key, pipeline, data)
+        self._build_data.add(data_file)
         return data
 
-    def _save_page(self, html: str) -> None:
-        """Save the generated HTML page to the distribution folder.
+    def _render_page(self, data_file: str, data_key: str, page_name: str,
+                     context: dict[str, Any], critical_conf: Any | None) -> None:
+        """Render one data file into a page of the output folder.
 
         Args:
-            html (str): HTML content to save.
+            data_file (str): Data file to render.
+            data_key (str): Key of the data file content.
+            page_name (str): Page path, relative to the output folder.
+            context (dict[str, Any]): Build values shared by every page (asset manifest, build date...).
+            critical_conf (Any | None): Optional 'critical' configuration.
         """
-        with open(file=self._app_config.abs_dist_page_path, mode="w", encoding="utf-8") as file:
-            file.write(html)
+        data = dict(self._get_data(data_file=data_file, key=data_key))
+        data.update(context)
+        with self._profiler.stage("render", detail=page_name):
+            self._render_template(data=data, path=page_name,
+                                  critical_conf=critical_conf)
+
+    def _render_pages(self, pending: list[tuple[str, str, str, str]],
+                      context: dict[str, Any], critical_conf: Any | None) -> None:
+        """Render the outdated pages, in a process pool when there are several.
+
+        Pages of an in-memory output are rendered in this process, which owns it.
+
+        Args:
+            pending (list[tuple[str, str, str, str]]): Data file, data key, page name and
+                page key of each page to render.
+            context (dict[str, Any]): Build values shared by every page.
+            critical_conf (Any | None): Optional 'critical' configuration.
+        """
+        if not pending:
+            return
+
+        if len(pending) == 1 or self.memory_output is not None:
+            for data_file, data_key, page_name, _ in pending:
+                self._render_page(data_file, data_key, page_name, context, critical_conf)
+            return
+
+        print(f"Pages : rendering {len(pending)} variant(s)")
+
+        with ProcessPoolExecutor(
+                max_workers=self._app_config.render_workers,
+                initializer=_init_variant_worker,
+                initargs=(self._app_config, self._output.root, self._user_transforms,
+                          context, critical_conf)) as executor:
+            futures = [executor.submit(_render_variant, data_file, data_key, page_name)
+                       for data_file, data_key, page_name, _ in pending]
+            for future in futures:
+                future.result()
+
+    def _write_text(self, path: str, text: str) -> None:
+        """Write a text file of the output folder.
+
+        Args:
+            path (str): Path of the file, relative to the output folder.
+            text (str): Content to write.
+        """
+        with self._output.open(path) as file:
+            file.write(text)
 
     def _save_sitemap(self, sitemap: str) -> None:
         """Save the rendered sitemap to the distribution folder.
@@ -273,10 +1192,291 @@ class PageGenerator():
         Args:
             sitemap (str): Sitemap content to save.
         """
-        with open(file=self._app_config.abs_dist_sitemap, mode="w", encoding="utf-8") as file:
-            file.write(sitemap)
+        self._write_text(path=self._app_config.sitemap, text=sitemap)
+
+    def _build_id(self, asset_manifest: dict[str, str]) -> str:
+        """Compute the build identifier of an asset manifest.
+
+        Args:
+            asset_manifest (dict[str, str]): Mapping of logical bundle paths to fingerprinted ones.
+
+        Returns:
+            str: The build identifier.
+        """
+        return hashlib.sha256(json.dumps(asset_manifest, sort_keys=True).encode(
+            "utf-8")).hexdigest()[:self._app_config.fingerprint_length]
+
+    def _build_shared_stages(self, config: Any, stages: set[str] | None = None) -> dict[str, Any]:
+        """Run the stages shared by every page: assets, extra assets and images.
+
+        Args:
+            config (Any): Parsed configuration.
+            stages (set[str] | None, optional): Stages to check, the others keep the result
+                of the previous build. Defaults to None, checking every stage.
+
+        Returns:
+            dict[str, Any]: Build values shared by every page (asset manifest, build date...).
+        """
+        manifest = self._manifest
+        assets_conf = config.get("assets")
+        asset_manifest = manifest.get_value("asset_manifest")
+        responsive_images = manifest.get_value("responsive_images")
+
+        run_assets = stages is None or "assets" in stages or asset_manifest is None
+        run_extra_assets = stages is None or "extra_assets" in stages
+        run_images = stages is None or "images" in stages or responsive_images is None
+
+        asset_files = []
+        if run_assets or run_extra_assets or run_images:
+            asset_files = self._list_files(self._app_config.abs_asset_folder_path)
+
+        # Assets
+        if run_assets:
+            bundle_files = [p for p in asset_files
+                            if os.path.splitext(p)[1] in [".css", ".js"]]
+            assets_key = manifest.digest(bundle_files, assets_conf,
+                                         self._app_config.css_file_name,
+                                         self._app_config.js_file_name,
+                                         self._app_config.fingerprint_length,
+                                         self._app_config.dev_server)
+            assets_outputs = [] if asset_manifest is None else [
+                self._app_config.asset_manifest] + list(asset_manifest.values())
+
+            if asset_manifest is not None and manifest.is_fresh("assets", assets_key, assets_outputs,
+                                                                         self._output.exists):
+                print("Up to date : assets")
+            else:
+                with self._profiler.stage("assets"):
+                    asset_manifest, bundle_sizes = self._build_assets(assets_conf)
+                manifest.set_value("asset_manifest", asset_manifest)
+                manifest.set_value("bundle_sizes", bundle_sizes)
+                manifest.record("assets", assets_key)
+
+        # Extra assets
+        if run_extra_assets:
+            extra_files = [p for p in asset_files
+                           if os.path.splitext(p)[1] not in [".css", ".js"]]
+            extra_key = manifest.digest(extra_files)
+            extra_outputs = [os.path.relpath(p, self._app_config.asset_folder)
+                             for p in extra_files]
+
+            if manifest.is_fresh("extra_assets", extra_key, extra_outputs, self._output.exists):
+                print("Up to date : extra assets")
+            else:
+                with self._profiler.stage("extra assets"):
+                    extra_assets = self._copy_extra_assets(
+                        self._app_config.asset_folder,
+                        previous_files=manifest.get_value("extra_assets"))
+                manifest.set_value("extra_assets", extra_assets)
+                manifest.record("extra_assets", extra_key)
+
+        # Responsive images
+        if run_images:
+            images_conf = config.get("images")
+            image_files = self._list_images(asset_files, images_conf)
+            image_derivatives = manifest.get_value("image_derivatives") or []
+            images_key = manifest.digest(image_files, images_conf,
+                                         self._app_config.fingerprint_length,
+                                         ImageProcessor.is_available())
+            if responsive_images is not None and manifest.is_fresh("images", images_key, image_derivatives,
+                                                                             self._output.exists):
+                print("Up to date : images")
+            else:
+                with self._profiler.stage("images"):
+                    responsive_images, image_derivatives = self._build_images(
+                        image_files, images_conf or {}, previous_files=image_derivatives)
+                manifest.set_value("responsive_images", responsive_images)
+                manifest.set_value("image_derivatives", image_derivatives)
+                manifest.record("images", images_key)
+
+        build_id = self._build_id(asset_manifest)
+
+        # Data
+        build_year = datetime.now().year
+        build_date = datetime.now().strftime("%Y-%m-%d")
+        return {
+            'build_id': build_id,
+            'build_date': build_date,
+            'build_year': build_year,
+            'asset_manifest': asset_manifest,
+            'responsive_images': responsive_images,
+            'hot_reload_script': self._hot_reload_script(),
+            'html': {
+                'css_file_name': self._app_config.css_file_name,
+                'js_file_name': self._app_config.js_file_name,
+                'css_file': asset_manifest.get(f"css/{self._app_config.css_file_name}.css"),
+                'js_file': asset_manifest.get(f"js/{self._app_config.js_file_name}.js")
+            }
+        }
+
+    def _relink_pages(self, page_names: list[str], previous: dict[str, str],
+                      asset_manifest: dict[str, str]) -> None:
+        """Point the rendered pages to new bundles without rendering them again.
+
+        The keys of the pages are left as they were, so the next build that
+        checks the pages renders them from their templates.
+
+        Args:
+            page_names (list[str]): Pages to update, relative to the output folder.
+            previous (dict[str, str]): Asset manifest the pages were rendered with.
+            asset_manifest (dict[str, str]): Current asset manifest.
+        """
+        replacements = {path: asset_manifest[name] for name, path in previous.items()
+                        if asset_manifest.get(name, path) != path}
+        if not replacements:
+            return
+
+        replacements[self._build_id(previous)] = self._build_id(asset_manifest)
+        pattern = re.compile("|".join(re.escape(path) for path in replacements))
+
+        for page_name in page_names:
+            if not self._output.exists(page_name):
+                continue
+            html = self._output.read(page_name).decode("utf-8")
+            self._write_text(path=page_name, text=pattern.sub(lambda m: replacements[m.group(0)], html))
+            print(f"Relinked : {page_name}")
 
-    def build_page(self) -> None:
+    def _check_cancelled(self, cancelled: Callable[[], bool] | None) -> None:
+        """Stop the build between two stages when it is cancelled.
+
+        Args:
+            cancelled (Callable[[], bool] | None): Check of the cancellation, or None.
+
+        Raises:
+            BuildCancelled: If the build is cancelled.
+        """
+        if cancelled is not None and cancelled():
+            raise BuildCancelled("Build cancelled")
+
+    def _build_stages(self, variants: dict[str, str], full: bool = False,
+                      stages: set[str] | None = None,
+                      cancelled: Callable[[], bool] | None = None) -> None:
+        """Run every build stage, writing to the current output folder.
+
+        Each stage is skipped when the content hashes of its inputs match the
+        ones recorded in the build manifest of the previous build.
+
+        Args:
+            variants (dict[str, str]): Mapping of data files to the pages they are rendered to.
+            full (bool, optional): Ignore the build manifest and run every stage. Defaults to False.
+            stages (set[str] | None, optional): Stages to check, the others keep the result
+                of the previous build. Defaults to None, checking every stage.
+            cancelled (Callable[[], bool] | None, optional): Checked between stages, the build
+                stops when it returns True. Defaults to None.
+
+        Raises:
+            BuildCancelled: If the build is cancelled.
+        """
+        manifest = self._manifest
+        self._build_data.clear()
+
+        if full or self._app_config.full_build:
+            manifest.reset()
+            self._data_cache.clear()
+            stages = None
+        elif self.memory_output is None:
+            with self._profiler.stage("manifest load"):
+                manifest.load()
+
+        previous_asset_manifest = manifest.get_value("asset_manifest")
+
+        with self._profiler.stage("config load"):
+            config = self._load_config()
+        context = self._build_shared_stages(config, stages=stages)
+        self._check_cancelled(cancelled)
+        asset_manifest = context['asset_manifest']
+        responsive_images = context['responsive_images']
+        build_year = context['build_year']
+        build_date = context['build_date']
+
+        # HTML pages
+        critical_conf = config.get("critical")
+
+        if stages is None or "pages" in stages or not manifest.get_value("pages"):
+            template_files = self._list_files(
+                self._app_config.abs_template_folder_path)
+            pending = []
+
+            for data_file, page_name in variants.items():
+                data_key = manifest.digest([data_file])
+                page_key = manifest.digest(template_files + [data_file],
+                                           asset_manifest, responsive_images, critical_conf, build_year,
+                                           self._transform_names,
+                                           self._app_config.dev_server,
+                                           self._app_config.server_host,
+                                           self._app_config.server_websocket_port)
+
+                if manifest.is_fresh(f"page:{page_name}", page_key, [page_name], self._output.exists):
+                    print(f"Up to date : {page_name}")
+                else:
+                    pending.append((data_file, data_key, page_name, page_key))
+
+            with self._profiler.stage("pages"):
+                self._render_pages(pending, context, critical_conf)
+
+            for _, _, page_name, page_key in pending:
+                manifest.record(f"page:{page_name}", page_key)
+
+            for page_name in set(manifest.get_value("pages") or []) - set(variants.values()):
+                if self._output.remove(page_name):
+                    print(f"Cleanup : page erased {page_name}")
+            manifest.set_value("pages", sorted(variants.values()))
+
+        elif previous_asset_manifest is not None:
+            with self._profiler.stage("relink"):
+                self._relink_pages(manifest.get_value("pages"), previous_asset_manifest, asset_manifest)
+
+        self._check_cancelled(cancelled)
+
+        # Sitemap
+        if stages is None or "sitemap" in stages:
+            sitemap_file = next(iter(variants))
+            sitemap_key = manifest.digest([self._app_config.abs_sitemap, sitemap_file],
+                                          build_date, self._transform_names)
+
+            if manifest.is_fresh("sitemap", sitemap_key, [self._app_config.sitemap], self._output.exists):
+                print("Up to date : sitemap")
+            else:
+                with self._profiler.stage("sitemap"):
+                    data = dict(self._get_data(data_file=sitemap_file,
+                                               key=manifest.digest([sitemap_file])))
+                    data.update(context)
+                    sitemap = self._render_site_map(data=data)
+                    with self._profiler.stage("write", detail=self._app_config.sitemap):
+                        self._save_sitemap(sitemap=sitemap)
+                manifest.record("sitemap", sitemap_key)
+
+        # Precompressed siblings
+        if self._app_config.precompress and not self._app_config.dev_server:
+            compressor = Compressor(extensions=self._app_config.compress_extensions,
+                                    workers=self._app_config.compress_workers)
+            digests = manifest.get_value("compressed") or {}
+            with self._profiler.stage("compression"):
+                written, up_to_date, removed = compressor.compress_tree(self._output.root, digests)
+            manifest.set_value("compressed", digests)
+            print(f"Compression : {written} written, {up_to_date} up to date, {removed} removed "
+                  f"({', '.join(compressor.encodings)})")
+
+        # An in-memory output keeps its manifest in memory between builds
+        if self.memory_output is None:
+            with self._profiler.stage("manifest save"):
+                manifest.save(path=os.path.join(self._output.root, self._app_config.build_manifest))
+
+        for logical_path, (src_size, out_size) in (manifest.get_value("bundle_sizes") or {}).items():
+            ratio = (1 - out_size / src_size) * 100 if src_size else 0
+            print(f"Bundle {logical_path} : {src_size / 1024:.1f} KB -> {out_size / 1024:.1f} KB (-{ratio:.0f}%)")
+
+    def _report_profile(self) -> None:
+        """Print the stage timings of the last build and save its trace, when profiling is enabled."""
+        if not self._profiler.enabled:
+            return
+
+        self._profiler.print_table()
+        self._profiler.save_trace(self._app_config.profile_trace_path)
+        self._profiler.reset()
+
+    def build_page(self, full: bool = False, variants: dict[str, str] | None = None,
+                   stages: set[str] | None = None, cancelled: Callable[[], bool] | None = None) -> None:
         """Build the entire CV page and related assets.
 
         This method:
@@ -285,44 +1485,143 @@ class PageGenerator():
         - Builds CSS and JS assets.
         - Renders HTML and sitemap templates.
         - Saves the final files to the distribution folder.
+
+        The build is written into a staging folder, pre-filled with hardlinks
+        to the previous output, which then atomically replaces the distribution
+        folder. Readers of the distribution folder never see a partial build.
+
+        Several data files (e.g. languages) can be rendered in one build: the
+        assets are built once and the pages are rendered in parallel. The
+        sitemap is rendered from the first data file.
+
+        Args:
+            full (bool, optional): Ignore the build manifest and run every stage. Defaults to False.
+            variants (dict[str, str] | None, optional): Mapping of data files to page names, written
+                at the root of the distribution folder. Defaults to AppConfig.variants, or the data
+                file rendered to the default page.
+            stages (set[str] | None, optional): Stages to check among "assets", "extra_assets",
+                "images", "pages" and "sitemap", e.g. to rebuild after a known change. The other
+                stages keep the result of the previous build, and pages are only relinked to the
+                new bundles. Defaults to None, checking every stage.
+            cancelled (Callable[[], bool] | None, optional): Checked between stages, the build
+                is dropped when it returns True, e.g. when newer changes make it stale. Defaults to None.
+
+        Raises:
+            ValueError: If a page name is not at the root of the distribution folder.
+            BuildCancelled: If the build is cancelled.
         """
-        config = self._load_config()
-        data = self._load_data()
+        variants = variants or self._app_config.variants or {
+            self._app_config.data_file: self._app_config.page_name}
 
-        build_id = datetime.now().strftime("%Y%m%d%H%M%S")
-        build_year = datetime.now().year
-        build_date = datetime.now().strftime("%Y-%m-%d")
+        for page_name in variants.values():
+            if os.path.dirname(os.path.normpath(page_name)):
+                raise ValueError(f"Page {page_name} must be at the root of the distribution folder")
 
-        data['build_id'] = build_id
-        data['build_date'] = build_date
-        data['build_year'] = build_year
+        with self._profiler.stage("build"):
+            with self._profiler.stage("staging prepare"):
+                self._staged_output.prepare()
+                self._output = self._staged_output
 
-        data['html'] = {
-            'css_file_name': self._app_config.css_file_name,
-            'js_file_name': self._app_config.js_file_name
-        }
+            # The manifest must keep describing the served output when the build is dropped
+            snapshot = self._manifest.snapshot()
 
-        if self._app_config.debug:
-            print(data)
+            try:
+                self._build_stages(variants=variants, full=full, stages=stages, cancelled=cancelled)
+            except Exception:
+                self._staged_output.abort()
+                self._manifest.restore(snapshot)
+                raise
+            finally:
+                self._output = None
 
-        data = self._convert_markdown(data=data)
-        data = self._apply_style_tags(data=data)
+            with self._profiler.stage("staging commit"):
+                self._staged_output.commit()
 
-        if self._app_config.debug:
-            print(data)
+        self._report_profile()
 
-        os.makedirs(self._app_config.dist_folder, exist_ok=True)
+        for page_name in variants.values():
+            print(f"CV built successfully : {os.path.join(self._app_config.dist_folder, page_name)}")
 
-        assets_conf = config.get("assets")
+    def build_batch(self, data_folder: str, full: bool = False) -> dict[str, str | None]:
+        """Render every YAML file of a folder into its own output folder.
 
-        self._build_assets(build_id, assets_conf)
+        The shared stages (assets, extra assets and images) run once into a
+        shared folder, whose files are hardlinked into every output folder.
+        Pages are rendered in a process pool whose workers each keep one page
+        generator, so templates are compiled once per worker. Results are
+        printed as soon as each file is done.
+
+        Each file 'name.yaml' is rendered to '<batch folder>/name/index.html'.
+        Folders of files that failed or no longer exist are removed.
+
+        Args:
+            data_folder (str): Folder containing the data files.
+            full (bool, optional): Ignore the build manifest of the shared folder. Defaults to False.
+
+        Returns:
+            dict[str, str | None]: Mapping of data files to their error message, or None on success.
+        """
+        batch_folder = self._app_config.batch_folder
+        shared_folder = os.path.join(batch_folder, ".shared")
+        manifest_path = os.path.join(shared_folder, self._app_config.build_manifest)
+        manifest = self._manifest
+
+        if full or self._app_config.full_build:
+            manifest.reset()
+        else:
+            manifest.load(path=manifest_path)
+
+        os.makedirs(shared_folder, exist_ok=True)
+        self._output = self._disk_output(shared_folder)
+        try:
+            with self._profiler.stage("config load"):
+                config = self._load_config()
+            context = self._build_shared_stages(config)
+            if self._app_config.precompress:
+                digests = manifest.get_value("compressed") or {}
+                Compressor(extensions=self._app_config.compress_extensions,
+                           workers=self._app_config.compress_workers).compress_tree(shared_folder, digests)
+                manifest.set_value("compressed", digests)
+            manifest.save(path=manifest_path)
+        finally:
+            self._output = None
+
+        shared_files = [os.path.relpath(p, shared_folder) for p in self._list_files(shared_folder)
+                        if os.path.basename(p) != self._app_config.build_manifest]
+        data_files = sorted(p for p in glob.glob(os.path.join(data_folder, "*"))
+                            if os.path.splitext(p)[1] in [".yaml", ".yml"])
+
+        print(f"Batch : rendering {len(data_files)} file(s) from {data_folder}")
+        results: dict[str, str | None] = {}
+
+        with self._profiler.stage("batch render"), ProcessPoolExecutor(
+                max_workers=self._app_config.render_workers,
+                initializer=_init_batch_worker,
+                initargs=(self._app_config, self._user_transforms, shared_folder,
+                          shared_files, context, config.get("critical"))) as executor:
+            futures = {
+                executor.submit(_render_batch_file, data_file, os.path.join(
+                    batch_folder, os.path.splitext(os.path.basename(data_file))[0])): data_file
+                for data_file in data_files
+            }
+            for future in as_completed(futures):
+                data_file = futures[future]
+                try:
+                    duration = future.result()
+                    results[data_file] = None
+                    print(f"[OK] {data_file} ({duration * 1000:.0f} ms)")
+                except Exception as e:
+                    results[data_file] = f"{type(e).__name__}: {e}"
+                    print(f"[FAILED] {data_file} : {results[data_file]}")
 
-        html_output = self._render_template(data=data)
-        html_output = self._add_hot_reload_script(html_output)
-        self._save_page(html=html_output)
+        names = {os.path.splitext(os.path.basename(data_file))[0] for data_file in data_files}
+        for entry in os.scandir(batch_folder):
+            if entry.is_dir() and not entry.name.startswith(".") and entry.name not in names:
+                shutil.rmtree(entry.path, ignore_errors=True)
+                print(f"Cleanup : batch folder erased {entry.name}")
 
-        sitemap = self._render_site_map(data=data)
-        self._save_sitemap(sitemap=sitemap)
+        failed = sum(1 for error in results.values() if error is not None)
+        print(f"Batch : {len(results) - failed} built, {failed} failed, output in {batch_folder}")
+        self._report_profile()
 
-        print(
-            f"CV built successfully : {self._app_config.abs_dist_page_path}")
+        return results
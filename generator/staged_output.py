@@ -0,0 +1,132 @@
+from datetime import datetime
+import os
+import shutil
+import uuid
+from generator.disk_output import DiskOutput
+
+
+class StagedOutput(DiskOutput):
+    """Atomic output folder made of immutable build directories.
+
+    Each build is written into a new staging directory, pre-filled with
+    hardlinks to the files of the current output. Once complete, the output
+    folder, which is a symlink, is switched to the staging directory with a
+    single atomic rename, so readers never see a half-written build.
+
+    The files of a staging directory are shared with the current build, so they
+    must be replaced (written to a temporary file, then renamed), never
+    rewritten in place, which the DiskOutput methods take care of. They write
+    to the staging directory during a build.
+    """
+
+    def __init__(self, output_folder: str, builds_folder: str, keep: int = 2,
+                 link_files: bool = True, verify_hash: bool = False) -> None:
+        """Initialize the staged output.
+
+        Args:
+            output_folder (str): Path of the output folder (symlink to the current build).
+            builds_folder (str): Folder holding the build directories.
+            keep (int, optional): Number of build directories kept after a swap. Defaults to 2.
+            link_files (bool, optional): Hardlink or reflink copied files when possible. Defaults to True.
+            verify_hash (bool, optional): Compare copied files by content hash rather than
+                by modification time. Defaults to False.
+        """
+        super().__init__(root=output_folder, link_files=link_files, verify_hash=verify_hash)
+        self._output_folder = output_folder
+        self._builds_folder = builds_folder
+        self._keep = keep
+        self._staging: str | None = None
+
+    @property
+    def root(self) -> str:
+        """Get the path of the folder written to.
+
+        Returns:
+            str: The staging directory during a build, the output folder otherwise.
+        """
+        return self._staging or self._output_folder
+
+    def prepare(self) -> str:
+        """Create a staging directory holding hardlinks to the current output.
+
+        Files of the staging directory must be replaced, not modified in place.
+
+        Returns:
+            str: Path of the staging directory.
+        """
+        os.makedirs(self._builds_folder, exist_ok=True)
+        build_name = f"{datetime.now().strftime('%Y%m%d%H%M%S')}-{uuid.uuid4().hex[:8]}"
+        self._staging = os.path.join(self._builds_folder, build_name)
+
+        if os.path.isdir(self._output_folder):
+            self._link_tree(self._output_folder, self._staging)
+        else:
+            os.makedirs(self._staging)
+
+        return self._staging
+
+    def _link_tree(self, src_dir: str, dst_dir: str) -> None:
+        """Recreate a folder tree with hardlinks, falling back to copies.
+
+        Args:
+            src_dir (str): Source folder.
+            dst_dir (str): Destination folder.
+        """
+        for root, _, files in os.walk(src_dir):
+            target_root = os.path.join(dst_dir, os.path.relpath(root, src_dir))
+            os.makedirs(target_root, exist_ok=True)
+            for file in files:
+                src_path = os.path.join(root, file)
+                dst_path = os.path.join(target_root, file)
+                try:
+                    os.link(src_path, dst_path)
+                except OSError:
+                    shutil.copy2(src_path, dst_path)
+
+    def commit(self) -> None:
+        """Switch the output folder to the staging directory."""
+        if self._staging is None:
+            return
+
+        parent = os.path.dirname(os.path.abspath(self._output_folder))
+        target = os.path.relpath(os.path.abspath(self._staging), parent)
+
+        if os.path.isdir(self._output_folder) and not os.path.islink(self._output_folder):
+            # Output folder created before staged builds: move it aside once
+            legacy = os.path.join(self._builds_folder, "legacy")
+            shutil.rmtree(legacy, ignore_errors=True)
+            os.replace(self._output_folder, legacy)
+
+        tmp_link = f"{self._output_folder}.{os.getpid()}.tmp"
+        try:
+            if os.path.lexists(tmp_link):
+                os.remove(tmp_link)
+            os.symlink(target, tmp_link, target_is_directory=True)
+            os.replace(tmp_link, self._output_folder)
+        except OSError:
+            # No symlink support: fall back to a rename, which is not atomic
+            if os.path.islink(self._output_folder):
+                os.remove(self._output_folder)
+            elif os.path.isdir(self._output_folder):
+                shutil.rmtree(self._output_folder)
+            os.replace(self._staging, self._output_folder)
+
+        self._staging = None
+        self._prune()
+
+    def abort(self) -> None:
+        """Remove the staging directory of a failed build."""
+        if self._staging is not None:
+            shutil.rmtree(self._staging, ignore_errors=True)
+            self._staging = None
+
+    def _prune(self) -> None:
+        """Remove old build directories, keeping the most recent ones."""
+        current = os.path.realpath(self._output_folder)
+        builds = sorted(
+            (os.path.join(self._builds_folder, d) for d in os.listdir(self._builds_folder)),
+            key=os.path.getmtime, reverse=True)
+
+        for path in builds[self._keep:]:
+            if os.path.realpath(path) != current:
+                shutil.rmtree(path, ignore_errors=True)
@@ -0,0 +1,114 @@
+import hashlib
+import os
+import pickle
+from typing import Any
+import yaml
+
+try:
+    from yaml import CSafeLoader as SafeLoader
+except ImportError:
+    from yaml import SafeLoader
+
+
+class YamlLoader():
+    """YAML file loader using libyaml when available, with a parsed-data cache.
+
+    Parsed documents are pickled on disk along with the hash of the file content
+    and the loader version, so unchanged files are never parsed twice. The cache
+    holds one entry per source file, replaced when the file changes.
+    """
+
+    def __init__(self, cache_folder: str | None = None) -> None:
+        """Initialize the loader.
+
+        Args:
+            cache_folder (str | None, optional): Folder of the parsed-data cache, disabled if None. Defaults to None.
+        """
+        self._cache_folder = cache_folder
+
+        if self._cache_folder:
+            os.makedirs(self._cache_folder, exist_ok=True)
+
+    @property
+    def loader_version(self) -> str:
+        """Get the identifier of the YAML loader implementation.
+
+        Returns:
+            str: PyYAML version and loader class name.
+        """
+        return f"{yaml.__version__}-{SafeLoader.__name__}-{pickle.HIGHEST_PROTOCOL}"
+
+    def _key(self, content: bytes) -> str:
+        """Compute the cache key of a YAML document.
+
+        Args:
+            content (bytes): Raw file content.
+
+        Returns:
+            str: SHA-256 hex digest of the loader version and file content.
+        """
+        h = hashlib.sha256(self.loader_version.encode("utf-8"))
+        h.update(b"\0")
+        h.update(content)
+        return h.hexdigest()
+
+    def _cache_path(self, path: str) -> str:
+        """Get the path of the cache entry of a YAML file.
+
+        Args:
+            path (str): Path of the YAML file.
+
+        Returns:
+            str: Path of the pickle file, named after a hash of the absolute source path.
+        """
+        name = hashlib.sha256(os.path.abspath(path).encode("utf-8")).hexdigest()
+        return os.path.join(self._cache_folder, f"{name}.pickle")
+
+    def parse(self, content: bytes) -> Any:
+        """Parse a YAML document without using the cache.
+
+        Args:
+            content (bytes): Raw UTF-8 YAML content.
+
+        Returns:
+            Any: Parsed YAML data.
+        """
+        return yaml.load(content.decode("utf-8"), Loader=SafeLoader)
+
+    def load(self, path: str) -> Any:
+        """Load a YAML file, reusing the cached parse when the content is unchanged.
+
+        Args:
+            path (str): Path of the YAML file.
+
+        Returns:
+            Any: Parsed YAML data.
+        """
+        with open(path, "rb") as file:
+            content = file.read()
+
+        if not self._cache_folder:
+            return self.parse(content)
+
+        cache_path = self._cache_path(path)
+        key = self._key(content)
+
+        try:
+            with open(cache_path, "rb") as file:
+                cached_key, data = pickle.load(file)
+            if cached_key == key:
+                return data
+        except (OSError, pickle.UnpicklingError, EOFError, TypeError, ValueError):
+            pass
+
+        data = self.parse(content)
+
+        tmp_path = f"{cache_path}.{os.getpid()}.tmp"
+        try:
+            with open(tmp_path, "wb") as file:
+                pickle.dump((key, data), file, protocol=pickle.HIGHEST_PROTOCOL)
+            os.replace(tmp_path, cache_path)
+        except (OSError, pickle.PicklingError) as e:
+            print(f"Unable to write YAML cache {cache_path}: {e}")
+
+        return data
@@ -0,0 +1,20 @@
+import os
+import shutil
+import pytest
+
+ROOT = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+
+
+@pytest.fixture
+def project(tmp_path, monkeypatch):
+    """Create a small project (templates, data, CSS and JS) and run the test from its folder."""
+    shutil.copytree(os.path.join(ROOT, "templates"), tmp_path / "templates")
+    shutil.copytree(os.path.join(ROOT, "assets", "css"), tmp_path / "assets" / "css")
+    shutil.copytree(os.path.join(ROOT, "assets", "js"), tmp_path / "assets" / "js")
+    shutil.copy(os.path.join(ROOT, "data.yaml"), tmp_path / "data.yaml")
+    (tmp_path / "config.yaml").write_text(
+        "assets:\n"
+        "  css: [bambo.css, style.css]\n"
+        "  js: [bambo.js, cv.js]\n")
+    monkeypatch.chdir(tmp_path)
+    return tmp_path
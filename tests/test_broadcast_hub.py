@@ -0,0 +1,47 @@
+import asyncio
+from websockets.exceptions import ConnectionClosedError
+from generator.broadcast_hub import BroadcastHub
+
+
+class FakeClient():
+
+    def __init__(self, name, delay=0.0, fail=False):
+        self.remote_address = name
+        self.delay = delay
+        self.fail = fail
+        self.messages = []
+        self.closed = False
+
+    async def send(self, message):
+        await asyncio.sleep(self.delay)
+        if self.fail:
+            raise ConnectionClosedError(None, None)
+        self.messages.append(message)
+
+    async def close(self):
+        self.closed = True
+
+
+def test_broadcast_hub_fans_out_and_drops_dead_clients():
+    hub = BroadcastHub(send_timeout=0.5)
+    clients = [FakeClient(f"client-{i}", delay=0.1) for i in range(20)]
+    dead = FakeClient("dead", fail=True)
+    slow = FakeClient("slow", delay=5)
+
+    async def scenario():
+        for client in clients + [dead, slow]:
+            hub.register(client)
+        start = asyncio.get_running_loop().time()
+        sent = await hub.broadcast("reload")
+        elapsed = asyncio.get_running_loop().time() - start
+        await asyncio.sleep(0)
+        return sent, elapsed
+
+    sent, elapsed = asyncio.run(scenario())
+
+    assert sent == 20
+    assert elapsed < 1.5
+    assert all(client.messages == ["reload"] for client in clients)
+    assert hub.client_count == 20
+    assert hub.dropped_count == 2
+    assert dead.closed and slow.closed
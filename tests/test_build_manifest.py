@@ -0,0 +1,33 @@
+from generator.build_manifest import BuildManifest
+
+
+def test_build_manifest_digest_follows_content(tmp_path):
+    source = tmp_path / "data.yaml"
+    source.write_text("name: A")
+    manifest = BuildManifest(path=str(tmp_path / "manifest.json"))
+
+    key = manifest.digest([str(source)], "extra")
+
+    assert manifest.digest([str(source)], "extra") == key
+    assert manifest.digest([str(source)], "other") != key
+
+    source.write_text("name: B")
+    assert manifest.digest([str(source)], "extra") != key
+
+
+def test_build_manifest_is_fresh(tmp_path):
+    output = tmp_path / "index.html"
+    output.write_text("<html></html>")
+    path = str(tmp_path / "manifest.json")
+
+    manifest = BuildManifest(path=path)
+    manifest.record("page", "key")
+    manifest.save()
+
+    manifest = BuildManifest(path=path)
+    manifest.load()
+
+    assert manifest.is_fresh("page", "key", [str(output)])
+    assert not manifest.is_fresh("page", "other key", [str(output)])
+    assert not manifest.is_fresh("page", "key", [str(tmp_path / "missing.html")])
+    assert not manifest.is_fresh("sitemap", "key", [])
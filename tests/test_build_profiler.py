@@ -0,0 +1,32 @@
+import json
+from generator.build_profiler import BuildProfiler
+
+
+def test_build_profiler_trace(tmp_path):
+
+    profiler = BuildProfiler(enabled=True)
+
+    with profiler.stage("build"):
+        with profiler.stage("render", detail="index.html"):
+            pass
+
+    path = tmp_path / "trace.json"
+    profiler.save_trace(str(path))
+
+    with open(path, encoding="utf-8") as file:
+        events = json.load(file)["traceEvents"]
+
+    assert [e["name"] for e in events] == ["render index.html", "build"]
+    assert all(e["ph"] == "X" for e in events)
+
+def test_build_profiler_disabled():
+
+    profiler = BuildProfiler()
+
+    with profiler.stage("build"):
+        pass
+
+    func = len
+
+    assert profiler.timed(func, "len") is func
+    assert profiler._events == []
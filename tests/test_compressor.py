@@ -0,0 +1,43 @@
+import gzip
+import os
+from generator.compressor import Compressor
+
+
+def test_compressor_rewrites_siblings_of_changed_content(tmp_path):
+    page = tmp_path / "index.html"
+    page.write_text("<html>v1</html>")
+    compressor = Compressor(extensions=[".html"])
+    count = len(compressor.encodings)
+
+    assert compressor.compress_tree(str(tmp_path)) == (count, 0, 0)
+    assert compressor.compress_tree(str(tmp_path)) == (0, count, 0)
+
+    # A new content with an older modification time, as left by cp -p or rsync -a
+    stat = os.stat(tmp_path / "index.html.gz")
+    page.write_text("<html>v2</html>")
+    os.utime(page, ns=(stat.st_atime_ns, stat.st_mtime_ns - 10**9))
+
+    assert compressor.compress_tree(str(tmp_path)) == (count, 0, 0)
+    assert gzip.decompress((tmp_path / "index.html.gz").read_bytes()) == b"<html>v2</html>"
+
+    page.unlink()
+    assert compressor.compress_tree(str(tmp_path)) == (0, 0, count)
+
+
+def test_compressor_trusts_recorded_digests(tmp_path):
+    page = tmp_path / "index.html"
+    page.write_text("<html>v1</html>")
+    compressor = Compressor(extensions=[".html"])
+    count = len(compressor.encodings)
+    digests = {}
+
+    assert compressor.compress_tree(str(tmp_path), digests) == (count, 0, 0)
+    assert list(digests) == ["index.html"]
+
+    # With a matching digest the siblings are not even read
+    (tmp_path / "index.html.gz").write_bytes(b"not gzip")
+    assert compressor.compress_tree(str(tmp_path), digests) == (0, count, 0)
+
+    page.write_text("<html>v2</html>")
+    assert compressor.compress_tree(str(tmp_path), digests) == (count, 0, 0)
+    assert gzip.decompress((tmp_path / "index.html.gz").read_bytes()) == b"<html>v2</html>"
@@ -1,3 +1,6 @@
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+import threading
+import time
 
 
 from generator.app_config import AppConfig
@@ -22,3 +25,53 @@ def test_dead_link_finder():
     dead_links = dlf.find_dead_links(html_text=html)
 
     assert len(dead_links) == 2
+
+
+class LinkHandler(BaseHTTPRequestHandler):
+
+    requests = []
+
+    def _answer(self):
+        LinkHandler.requests.append((self.command, self.path))
+        if self.path == "/busy" and LinkHandler.requests.count((self.command, self.path)) == 1:
+            self.send_response(429)
+            self.send_header("Retry-After", "0")
+        elif self.path == "/head-refused" and self.command == "HEAD":
+            self.send_response(405)
+        elif self.path == "/slow":
+            time.sleep(0.5)
+            self.send_response(200)
+        else:
+            self.send_response(404 if self.path == "/missing" else 200)
+        self.send_header("Content-Length", "0")
+        self.end_headers()
+
+    do_HEAD = _answer
+    do_GET = _answer
+
+    def log_message(self, format, *args):
+        pass
+
+
+def test_dead_link_finder_checks_links_concurrently():
+    httpd = ThreadingHTTPServer(("localhost", 0), LinkHandler)
+    threading.Thread(target=httpd.serve_forever, daemon=True).start()
+    base_url = f"http://localhost:{httpd.server_port}/"
+    html = "".join(f'<a href="{path}">link</a>' for path in
+                   ["/missing", "/busy", "/head-refused", "/slow", "/slow?2", "/slow?3", "/slow?4"])
+
+    app_config = AppConfig()
+    app_config.link_check_host_concurrency = 4
+    app_config.link_check_host_delay = 0
+    dlf = DeadLinkFinder(app_config=app_config)
+
+    start = time.perf_counter()
+    dead_links = dlf.find_dead_links(html_text=html, base_url=base_url)
+    elapsed = time.perf_counter() - start
+    httpd.shutdown()
+    httpd.server_close()
+
+    assert dead_links == [{"url": f"{base_url}missing", "status": 404, "error": "Not Found"}]
+    assert LinkHandler.requests.count(("HEAD", "/busy")) == 2
+    assert ("GET", "/head-refused") in LinkHandler.requests
+    assert elapsed < 1.5
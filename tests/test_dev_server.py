@@ -0,0 +1,136 @@
+from functools import partial
+from http.server import ThreadingHTTPServer
+import json
+import threading
+import time
+import urllib.error
+import urllib.request
+import pytest
+from generator.app_config import AppConfig
+from generator.dev_server import DevServer, MemoryRequestHandler, ResponseCache
+from generator.memory_output import MemoryOutput
+from generator.page_generator import BuildCancelled, PageGenerator
+
+
+@pytest.fixture
+def server():
+    output = MemoryOutput(root="dist")
+    output.write("index.html", b"<html>" + b"cv " * 1000 + b"</html>")
+    output.write("css/style.0123456789.css", b"body{}")
+    handler = partial(MemoryRequestHandler, memory_output=output,
+                      cache=ResponseCache(), fingerprint_length=10)
+    httpd = ThreadingHTTPServer(("localhost", 0), handler)
+    threading.Thread(target=httpd.serve_forever, daemon=True).start()
+    yield f"http://localhost:{httpd.server_port}"
+    httpd.shutdown()
+    httpd.server_close()
+
+
+def test_dev_request_handler_caching(server):
+    request = urllib.request.Request(f"{server}/", headers={"Accept-Encoding": "gzip"})
+    with urllib.request.urlopen(request) as response:
+        etag = response.headers["ETag"]
+        assert response.headers["Content-Encoding"] == "gzip"
+        assert response.headers["Cache-Control"] == "no-cache"
+
+    request.add_header("If-None-Match", etag)
+    with pytest.raises(urllib.error.HTTPError) as error:
+        urllib.request.urlopen(request)
+    assert error.value.code == 304
+
+    with urllib.request.urlopen(f"{server}/css/style.0123456789.css") as response:
+        assert response.read() == b"body{}"
+        assert "immutable" in response.headers["Cache-Control"]
+
+
+def test_response_cache_bounds_file_etags(tmp_path):
+    cache = ResponseCache(max_files=2)
+    page = tmp_path / "index.html"
+    page.write_text("v1")
+    first = cache.file_etag(str(page))
+
+    page.write_text("v2 ")
+    assert cache.file_etag(str(page)) != first
+    assert len(cache._file_etags) == 1
+
+    for name in ("a.css", "b.css"):
+        (tmp_path / name).write_text(name)
+        cache.file_etag(str(tmp_path / name))
+    assert list(cache._file_etags) == [str(tmp_path / "a.css"), str(tmp_path / "b.css")]
+
+
+def test_dev_server_classifies_changes():
+    server = DevServer(app_config=AppConfig(), page_generator=None)
+
+    assert server._classify("assets/css/style.css") == "css"
+    assert server._classify("assets/js/cv.js") == "js"
+    assert server._classify("assets/img/photo.JPG") == "image"
+    assert server._classify("assets/fonts/font.woff2") == "asset"
+    assert server._classify("templates/includes/head.html") == "template"
+    assert server._classify("data.yaml") == "data"
+    assert server._classify("config.yaml") == "config"
+
+
+def test_dev_server_watches_every_variant(project):
+    (project / "data.en.yaml").write_text("name: en")
+    app_config = AppConfig()
+    app_config.variants = {"data.yaml": "index.html", "data.en.yaml": "en.html"}
+    server = DevServer(app_config=app_config, page_generator=None)
+
+    assert "data.en.yaml" in server._watched_paths()
+    assert server._classify("data.en.yaml") == "data"
+
+
+def test_dev_server_swaps_served_stylesheet_after_cancelled_build(project):
+    app_config = AppConfig()
+    page_generator = PageGenerator(app_config=app_config)
+    server = DevServer(app_config=app_config, page_generator=page_generator)
+    page_generator.build_page()
+    style = project / "assets" / "css" / "style.css"
+
+    style.write_text(style.read_text() + "\n.cancelled{}\n")
+    with pytest.raises(BuildCancelled):
+        page_generator.build_page(stages={"assets"}, cancelled=lambda: True)
+
+    previous = dict(page_generator.asset_manifest)
+    served = json.loads((project / app_config.dist_folder / app_config.asset_manifest).read_text())
+    assert previous == served
+
+    style.write_text(style.read_text() + "\n.rebuilt{}\n")
+    page_generator.build_page(stages={"assets"})
+
+    message = server._reload_message({"assets/css/style.css": "css"}, previous)
+    assert message == {"type": "css", "swaps": [
+        {"old": served["css/style.css"], "href": page_generator.asset_manifest["css/style.css"]}]}
+
+
+class FakePageGenerator():
+
+    def __init__(self):
+        self.builds = []
+        self.asset_manifest = {}
+
+    def build_page(self, stages=None, cancelled=None):
+        self.builds.append(stages)
+
+
+def test_dev_server_coalesces_changes_into_one_build():
+    page_generator = FakePageGenerator()
+    server = DevServer(app_config=AppConfig(), page_generator=page_generator)
+
+    worker = threading.Thread(target=server._build_worker)
+    worker.start()
+    for i in range(10):
+        server._rebuild(f"assets/css/file{i}.css")
+    server._rebuild("dist/index.html")
+
+    for _ in range(50):
+        if page_generator.builds:
+            break
+        time.sleep(0.05)
+    server._changes.put(None)
+    worker.join()
+
+    assert page_generator.builds == [{"assets"}]
+    assert server.stats["events"] == 10
+    assert server.stats["builds"] == 1
@@ -0,0 +1,55 @@
+import hashlib
+import os
+import pytest
+from generator.disk_output import DiskOutput
+from generator.memory_output import MemoryOutput
+
+
+@pytest.fixture(params=["disk", "memory"])
+def output(request, tmp_path):
+    if request.param == "disk":
+        return DiskOutput(root=str(tmp_path / "dist"))
+    output = MemoryOutput(root="dist")
+    output.prepare()
+    return output
+
+
+def test_outputs_share_one_file_interface(output, tmp_path):
+    source = tmp_path / "photo.jpg"
+    source.write_bytes(b"jpeg")
+
+    with output.open("css/style.css.tmp") as file:
+        file.write("body{}")
+    with output.open("css/style.css.tmp", append=True) as file:
+        file.write("\n")
+    output.rename("css/style.css.tmp", "css/style.css")
+    output.write("index.html", b"<html></html>")
+
+    assert not output.exists("css/style.css.tmp")
+    assert output.read("css/style.css") == b"body{}\n"
+    assert output.size("css/style.css") == 7
+    assert output.digest("css/style.css").hexdigest() == hashlib.sha256(b"body{}\n").hexdigest()
+    assert output.glob("css/*.css") == ["css/style.css"]
+
+    assert not output.is_linked("img/photo.jpg", str(source))
+    assert output.link("img/photo.jpg", str(source)) in ("linked", "cloned", "copied", "referenced")
+    assert output.is_linked("img/photo.jpg", str(source))
+    assert output.read("img/photo.jpg") == b"jpeg"
+
+    assert output.remove("index.html")
+    assert not output.remove("index.html")
+    assert not output.exists("index.html")
+
+
+def test_disk_output_replaces_linked_files(tmp_path):
+    source = tmp_path / "page.html"
+    source.write_text("v1")
+    output = DiskOutput(root=str(tmp_path / "dist"))
+
+    output.link("index.html", str(source))
+    with output.open("index.html") as file:
+        file.write("v2")
+
+    assert source.read_text() == "v1"
+    assert output.read("index.html") == b"v2"
+    assert not [name for name in os.listdir(tmp_path / "dist") if name.endswith(".tmp")]
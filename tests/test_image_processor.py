@@ -0,0 +1,41 @@
+import os
+import pytest
+from generator.image_processor import ImageProcessor
+
+Image = pytest.importorskip("PIL.Image")
+
+
+@pytest.fixture
+def photo(tmp_path):
+    path = tmp_path / "photo.png"
+    Image.new("RGB", (600, 300), "teal").save(path)
+    return str(path)
+
+
+def test_image_processor_generates_derivatives_without_upscaling(photo, tmp_path):
+    processor = ImageProcessor(cache_folder=str(tmp_path / "cache"), widths=[200, 400, 800],
+                               formats=["webp"], workers=1)
+
+    meta = processor.process({photo: "hash"})[photo]
+
+    assert (meta["width"], meta["height"], meta["format"]) == (600, 300, "png")
+    assert sorted(meta["derivatives"]) == ["png", "webp"]
+    for fmt, derivatives in meta["derivatives"].items():
+        assert [d["width"] for d in derivatives] == [200, 400, 600]
+        with Image.open(derivatives[0]["path"]) as img:
+            assert img.size == (200, 100)
+            assert img.format.lower() == fmt
+
+
+def test_image_processor_reuses_derivatives_of_unchanged_sources(photo, tmp_path, capsys):
+    processor = ImageProcessor(cache_folder=str(tmp_path / "cache"), widths=[200],
+                               formats=["webp"], workers=1)
+    first = processor.process({photo: "hash"})
+    assert "generating derivatives" in capsys.readouterr().out
+
+    os.remove(photo)
+    assert processor.process({photo: "hash"}) == first
+    assert "generating derivatives" not in capsys.readouterr().out
+
+    assert processor.process({photo: "other"}) == {}
+    assert "Unable to process image" in capsys.readouterr().out
@@ -0,0 +1,12 @@
+from generator.markdown_converter import MarkdownConverter
+
+
+def test_markdown_converter_prunes_disk_cache(tmp_path):
+    converter = MarkdownConverter(cache_size=1, cache_folder=str(tmp_path), disk_cache_size=2)
+
+    for i in range(5):
+        converter.convert(f"**{i}**")
+
+    assert converter.prune_disk_cache() == 3
+    assert len(list(tmp_path.iterdir())) == 2
+    assert MarkdownConverter(cache_folder=str(tmp_path)).convert("**4**") == "<p><strong>4</strong></p>"
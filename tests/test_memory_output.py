@@ -0,0 +1,25 @@
+from generator.memory_output import MemoryOutput
+
+
+def test_memory_output_serves_committed_generation(tmp_path):
+    source = tmp_path / "photo.jpg"
+    source.write_bytes(b"jpeg")
+
+    output = MemoryOutput(root="dist")
+    output.prepare()
+    output.write("index.html", b"<html>v1</html>")
+    output.link("img/photo.jpg", str(source))
+
+    assert output.lookup("index.html") is None
+
+    output.commit()
+    output.prepare()
+    output.write("index.html", b"<html>v2</html>")
+
+    assert output.lookup("index.html") == b"<html>v1</html>"
+    assert output.read("img/photo.jpg") == b"jpeg"
+
+    output.commit()
+
+    assert output.lookup("index.html") == b"<html>v2</html>"
+    assert output.lookup("img/photo.jpg") == str(source)
@@ -0,0 +1,78 @@
+import json
+from generator.minifier import Minifier, SourceMap
+
+
+def minify_js(text):
+    return "\n".join(line for _, line in Minifier().minify_js(text))
+
+
+def minify_css(text):
+    output = ""
+    for _, fragment in Minifier().minify_css(text):
+        output += Minifier.css_separator(output, fragment) + fragment
+    return output
+
+
+def test_minify_js_keeps_literals_and_drops_comments():
+    source = """
+    // line comment
+    var a = "a  // b";  /* block
+    comment */ var b = 'c  /* d */';
+    var c = `x   ${ a }
+
+       y`;
+    """
+
+    assert minify_js(source) == (
+        "var a=\"a  // b\";\n"
+        "var b='c  /* d */';\n"
+        "var c=`x   ${ a }\n"
+        "\n"
+        "       y`;")
+
+
+def test_minify_js_tells_regex_from_division():
+    assert minify_js("x = i++ / 2 // half") == "x=i++ / 2"
+    assert minify_js("x = i-- / 2 /* half */") == "x=i-- / 2"
+    assert minify_js("/a  b/.test(s)") == "/a  b/.test(s)"
+    assert minify_js("y = (a)/2/b;") == "y=(a)/2/b;"
+    assert minify_js("function f() { return /x  'y/g.test(s); }") == "function f(){return /x  'y/g.test(s);}"
+    assert minify_js("s.replace(/[/]  '/, '')") == "s.replace(/[/]  '/,'')"
+
+
+def test_minify_js_keeps_line_breaks():
+    assert minify_js("a = b\n\n(c || d).e()\nreturn\nvalue") == "a=b\n(c || d).e()\nreturn\nvalue"
+
+
+def test_minify_css():
+    source = """
+    /* comment */
+    .a  .b :hover > p {
+        width : calc(100% - 2 * 10px);
+        margin: 0 auto;
+    }
+    a:hover { color: red; }
+    """
+
+    assert minify_css(source) == ".a .b :hover>p{width :calc(100% - 2 * 10px);margin:0 auto}a:hover{color:red}"
+
+
+def test_source_map_vlq():
+    assert [SourceMap._vlq(v) for v in (0, 1, -1, 15, 16, -16, 511, 512)] == \
+        ["A", "C", "D", "e", "gB", "hB", "+f", "ggB"]
+
+
+def test_source_map_mappings():
+    source_map = SourceMap(file="script.js")
+    first = source_map.add_source("a.js")
+    second = source_map.add_source("b.js", content="b")
+    source_map.add_mapping(0, first, 0)
+    source_map.new_line()
+    source_map.add_mapping(0, first, 2)
+    source_map.add_mapping(10, second, 0)
+
+    result = json.loads(source_map.to_json())
+
+    assert result["mappings"] == "AAAA;AAEA,UCFA"
+    assert result["sources"] == ["a.js", "b.js"]
+    assert result["sourcesContent"] == [None, "b"]
@@ -1,4 +1,9 @@
+import os
+import shutil
+import pytest
+from jinja2 import ModuleLoader
 from generator.app_config import AppConfig
+from generator.disk_output import DiskOutput
 from generator.page_generator import PageGenerator
 
 
@@ -19,8 +24,10 @@ def test_transform_braces_to_span_inside_html():
     assert res == r'<strong><span class="red">Python</span></strong>'
 
 def test_text_tranformation():
-
-    pg = PageGenerator(app_config=AppConfig())
+    app_config = AppConfig()
+    app_config.yaml_disk_cache = False
+    app_config.markdown_disk_cache = False
+    pg = PageGenerator(app_config=app_config)
 
     data = {
         'content': '- **{red:Python}**'
@@ -39,7 +46,10 @@ def test_text_tranformation():
 </ul>"""
 
 def test_apply_style_tags():
-    pg = PageGenerator(app_config=AppConfig())
+    app_config = AppConfig()
+    app_config.yaml_disk_cache = False
+    app_config.markdown_disk_cache = False
+    pg = PageGenerator(app_config=app_config)
 
     data = {
         'content': '- **{red:Python}**'
@@ -52,3 +62,203 @@ def test_apply_style_tags():
     assert res['content'] == """<ul>
 <li><strong><span class="red">Python</span></strong></li>
 </ul>"""
+
+def test_build_page_rejects_nested_variant_pages():
+    pg = PageGenerator(app_config=AppConfig())
+
+    with pytest.raises(ValueError):
+        pg.build_page(variants={'data.yaml': 'en/index.html'})
+
+
+def test_build_page_skips_up_to_date_stages(project, capsys):
+    app_config = AppConfig()
+    app_config.yaml_disk_cache = False
+    app_config.markdown_disk_cache = False
+
+    PageGenerator(app_config=app_config).build_page()
+    output = capsys.readouterr().out
+    assert "Up to date" not in output
+
+    pg = PageGenerator(app_config=app_config)
+    pg.build_page()
+    output = capsys.readouterr().out
+    assert "Up to date : assets" in output
+    assert "Up to date : index.html" in output
+    assert "Up to date : sitemap" in output
+
+    (project / "data.yaml").write_text((project / "data.yaml").read_text() + "\n# edited\n")
+    pg.build_page()
+    output = capsys.readouterr().out
+    assert "Up to date : assets" in output
+    assert "Up to date : index.html" not in output
+    assert "Up to date : data" not in output
+
+
+def test_bundle_fingerprints_follow_their_content(project):
+    pg = PageGenerator(app_config=AppConfig())
+    pg.build_page()
+    first = dict(pg.asset_manifest)
+
+    pg.build_page(full=True)
+    assert pg.asset_manifest == first
+
+    style = project / "assets" / "css" / "style.css"
+    style.write_text(style.read_text() + "\n.changed{}\n")
+    pg.build_page()
+
+    assert pg.asset_manifest["css/style.css"] != first["css/style.css"]
+    assert pg.asset_manifest["js/script.js"] == first["js/script.js"]
+    assert not (project / "dist" / first["css/style.css"]).exists()
+    assert (project / "dist" / pg.asset_manifest["css/style.css"]).exists()
+
+
+def test_inlined_css_urls_are_rebased(tmp_path):
+    (tmp_path / "css").mkdir()
+    (tmp_path / "css" / "style.0123456789.css").write_text(
+        ".a{background:url(../img/cat.gif)}.b{background:url('font.woff')}"
+        ".c{background:url(data:image/png;base64,AA==)}.d{background:url(/img/root.png)}")
+    pg = PageGenerator(app_config=AppConfig())
+    pg._output = DiskOutput(root=str(tmp_path))
+
+    html = pg._optimize_critical_path(
+        '<head><link rel="stylesheet" href="./css/style.0123456789.css"></head>',
+        {"inline_css": True}, {"css/style.css": "css/style.0123456789.css"})
+
+    assert html == ("<head><style>.a{background:url(img/cat.gif)}.b{background:url('css/font.woff')}"
+                    ".c{background:url(data:image/png;base64,AA==)}.d{background:url(/img/root.png)}</style></head>")
+
+
+def shout(text, key):
+    return text.replace("Python", "PYTHON")
+
+
+def test_build_page_renders_variants_in_parallel(project):
+    (project / "data.en.yaml").write_text((project / "data.yaml").read_text())
+    app_config = AppConfig()
+    pg = PageGenerator(app_config=app_config)
+    pg.register_string_transform(shout)
+
+    pg.build_page(variants={"data.yaml": "index.html", "data.en.yaml": "en.html"})
+
+    for page in ("index.html", "en.html"):
+        html = (project / "dist" / page).read_text()
+        assert "PYTHON" in html and "Python" not in html
+
+
+def test_build_page_renders_again_when_transforms_change(project, capsys):
+    app_config = AppConfig()
+    PageGenerator(app_config=app_config).build_page()
+
+    pg = PageGenerator(app_config=app_config)
+    pg.register_string_transform(shout)
+    capsys.readouterr()
+    pg.build_page()
+
+    assert "Up to date : index.html" not in capsys.readouterr().out
+    assert "PYTHON" in (project / "dist" / "index.html").read_text()
+
+
+def test_transformed_data_is_not_reused_across_pipelines(project, capsys):
+    pg = PageGenerator(app_config=AppConfig())
+    pg.build_page()
+
+    pg.register_string_transform(shout)
+    capsys.readouterr()
+    pg.build_page()
+
+    assert "Up to date : data" not in capsys.readouterr().out
+    assert "PYTHON" in (project / "dist" / "index.html").read_text()
+
+
+def test_compiled_templates_fall_back_to_sources_when_stale(project):
+    app_config = AppConfig()
+    pg = PageGenerator(app_config=app_config)
+    path = pg.compile_templates()
+
+    assert isinstance(pg._compiled_environment().loader, ModuleLoader)
+    pg.build_page()
+    assert "Copyright" in (project / "dist" / "index.html").read_text()
+
+    footer = project / "templates" / "includes" / "footer.html"
+    footer.write_text(footer.read_text().replace("Copyright", "Edited copyright"))
+    mtime = os.stat(path).st_mtime_ns + 10**9
+    os.utime(footer, ns=(mtime, mtime))
+
+    assert pg._compiled_environment() is None
+    pg.build_page()
+    assert "Edited copyright" in (project / "dist" / "index.html").read_text()
+
+    os.utime(footer, ns=(0, 0))
+    assert pg._compiled_environment() is not None
+    shutil.rmtree(path)
+    assert pg._compiled_environment() is None
+
+
+def test_list_images_skips_excluded_folders():
+    pg = PageGenerator(app_config=AppConfig())
+    asset_files = [os.path.join("assets", "img", name)
+                   for name in ("a.jpg", "B.PNG", "c.gif", os.path.join("logos", "d.png"))]
+
+    assert pg._list_images(asset_files, None) == []
+    assert pg._list_images(asset_files, {"exclude": ["img/logos"]}) == asset_files[:2]
+
+
+def test_build_images_renders_picture_srcset(project):
+    pytest.importorskip("PIL")
+    from PIL import Image
+
+    (project / "assets" / "img").mkdir()
+    Image.new("RGB", (600, 300), "teal").save(project / "assets" / "img" / "photo.png")
+    pg = PageGenerator(app_config=AppConfig())
+    pg._output = DiskOutput(root=str(project / "dist"))
+
+    images, derivatives = pg._build_images([os.path.join("assets", "img", "photo.png")],
+                                           {"widths": [300, 900], "formats": ["webp"]})
+
+    fingerprint = pg._manifest.file_hash(os.path.join("assets", "img", "photo.png"))[:10]
+    assert derivatives == sorted(os.path.join("img", f"photo-{w}w.{fingerprint}.{ext}")
+                                 for w in (300, 600) for ext in ("png", "webp"))
+    assert all((project / "dist" / p).exists() for p in derivatives)
+    srcset = f"./img/photo-300w.{fingerprint}.png 300w, ./img/photo-600w.{fingerprint}.png 600w"
+    webp_srcset = srcset.replace(".png", ".webp")
+    assert images == {"img/photo.png": {"width": 600, "height": 300, "srcset": srcset,
+                                        "sources": [{"type": "image/webp", "srcset": webp_srcset}]}}
+
+    template = pg._env.from_string('{% from "includes/picture.html" import picture with context %}'
+                                   '{{ picture("img/photo.png", "Photo") }}{{ picture("img/logo.svg", "Logo") }}')
+    html = template.render(responsive_images=images)
+
+    assert f'<source type="image/webp" srcset="{webp_srcset}" sizes="100vw" />' in html
+    assert f'<img src="./img/photo.png" srcset="{srcset}" sizes="100vw" alt="Photo"' in html
+    assert '<img src="./img/logo.svg" alt="Logo"' in html
+
+
+def test_build_batch(project):
+    (project / "team").mkdir()
+    (project / "team" / "alice.yaml").write_text((project / "data.yaml").read_text())
+    (project / "team" / "bob.yaml").write_text("bad: [")
+    (project / "batch" / "carol").mkdir(parents=True)
+
+    results = PageGenerator(app_config=AppConfig()).build_batch("team")
+
+    assert results["team/alice.yaml"] is None
+    assert results["team/bob.yaml"].startswith("ParserError")
+    assert (project / "batch" / "alice" / "index.html").exists()
+    assert (project / "batch" / "alice" / "css").is_dir()
+    assert not (project / "batch" / "bob").exists()
+    assert not (project / "batch" / "carol").exists()
+
+    alice = project / "batch" / "alice"
+    old_bundles = {p.name for p in alice.glob("css/*")}
+    (alice / "img").mkdir()
+    (alice / "img" / "removed.webp").write_bytes(b"webp")
+    style = project / "assets" / "css" / "style.css"
+    style.write_text(style.read_text() + "\n.changed{}\n")
+
+    PageGenerator(app_config=AppConfig()).build_batch("team")
+
+    new_bundles = {p.name for p in alice.glob("css/*")}
+    shared_bundles = {p.name for p in (project / "batch" / ".shared" / "css").glob("*")}
+    assert new_bundles and not new_bundles & old_bundles
+    assert new_bundles == shared_bundles
+    assert not (alice / "img").exists()
@@ -0,0 +1,87 @@
+import os
+from generator.staged_output import StagedOutput
+
+
+def build(output, files):
+    staging = output.prepare()
+    for name, content in files.items():
+        path = os.path.join(staging, name)
+        os.makedirs(os.path.dirname(path), exist_ok=True)
+        # Staged files are hardlinks to the current build: replace them
+        with open(f"{path}.tmp", "w") as file:
+            file.write(content)
+        os.replace(f"{path}.tmp", path)
+    return staging
+
+
+def test_staged_output_swaps_and_prunes_builds(tmp_path, monkeypatch):
+    monkeypatch.chdir(tmp_path)
+    output = StagedOutput(output_folder="dist", builds_folder=".builds", keep=2)
+
+    first = build(output, {"index.html": "v1", "css/style.css": "body{}"})
+    assert not os.path.exists("dist")
+    output.commit()
+
+    assert os.path.islink("dist")
+    assert os.readlink("dist") == os.path.join(".builds", os.path.basename(first))
+    assert open("dist/index.html").read() == "v1"
+
+    second = build(output, {"index.html": "v2"})
+    assert os.path.samefile(os.path.join(second, "css/style.css"), os.path.join(first, "css/style.css"))
+    assert open("dist/index.html").read() == "v1"
+    output.commit()
+
+    assert open("dist/index.html").read() == "v2"
+    assert open("dist/css/style.css").read() == "body{}"
+
+    build(output, {"index.html": "v3"})
+    output.commit()
+
+    assert len(os.listdir(".builds")) == 2
+    assert not os.path.exists(first)
+
+
+def test_staged_output_abort_keeps_current_build(tmp_path, monkeypatch):
+    monkeypatch.chdir(tmp_path)
+    output = StagedOutput(output_folder="dist", builds_folder=".builds")
+    build(output, {"index.html": "v1"})
+    output.commit()
+
+    staging = build(output, {"index.html": "broken"})
+    output.abort()
+
+    assert not os.path.exists(staging)
+    assert open("dist/index.html").read() == "v1"
+
+
+def test_staged_output_moves_legacy_folder_aside(tmp_path, monkeypatch):
+    monkeypatch.chdir(tmp_path)
+    os.makedirs("dist")
+    with open("dist/index.html", "w") as file:
+        file.write("legacy")
+
+    output = StagedOutput(output_folder="dist", builds_folder=".builds")
+    staging = build(output, {})
+    assert open(os.path.join(staging, "index.html")).read() == "legacy"
+    output.commit()
+
+    assert os.path.islink("dist")
+    assert open(".builds/legacy/index.html").read() == "legacy"
+
+
+def test_staged_output_without_symlinks(tmp_path, monkeypatch):
+    monkeypatch.chdir(tmp_path)
+
+    def symlink(*args, **kwargs):
+        raise OSError("symlinks are not supported")
+
+    monkeypatch.setattr(os, "symlink", symlink)
+    output = StagedOutput(output_folder="dist", builds_folder=".builds")
+
+    for version in ("v1", "v2"):
+        build(output, {"index.html": version})
+        output.commit()
+
+        assert os.path.isdir("dist") and not os.path.islink("dist")
+        assert open("dist/index.html").read() == version
+        assert not [name for name in os.listdir(".") if name.endswith(".tmp")]
@@ -0,0 +1,29 @@
+import os
+import subprocess
+import sys
+
+ROOT = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+
+COMMAND_DEPENDENCIES = {"bs4", "requests", "watchdog", "websockets", "ftplib"}
+
+
+def imported_modules(*args: str) -> set[str]:
+    """Run Python with -X importtime and get the modules imported."""
+    result = subprocess.run([sys.executable, "-X", "importtime", *args],
+                            cwd=ROOT, capture_output=True, text=True, check=True)
+    return {line.split("|")[-1].strip() for line in result.stderr.splitlines()
+            if line.startswith("import time:")}
+
+
+def test_version_imports_no_command():
+
+    modules = imported_modules("-m", "generator", "--version")
+
+    assert "generator.app" in modules
+    assert not modules & (COMMAND_DEPENDENCIES | {"generator.page_generator", "jinja2", "markdown"})
+
+def test_build_imports_only_page_generator():
+
+    modules = imported_modules("-c", "import generator.app, generator.page_generator")
+
+    assert not modules & COMMAND_DEPENDENCIES
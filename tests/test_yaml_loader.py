@@ -0,0 +1,14 @@
+from generator.yaml_loader import YamlLoader
+
+
+def test_yaml_loader_keeps_one_cache_entry_per_file(tmp_path):
+    cache = tmp_path / "cache"
+    source = tmp_path / "data.yaml"
+    loader = YamlLoader(cache_folder=str(cache))
+
+    for i in range(3):
+        source.write_text(f"revision: {i}")
+        assert loader.load(str(source)) == {"revision": i}
+
+    assert len(list(cache.iterdir())) == 1
+    assert YamlLoader(cache_folder=str(cache)).load(str(source)) == {"revision": 2}